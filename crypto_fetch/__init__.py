@@ -0,0 +1,14 @@
+from crypto_fetch.client import Client, Conversion, HoldingValue, PortfolioValuation, Quote
+from crypto_fetch.exceptions import APIError, CommandError, ConfigError, CryptoFetchError
+
+__all__ = [
+    "Client",
+    "Conversion",
+    "HoldingValue",
+    "PortfolioValuation",
+    "Quote",
+    "APIError",
+    "CommandError",
+    "ConfigError",
+    "CryptoFetchError",
+]
@@ -0,0 +1,122 @@
+import bisect
+from dataclasses import dataclass
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from crypto_fetch.alerts.rules import AlertRule
+from crypto_fetch.constants import CF_LOGGER
+
+logger = logging.getLogger(CF_LOGGER)
+
+IndexKey = Tuple[str, str, str]
+
+
+@dataclass
+class AlertEvent:
+    """A rule whose threshold was crossed by a quote update."""
+
+    rule: AlertRule
+    value: float
+    previous: Optional[float]
+    timestamp: float
+
+
+class _ThresholdIndex:
+    """Rules for a single (ticker, field, currency), kept sorted by threshold per operator."""
+
+    def __init__(self, rules: List[AlertRule]):
+        self._thresholds: Dict[str, List[float]] = {}
+        self._rules: Dict[str, List[AlertRule]] = {}
+        for operator in (">", ">=", "<", "<="):
+            op_rules = sorted((r for r in rules if r.operator == operator), key=lambda r: r.threshold)
+            self._rules[operator] = op_rules
+            self._thresholds[operator] = [r.threshold for r in op_rules]
+
+    def crossed(self, previous: Optional[float], value: float) -> List[AlertRule]:
+        """
+        Gets the rules whose condition became true moving from `previous` to `value`.
+        With no previous value, every rule whose condition currently holds is returned.
+
+        :param previous: The previous value, if any.
+        :param value: The new value.
+        :return: The crossed rules.
+        """
+        low = float("-inf") if previous is None else previous
+        high = float("inf") if previous is None else previous
+        crossed: List[AlertRule] = []
+
+        # '>' t fires for low <= t < value, '>=' t fires for low < t <= value
+        if value > low:
+            gt = self._thresholds[">"]
+            crossed += self._rules[">"][bisect.bisect_left(gt, low):bisect.bisect_left(gt, value)]
+            ge = self._thresholds[">="]
+            lo = 0 if previous is None else bisect.bisect_right(ge, low)
+            crossed += self._rules[">="][lo:bisect.bisect_right(ge, value)]
+
+        # '<' t fires for value < t <= high, '<=' t fires for value <= t < high
+        if value < high:
+            lt = self._thresholds["<"]
+            crossed += self._rules["<"][bisect.bisect_right(lt, value):bisect.bisect_right(lt, high)]
+            le = self._thresholds["<="]
+            hi = len(le) if previous is None else bisect.bisect_left(le, high)
+            crossed += self._rules["<="][bisect.bisect_left(le, value):hi]
+
+        return crossed
+
+
+class AlertEngine:
+    """
+    Evaluates threshold rules against quote updates. Rules are indexed per (ticker, field, currency)
+    in sorted threshold lists, so each update only touches the rules whose threshold lies between the
+    previous and the new value: O(log n + k) per update.
+    """
+
+    def __init__(self, rules: List[AlertRule]):
+        """
+        :param rules: The alert rules.
+        """
+        grouped: Dict[IndexKey, List[AlertRule]] = {}
+        for rule in rules:
+            grouped.setdefault((rule.ticker, rule.field, rule.currency), []).append(rule)
+
+        self._index: Dict[IndexKey, _ThresholdIndex] = {key: _ThresholdIndex(r) for key, r in grouped.items()}
+        self._fields: Dict[Tuple[str, str], List[str]] = {}
+        for ticker, field, currency in grouped:
+            self._fields.setdefault((ticker, currency), []).append(field)
+        self._last_values: Dict[IndexKey, float] = {}
+
+    @property
+    def watched(self) -> Dict[str, List[str]]:
+        """Map of currency -> tickers that have at least one rule."""
+        watched: Dict[str, List[str]] = {}
+        for ticker, currency in self._fields:
+            watched.setdefault(currency, []).append(ticker)
+        return watched
+
+    def update(self, data: Dict[str, Dict[str, float]], currency_code: str) -> List[AlertEvent]:
+        """
+        Applies a batch of quotes and returns the alerts they triggered.
+
+        :param data: Map of ticker -> parsed quote fields.
+        :param currency_code: The fiat currency of the quotes.
+        :return: The triggered alerts.
+        """
+        currency_code = currency_code.upper()
+        now = time.time()
+        events: List[AlertEvent] = []
+
+        for ticker, quote in data.items():
+            for field in self._fields.get((ticker, currency_code), ()):
+                if field not in quote:
+                    continue
+                key = (ticker, field, currency_code)
+                value = quote[field]
+                previous = self._last_values.get(key)
+                self._last_values[key] = value
+                if previous == value:
+                    continue
+                events += [AlertEvent(rule, value, previous, now) for rule in self._index[key].crossed(previous, value)]
+
+        logger.debug("Alert update for %s quote(s) in '%s' triggered %s alert(s)", len(data), currency_code, len(events))
+        return events
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import re
+from typing import List
+
+from crypto_fetch.constants import ALERT_FIELDS, ALERT_OPERATORS, CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+# TICKER [FIELD] OP VALUE [CURRENCY], e.g. 'BTC < 50k EUR' or 'ETH 24h_change > 8%'
+_RULE_PATTERN = re.compile(
+    r"^(?P<ticker>[A-Za-z0-9]+)\s+(?:(?P<field>[A-Za-z0-9_]+)\s*)?(?P<op><=|>=|<|>)\s*"
+    r"(?P<value>-?[0-9]*\.?[0-9]+(?:e[+-]?[0-9]+)?)(?P<suffix>[kKmMbBtT%]?)(?:\s+(?P<currency>[A-Za-z]{3}))?$"
+)
+_SUFFIX_MULTIPLIERS = {"": 1.0, "%": 1.0, "k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """A single threshold alert rule."""
+
+    rule_id: int
+    ticker: str
+    field: str
+    operator: str
+    threshold: float
+    currency: str
+    text: str
+
+
+def parse_rule(text: str, rule_id: int, default_currency: str) -> AlertRule:
+    """
+    Parses a single alert rule.
+
+    :param text: The rule text, e.g. 'BTC < 50k EUR' or 'ETH 24h_change > 8%'.
+    :param rule_id: The id to give the rule.
+    :param default_currency: The currency to use if the rule does not specify one.
+    :return: The parsed rule.
+    :raises CommandError: If the rule is invalid.
+    """
+    match = _RULE_PATTERN.match(text.strip())
+    if not match:
+        raise CommandError(f"Invalid alert rule: '{text}'. Expected 'TICKER [FIELD] <|<=|>|>= VALUE [CURRENCY]'")
+
+    field = (match.group("field") or "price").lower()
+    if field not in ALERT_FIELDS:
+        raise CommandError(f"Invalid alert field '{field}' in rule '{text}'. Must be one of: {', '.join(ALERT_FIELDS)}")
+
+    operator = match.group("op")
+    if operator not in ALERT_OPERATORS:
+        raise CommandError(f"Invalid alert operator '{operator}' in rule '{text}'")
+
+    threshold = float(match.group("value")) * _SUFFIX_MULTIPLIERS[match.group("suffix").lower()]
+    currency = (match.group("currency") or default_currency).upper()
+    return AlertRule(rule_id, match.group("ticker").upper(), field, operator, threshold, currency, text.strip())
+
+
+def load_rules(path: Path, default_currency: str) -> List[AlertRule]:
+    """
+    Loads alert rules from a file, one rule per line. Blank lines and '#' comments are skipped.
+
+    :param path: Path to the rules file.
+    :param default_currency: The currency to use for rules that do not specify one.
+    :return: The parsed rules.
+    :raises CommandError: If the file is missing, empty or contains an invalid rule.
+    """
+    if not path.exists():
+        raise CommandError(f"Supplied alert rules file not found: '{path}'")
+
+    rules: List[AlertRule] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, start=1):
+            text = line.split("#", 1)[0].strip()
+            if not text:
+                continue
+            rules.append(parse_rule(text, line_num, default_currency))
+
+    if not rules:
+        raise CommandError(f"Alert rules file is empty: '{path}'")
+
+    logger.debug("Loaded %s alert rule(s) from '%s'", len(rules), path)
+    return rules
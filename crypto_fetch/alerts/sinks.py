@@ -0,0 +1,105 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+import requests  # type: ignore
+
+from crypto_fetch.alerts.engine import AlertEvent
+from crypto_fetch.api.formatter import format_alert_output, print_output
+from crypto_fetch.config.config import get_default_api_timeout
+from crypto_fetch.constants import ALERT_SINK_FILE, ALERT_SINK_STDOUT, ALERT_SINK_WEBHOOK, CF_LOGGER, DATE_TIME_FORMAT
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class AlertSink(ABC):
+    """Base class for alert destinations."""
+
+    @abstractmethod
+    def send(self, events: List[AlertEvent]) -> None:
+        """
+        Sends triggered alerts to the sink.
+
+        :param events: The triggered alerts.
+        """
+        pass
+
+
+class StdoutSink(AlertSink):
+    """Prints alerts to the console."""
+
+    def send(self, events: List[AlertEvent]) -> None:
+        for event in events:
+            print_output(format_alert_output(event))
+
+
+class FileSink(AlertSink):
+    """Appends alerts to a file as JSON lines."""
+
+    def __init__(self, path: Path):
+        """
+        :param path: The file to append alerts to.
+        """
+        self.path = path
+
+    def send(self, events: List[AlertEvent]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(_event_payload(event)) + "\n")
+
+
+class WebhookSink(AlertSink):
+    """POSTs alerts as a JSON batch to a webhook URL."""
+
+    def __init__(self, url: str):
+        """
+        :param url: The webhook URL.
+        """
+        self.url = url
+
+    def send(self, events: List[AlertEvent]) -> None:
+        try:
+            response = requests.post(self.url, json={"alerts": [_event_payload(e) for e in events]}, timeout=get_default_api_timeout())
+            if not response.ok:
+                logger.warning("Alert webhook returned status %s", response.status_code)
+        except requests.RequestException as ex:
+            logger.warning("Failed to send alerts to webhook '%s': %s", self.url, ex)
+
+
+def create_sink(spec: str) -> AlertSink:
+    """
+    Creates an alert sink from its spec: 'stdout', 'file:<path>' or 'webhook:<url>'.
+
+    :param spec: The sink spec.
+    :return: The alert sink.
+    :raises CommandError: If the spec is invalid.
+    """
+    kind, _, target = spec.partition(":")
+    kind = kind.lower()
+    if kind == ALERT_SINK_STDOUT:
+        return StdoutSink()
+    if kind == ALERT_SINK_FILE and target:
+        return FileSink(Path(target).expanduser())
+    if kind == ALERT_SINK_WEBHOOK and target:
+        return WebhookSink(target)
+    raise CommandError(f"Invalid alert sink: '{spec}'. Use 'stdout', 'file:<path>' or 'webhook:<url>'")
+
+
+def _event_payload(event: AlertEvent) -> Dict[str, Any]:
+    return {
+        "rule_id": event.rule.rule_id,
+        "rule": event.rule.text,
+        "ticker": event.rule.ticker,
+        "field": event.rule.field,
+        "operator": event.rule.operator,
+        "threshold": event.rule.threshold,
+        "currency": event.rule.currency,
+        "value": event.value,
+        "previous": event.previous,
+        "timestamp": datetime.fromtimestamp(event.timestamp).strftime(DATE_TIME_FORMAT),
+    }
@@ -1,13 +1,30 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any, Dict, Generic, TypeVar
-
-import requests  # type: ignore
-
-from crypto_fetch.config.config import get_api_key, get_default_api_timeout
-from crypto_fetch.constants import CF_LOGGER
-from crypto_fetch.exceptions import APIError
+import threading
+import time
+from typing import Any, Deque, Dict, Generic, Iterator, List, NamedTuple, Optional, TypeVar
+from urllib.parse import urlencode
+
+from crypto_fetch.api.key_pool import KeyPool, mask_key
+from crypto_fetch.api.quote_cache import CachedQuote, CachedResponse, QuoteCache
+from crypto_fetch.api.transport import ACCEPT_ENCODING, HTTPResponse, create_transport
+from crypto_fetch.api.usage_ledger import Reservation, UsageLedger
+from crypto_fetch.config.config import get_api_keys, get_default_api_timeout
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    CONFIG_DEFAULTS_HTTP_BACKEND,
+    HISTORY_RESOLUTION,
+    MARKET_MAX_PAGE_WORKERS,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    USAGE_BUDGET_SOFT_LIMIT,
+)
+from crypto_fetch.exceptions import APIError, BudgetExceededError
+from crypto_fetch.history.price_series import PricePoint, resample
+from crypto_fetch.history.series_cache import PriceSeriesCache
 
 T = TypeVar('T')
 logger = logging.getLogger(CF_LOGGER)
@@ -20,16 +37,62 @@ class APIConfig:
     name: str
     base_url: str
     price_endpoint: str
+    history_endpoint: str = ""
+    fx_endpoint: str = ""
+    listings_endpoint: str = ""
+    api_keys: List[str] = field(default_factory=list, repr=False)
+    timeout: Optional[int] = None
+    http_backend: str = CONFIG_DEFAULTS_HTTP_BACKEND
+    daily_credit_budget: Optional[int] = None
+    monthly_credit_budget: Optional[int] = None
+    key_rate_limit: Optional[int] = None
+
+
+class MarketEntry(NamedTuple):
+    """A single row of a market listing."""
+
+    rank: int
+    ticker: str
+    name: str
+    quote: Dict[str, float]
 
 
 class BaseAPIClient(ABC, Generic[T]):
     """Base class for API clients."""
 
-    def __init__(self, config: APIConfig):
+    def __init__(self, config: APIConfig, history_cache: Optional[PriceSeriesCache] = None, quote_cache: Optional[QuoteCache] = None,
+                 usage_ledger: Optional[UsageLedger] = None):
         """
         :param config: The API config.
+        :param history_cache: The price history cache (defaults to the on-disk cache).
+        :param quote_cache: The store of last fetched quotes (defaults to the on-disk cache).
+        :param usage_ledger: The ledger API calls and credits are recorded in (defaults to the on-disk ledger).
         """
         self.config = config
+        self.history_cache = history_cache or PriceSeriesCache()
+        self.quote_cache = quote_cache or QuoteCache()
+        self.usage_ledger = usage_ledger or UsageLedger()
+        self._last_request_credits = 1
+        # When set, quotes up to this many seconds old are served from the quote cache
+        self.max_stale: Optional[int] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        # One transport per client so connections are reused (or, over HTTP/2, shared) across requests
+        self.transport = create_transport(config.http_backend)
+        # Responses to price and FX requests with ETag/Last-Modified validators, by request, so repeat polls
+        # can be revalidated (least recently used last dropped first, see RESPONSE_CACHE_MAX_ENTRIES).
+        # None records that the quote cache has no response for the request, so it is not asked again
+        self._responses: "OrderedDict[str, Optional[CachedResponse]]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+        # Built (and its keys validated) on the first request
+        self._key_pool: Optional[KeyPool] = None
+        self._key_pool_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the client's HTTP connections (once any background quote refresh completes) and writes its recorded API usage."""
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+        self.transport.close()
+        self.usage_ledger.flush()
 
     @abstractmethod
     def fetch_single_price_data(self, ticker: str, currency_code: str) -> float:
@@ -44,10 +107,49 @@ class BaseAPIClient(ABC, Generic[T]):
         """
         pass
 
-    @abstractmethod
     def fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
         """
-        Fetches the price data for multiple cryptocurrencies.
+        Fetches the price data for multiple cryptocurrencies. Fetched quotes are persisted in the quote cache.
+
+        If max_stale is set, quotes are served from the quote cache when every ticker has one at most
+        max_stale seconds old (refreshing them in the background), and also when the API request fails.
+        Cached quotes of any age are served when the request would exceed the provider's credit budget.
+        Served quotes carry an 'age' field with their age in seconds.
+
+        :param tickers: The list of cryptocurrency tickers as a str.
+        :param currency_code: The code of the fiat currency to fetch the data in.
+
+        :return: A formatted dict containing the price data.
+        :raises APIError: If an error occurs fetching the price data and no cached quotes can be served.
+        """
+        currency_code = currency_code.upper()
+        ticker_list = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+
+        if self.max_stale is not None:
+            cached = self.quote_cache.get(self.config.name, currency_code, ticker_list, self.max_stale)
+            if ticker_list and len(cached) == len(ticker_list):
+                self._refresh_in_background(tickers, currency_code)
+                return self._serve_cached(cached)
+
+        try:
+            data = self._fetch_multiple_price_data(tickers, currency_code)
+        except APIError as ex:
+            over_budget = isinstance(ex, BudgetExceededError)
+            if self.max_stale is None and not over_budget:
+                raise
+            cached = self.quote_cache.get(self.config.name, currency_code, ticker_list, None if over_budget else self.max_stale)
+            if not cached:
+                raise
+            logger.warning("Request to %s failed: %s", self.config.name, ex)
+            return self._serve_cached(cached)
+
+        self.quote_cache.put(self.config.name, currency_code, data)
+        return data
+
+    @abstractmethod
+    def _fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
+        """
+        Fetches the price data for multiple cryptocurrencies from the API, bypassing the quote cache.
 
         :param tickers: The list of cryptocurrency tickers as a str.
         :param currency_code: The code of the fiat currency to fetch the data in.
@@ -57,6 +159,158 @@ class BaseAPIClient(ABC, Generic[T]):
         """
         pass
 
+    def _serve_cached(self, cached: Dict[str, CachedQuote]) -> Dict[str, Dict[str, float]]:
+        """
+        Converts cached quotes into price data marked with their age.
+
+        :param cached: Map of ticker -> (fetched at unix timestamp, quote).
+        :return: The price data, each quote with an added 'age' field in seconds.
+        """
+        now = int(time.time())
+        data = {ticker: {**quote, "age": float(now - fetched_at)} for ticker, (fetched_at, quote) in cached.items()}
+        oldest = max(quote["age"] for quote in data.values())
+        logger.warning("Serving %s cached quote(s) from %s, up to %ss old", len(data), self.config.name, int(oldest))
+        return data
+
+    def _refresh_in_background(self, tickers: str, currency_code: str) -> None:
+        """
+        Refreshes cached quotes on a background thread. The thread is not a daemon, so a refresh
+        started by a short-lived command still completes after the command has printed its output.
+
+        :param tickers: The list of cryptocurrency tickers as a str.
+        :param currency_code: The uppercase fiat currency code.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def refresh() -> None:
+            try:
+                self.quote_cache.put(self.config.name, currency_code, self._fetch_multiple_price_data(tickers, currency_code))
+            except APIError as ex:
+                logger.debug("Background quote refresh failed: %s", ex)
+
+        self._refresh_thread = threading.Thread(target=refresh, name="quote-refresh")
+        self._refresh_thread.start()
+
+    def fetch_price_history(self, ticker: str, currency_code: str, start: int, end: int) -> List[PricePoint]:
+        """
+        Fetches the price history for a single cryptocurrency. Only the parts of [start, end]
+        that are not already in the local history cache are requested from the API. Points are
+        stored at HISTORY_RESOLUTION, and a range is only marked fetched up to the last closed
+        bucket, so the bucket still open is fetched again (and replaced) by the next call.
+
+        :param ticker: The ticker of the cryptocurrency.
+        :param currency_code: The code of the fiat currency to fetch the data in.
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+
+        :return: The price points within [start, end], sorted by timestamp.
+        :raises APIError: If an error occurs fetching the price history.
+        """
+        ticker = ticker.upper()
+        currency_code = currency_code.upper()
+        now = int(time.time())
+        end = min(end, now)
+        closed_end = now // HISTORY_RESOLUTION * HISTORY_RESOLUTION - 1
+        key = (self.config.name, ticker, currency_code)
+
+        gaps = self.history_cache.missing_ranges(key, start, end)
+        logger.debug("History cache for %s is missing %s range(s) within [%s, %s]", key, len(gaps), start, end)
+        for gap_start, gap_end in gaps:
+            points = resample(self._fetch_price_history_range(ticker, currency_code, gap_start, gap_end), HISTORY_RESOLUTION)
+            self.history_cache.merge(key, points, gap_start, min(gap_end, closed_end))
+
+        return self.history_cache.get(key, start, end)
+
+    @abstractmethod
+    def fetch_fx_rates(self, base_currency: str, currency_codes: List[str]) -> Dict[str, float]:
+        """
+        Fetches fiat exchange rates from a base currency.
+
+        :param base_currency: The uppercase base fiat currency code.
+        :param currency_codes: The uppercase fiat currency codes to fetch rates for.
+
+        :return: Map of currency code -> units of that currency per 1 unit of the base currency.
+        :raises APIError: If an error occurs fetching the rates.
+        """
+        pass
+
+    def fetch_market_listings(self, currency_code: str, limit: int, sort: str) -> Iterator[List[MarketEntry]]:
+        """
+        Fetches the top market listings page by page. Pages are requested concurrently but at most
+        MARKET_MAX_PAGE_WORKERS are in flight at once, and each page is yielded (in rank order) as soon
+        as it and every page before it have arrived, so memory use does not grow with the limit.
+
+        :param currency_code: The code of the fiat currency to fetch the data in.
+        :param limit: The total number of listings to fetch.
+        :param sort: The field to sort by (one of MARKET_SORT_FIELDS), descending.
+
+        :return: An iterator over the pages of parsed listings.
+        :raises APIError: If an error occurs fetching a page.
+        """
+        currency_code = currency_code.upper()
+        page_size = self._get_market_page_size()
+        page_count = (limit + page_size - 1) // page_size
+        logger.debug("Fetching %s market listing(s) in %s page(s) of %s", limit, page_count, page_size)
+
+        with ThreadPoolExecutor(max_workers=MARKET_MAX_PAGE_WORKERS) as executor:
+            pending: Deque[Future] = deque()
+            next_page = 0
+            try:
+                while next_page < page_count or pending:
+                    while next_page < page_count and len(pending) < MARKET_MAX_PAGE_WORKERS:
+                        size = min(page_size, limit - next_page * page_size)
+                        pending.append(executor.submit(self._fetch_market_page, next_page * page_size, size, currency_code, sort))
+                        next_page += 1
+
+                    entries = pending.popleft().result()
+                    yield entries
+                    if len(entries) < page_size and next_page < page_count:
+                        logger.debug("Market listing ended early. Not requesting further pages")
+                        page_count = next_page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @abstractmethod
+    def _fetch_market_page(self, offset: int, size: int, currency_code: str, sort: str) -> List[MarketEntry]:
+        """
+        Fetches a single page of market listings from the API.
+
+        :param offset: The zero-based rank offset of the first listing.
+        :param size: The number of listings in the page.
+        :param currency_code: The uppercase fiat currency code.
+        :param sort: The field to sort by (one of MARKET_SORT_FIELDS), descending.
+
+        :return: The parsed listings in rank order.
+        :raises APIError: If an error occurs fetching the page.
+        """
+        pass
+
+    @abstractmethod
+    def _get_market_page_size(self) -> int:
+        """
+        Gets the number of listings requested per page.
+
+        :return: The page size.
+        """
+        pass
+
+    @abstractmethod
+    def _fetch_price_history_range(self, ticker: str, currency_code: str, start: int, end: int) -> List[PricePoint]:
+        """
+        Fetches the price history for a single cryptocurrency from the API, bypassing the cache.
+
+        :param ticker: The uppercase ticker of the cryptocurrency.
+        :param currency_code: The uppercase fiat currency code.
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+
+        :return: The fetched price points.
+        :raises APIError: If an error occurs fetching the price history.
+        """
+        pass
+
     @abstractmethod
     def _get_request_headers(self, api_key: str) -> Dict[str, str]:
         """
@@ -81,66 +335,220 @@ class BaseAPIClient(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def _parse_json_response(self, data: Dict[str, Any], currency_code: str) -> T:
+    def _parse_json_response(self, data: Dict[str, Any], currency_code: str, ticker_ids: Dict[str, str]) -> T:
         """
         Parses the JSON response received from the API.
 
         :param data: The data received from the API.
+        :param currency_code: The fiat currency code the prices were requested in.
+        :param ticker_ids: Map of each requested ticker -> the id the API was asked for it by.
 
         :return: The parsed data.
         """
         pass
 
-    def _make_request(self, headers: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_request(self, params: Dict[str, Any], endpoint: Optional[str] = None) -> Dict[str, Any]:
         """
-        Makes a request to the API.
+        Makes a request to the API with the least-loaded key of the key pool. Compressed responses are
+        negotiated. Price and FX requests, which are repeated by polling, are made conditional if an earlier
+        response to the same request carried an ETag or Last-Modified validator, so a 304 Not Modified
+        reuses the earlier response instead of downloading and parsing it again. Other requests (history
+        windows, market pages) rarely repeat, so their responses are not kept. The request's credits are
+        reserved in the usage ledger before it is sent, so concurrent requests cannot together exceed a
+        budget, and settled at the cost the response reports.
 
-        :param headers: The request headers.
         :param params: The request parameters.
+        :param endpoint: The endpoint to request (defaults to the price endpoint).
 
         :return: The JSON from the API.
+        :raises BudgetExceededError: If the request would exceed the provider's credit budget.
         :raises APIError: If an error occurs fetching the response from the API.
         """
-        try:
-            request_url = f"{self.config.base_url}{self.config.price_endpoint}"
-            logger.debug(f"Making request to: '{request_url}'")
+        endpoint = endpoint or self.config.price_endpoint
+        key_pool = self._get_key_pool()
+        reservation = self.usage_ledger.reserve(self.config.name, self._get_request_credits(endpoint, params),
+                                                self.config.daily_credit_budget, self.config.monthly_credit_budget)
+        credits: Optional[int] = None
+        api_key: Optional[str] = None
+        response: Optional[HTTPResponse] = None
 
-            response_timeout = get_default_api_timeout()
-            response: requests.Response = requests.get(
+        try:
+            api_key = key_pool.acquire()
+            request_url = f"{self.config.base_url}{endpoint}"
+            logger.debug("Making request to: '%s'", request_url)
+
+            revalidate = endpoint in (self.config.price_endpoint, self.config.fx_endpoint)
+            request_key = _get_request_key(endpoint, params)
+            cached = self._get_cached_response(request_key) if revalidate else None
+            headers = {**self._get_request_headers(api_key), "Accept-Encoding": ACCEPT_ENCODING}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+            response_timeout = self.config.timeout or get_default_api_timeout()
+            response = self.transport.get(
                 url=request_url,
                 headers=headers,
                 params=params,
                 timeout=response_timeout
             )
 
+            if response.status_code == 304:
+                if cached is None:
+                    raise APIError("API responded 304 Not Modified to a request that was not conditional")
+                logger.debug("Response not modified. Reusing cached response")
+                credits = reservation.credits
+                return cached.data
+
             if not response.ok:
                 error_msg = response.json().get("status", {}).get("error_message")
                 raise APIError(error_msg or f"API request failed with status {response.status_code}")
             
-            logger.debug(f"Request was successful. Status code: {response.status_code}")
-            return response.json()
+            logger.debug("Request was successful. Status code: %s", response.status_code)
+            data = response.json()
+            credits = self._get_request_credits(endpoint, params, data)
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if revalidate and (etag or last_modified):
+                fresh = CachedResponse(etag, last_modified, data)
+                self._put_cached_response(request_key, fresh)
+                # Only persisted when the validators change, so polling an unchanged resource does not write
+                if cached is None or (cached.etag, cached.last_modified) != (etag, last_modified):
+                    self.quote_cache.put_response(self.config.name, request_key, fresh)
+            return data
+        except APIError:
+            raise
         except Exception as ex:
             raise APIError(f"{str(ex)}") from ex
+        finally:
+            self._settle_usage(reservation, credits)
+            if response is not None:
+                key_pool.release(api_key, response.status_code, response.headers.get("Retry-After"))
+            elif api_key is not None:
+                key_pool.release(api_key)
+
+    def _get_cached_response(self, request_key: str) -> Optional[CachedResponse]:
+        """
+        Gets the last response to a request, reading it from the quote cache the first time the request is made.
+
+        :param request_key: Identifies the request (endpoint and parameters).
+        :return: The response and its validators, or None if there is none.
+        """
+        with self._responses_lock:
+            if request_key in self._responses:
+                self._responses.move_to_end(request_key)
+                return self._responses[request_key]
 
-    def _get_api_key(self) -> str:
+        cached = self.quote_cache.get_response(self.config.name, request_key)
+        self._put_cached_response(request_key, cached)
+        return cached
+
+    def _put_cached_response(self, request_key: str, cached: Optional[CachedResponse]) -> None:
         """
-        Gets the API key stored in the environment variable.
+        Keeps the last response to a request in memory, dropping the least recently used beyond RESPONSE_CACHE_MAX_ENTRIES.
 
-        :return: The API key.
-        :raises APIError: If the API is not found.
+        :param request_key: Identifies the request (endpoint and parameters).
+        :param cached: The response and its validators, or None if there is none.
         """
-        logger.debug("Checking for API key...")
-        api_key = get_api_key(self.config.name)
+        with self._responses_lock:
+            self._responses[request_key] = cached
+            self._responses.move_to_end(request_key)
+            while len(self._responses) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._responses.popitem(last=False)
 
-        if api_key is None:
-            raise APIError(f"API key not found. Either add key to env variable or run: crypto-fetch config init")
+    def get_poll_interval(self, interval: float) -> float:
+        """
+        Gets the interval to poll at so the credit budget lasts. Once a daily or monthly budget is more
+        than USAGE_BUDGET_SOFT_LIMIT spent, the interval is stretched so the remaining credits, at the
+        cost of the last request, last until the budget resets.
 
+        :param interval: The requested polling interval in seconds.
+        :return: The interval to poll at in seconds.
+        """
+        now = datetime.now(timezone.utc)
+        next_day = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        next_month = (now.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        usage = self.usage_ledger.get_totals(self.config.name, now)
+
+        stretched = interval
+        for used, budget, resets_at in ((usage.day_credits, self.config.daily_credit_budget, next_day),
+                                        (usage.month_credits, self.config.monthly_credit_budget, next_month)):
+            if budget and used >= budget * USAGE_BUDGET_SOFT_LIMIT:
+                remaining_polls = max(budget - used, 0) / self._last_request_credits
+                stretched = max(stretched, (resets_at - now).total_seconds() / max(remaining_polls, 1))
+
+        if stretched > interval:
+            logger.warning("%s credit budget is nearly spent. Polling every %ss instead of every %ss", self.config.name, int(stretched), int(interval))
+        return stretched
+
+    def _get_request_credits(self, endpoint: str, params: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Gets the credits a request costs. By default every request costs one credit.
+
+        :param endpoint: The requested endpoint.
+        :param params: The request parameters.
+        :param data: The JSON from the API, if the request has been made (so any credit count it reports can be used).
+        :return: The credits.
+        """
+        return 1
+
+    def _settle_usage(self, reservation: Reservation, credits: Optional[int]) -> None:
+        """
+        Settles the credits reserved for a request in the usage ledger.
+
+        :param reservation: The credits reserved before the request was made.
+        :param credits: The credits the request cost, or None if it failed.
+        """
+        if credits is not None:
+            self._last_request_credits = max(credits, 1)
+        self.usage_ledger.settle(reservation, credits)
+
+    def _get_key_pool(self) -> KeyPool:
+        """
+        Gets the pool of API keys, building it on first use. Every key is validated once, when the
+        pool is built; invalid keys are logged and left out of the pool.
+
+        :return: The key pool.
+        :raises APIError: If no keys are configured, or none of them is valid.
+        """
+        with self._key_pool_lock:
+            if self._key_pool is not None:
+                return self._key_pool
+
+            logger.debug("Checking for API keys...")
+            api_keys = self.config.api_keys or get_api_keys(self.config.name)
+            if not api_keys:
+                raise APIError(f"API key not found. Add a key (or a list of keys) to the config file or run: crypto-fetch config init")
+
+            valid_keys: List[str] = []
+            errors: List[APIError] = []
+            for api_key in api_keys:
+                try:
+                    valid_keys.append(self._validate_api_key(api_key))
+                except APIError as ex:
+                    logger.warning("Ignoring %s API key %s: %s", self.config.name, mask_key(api_key.strip()), ex)
+                    errors.append(ex)
+            if not valid_keys:
+                raise errors[0]
+
+            logger.debug("API key validation was successful for %s of %s key(s)", len(valid_keys), len(api_keys))
+            self._key_pool = KeyPool(self.config.name, valid_keys, self.config.key_rate_limit)
+            return self._key_pool
+
+    def _validate_api_key(self, api_key: str) -> str:
+        """
+        Validates an API key.
+
+        :param api_key: The API key.
+        :return: The stripped API key.
+        :raises APIError: If the key is invalid.
+        """
         api_key = api_key.strip()
         if api_key.startswith('"') or api_key.startswith("'"):
             raise APIError(f"API key contains quotes. Remove quotes from API key in config file")
-        
+
         self._validate_api_key_format(api_key)
-        logger.debug("API key validation was successful")
         return api_key
         
     @abstractmethod
@@ -150,4 +558,15 @@ class BaseAPIClient(ABC, Generic[T]):
         
         :param api_key: The API key.
         """
-        pass
\ No newline at end of file
+        pass
+
+
+def _get_request_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    Gets the key identifying a request for caching its response.
+
+    :param endpoint: The requested endpoint.
+    :param params: The request parameters.
+    :return: The endpoint and its parameters in a canonical order.
+    """
+    return f"{endpoint}?{urlencode(sorted(params.items()))}"
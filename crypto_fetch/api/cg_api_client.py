@@ -1,36 +1,33 @@
 import logging
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from crypto_fetch.api.api_client import APIConfig, BaseAPIClient
-from crypto_fetch.constants import CF_LOGGER, CG_COIN_ID_MAP
+from crypto_fetch.api.api_client import BaseAPIClient, MarketEntry
+from crypto_fetch.constants import CF_LOGGER, CG_COIN_ID_MAP, PROVIDER_COINGECKO_HOURLY_MAX_RANGE, PROVIDER_COINGECKO_LISTINGS_PAGE_SIZE
 from crypto_fetch.exceptions import APIError
+from crypto_fetch.history.price_series import PricePoint
 
 logger = logging.getLogger(CF_LOGGER)
 
+# The markets endpoint can only order by market cap or volume
+_MARKET_SORT_PARAMS: Dict[str, str] = {
+    "market_cap": "market_cap_desc",
+    "24h_volume": "volume_desc",
+}
+
 
 class CoinGeckoAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
     """Impl of the BaseAPIClient class for the CoinGecko API."""
 
-    def __init__(self, config: APIConfig) -> None:
-        """
-        :param config: The API config.
-        """
-        super().__init__(config)
-        self._ticker_list: list = []
-        self._ticker_to_id_map: Dict[str, str] = {}
-
 
     def fetch_single_price_data(self, ticker: str, currency_code: str) -> float:
         try:
-            logger.debug(f"Fetching price data for ticker: '{ticker}'")
+            logger.debug("Fetching price data for ticker: '%s'", ticker)
 
-            api_key: str = self._get_api_key()
             coin_id: str = self._ticker_to_coin_id(ticker)
-            headers: Dict[str, str] = self._get_request_headers(api_key)
             params: Dict[str, str] = self._get_request_params(coin_id, currency_code)
 
-            data = self._make_request(headers, params)
+            data = self._make_request(params)
             return data[coin_id][currency_code.lower()]
         except APIError:
             raise
@@ -38,25 +35,100 @@ class CoinGeckoAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
             raise APIError(f"Failed to fetch price for '{ticker}': {ex}") from ex
 
 
-    def fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
+    def _fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
         try:
-            logger.debug(f"Fetching price data for tickers: '{tickers}'")
+            logger.debug("Fetching price data for tickers: '%s'", tickers)
 
-            api_key: str = self._get_api_key()
-            self._ticker_list = [t.strip() for t in tickers.split(",")]
-            self._ticker_to_id_map = {t: self._ticker_to_coin_id(t) for t in self._ticker_list}
-            coin_ids = ",".join(self._ticker_to_id_map.values())
-            headers: Dict[str, str] = self._get_request_headers(api_key)
+            # Kept local: the client is shared across threads (batch, background refresh, Client)
+            ticker_ids = {t: self._ticker_to_coin_id(t) for t in (t.strip() for t in tickers.split(","))}
+            coin_ids = ",".join(ticker_ids.values())
             params: Dict[str, str] = self._get_request_params(coin_ids, currency_code)
 
-            data = self._make_request(headers, params)
-            return self._parse_json_response(data, currency_code)
+            data = self._make_request(params)
+            return self._parse_json_response(data, currency_code, ticker_ids)
         except APIError:
             raise
         except Exception as ex:
             raise APIError(f"Failed to fetch prices for '{tickers}': {ex}") from ex
 
 
+    def fetch_fx_rates(self, base_currency: str, currency_codes: List[str]) -> Dict[str, float]:
+        try:
+            logger.debug("Fetching FX rates from '%s' to: %s", base_currency, currency_codes)
+
+            data = self._make_request({}, self.config.fx_endpoint)
+
+            # Rates are quoted per 1 BTC, so cross through the base currency
+            rates: Dict[str, Any] = data.get("rates", {})
+            base_value = float(rates[base_currency.lower()]["value"])
+            return {c: float(rates[c.lower()]["value"]) / base_value for c in currency_codes if c.lower() in rates}
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch FX rates for '{base_currency}': {ex}") from ex
+
+
+    def _fetch_price_history_range(self, ticker: str, currency_code: str, start: int, end: int) -> List[PricePoint]:
+        try:
+            logger.debug("Fetching price history for ticker: '%s' between %s and %s", ticker, start, end)
+
+            coin_id: str = self._ticker_to_coin_id(ticker)
+            points: List[PricePoint] = []
+            # CoinGecko picks the granularity from the range length, so long ranges are fetched in
+            # windows short enough to get hourly points
+            for window_start in range(start, end + 1, PROVIDER_COINGECKO_HOURLY_MAX_RANGE):
+                params: Dict[str, str] = {
+                    "vs_currency": currency_code.lower(),
+                    "from": str(window_start),
+                    "to": str(min(window_start + PROVIDER_COINGECKO_HOURLY_MAX_RANGE - 1, end)),
+                }
+                data = self._make_request(params, self.config.history_endpoint.format(coin_id=coin_id))
+                points.extend(self._parse_history_response(data, ticker))
+            return points
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch price history for '{ticker}': {ex}") from ex
+
+
+    def _fetch_market_page(self, offset: int, size: int, currency_code: str, sort: str) -> List[MarketEntry]:
+        try:
+            logger.debug("Fetching market listings %s to %s sorted by '%s'", offset + 1, offset + size, sort)
+
+            order = _MARKET_SORT_PARAMS.get(sort)
+            if order is None:
+                raise APIError(f"{self.config.name} does not support sorting market listings by '{sort}'")
+
+            params: Dict[str, str] = {
+                "vs_currency": currency_code.lower(),
+                "order": order,
+                "per_page": str(PROVIDER_COINGECKO_LISTINGS_PAGE_SIZE),
+                "page": str(offset // PROVIDER_COINGECKO_LISTINGS_PAGE_SIZE + 1),
+                "price_change_percentage": "1h,24h,7d",
+            }
+
+            data = self._make_request(params, self.config.listings_endpoint)
+            return [
+                MarketEntry(offset + i + 1, entry.get("symbol", "").upper(), entry.get("name", ""), {
+                    "price": float(entry.get("current_price") or 0),
+                    "1h_change": float(entry.get("price_change_percentage_1h_in_currency") or 0),
+                    "24h_change": float(entry.get("price_change_percentage_24h_in_currency") or 0),
+                    "7d_change": float(entry.get("price_change_percentage_7d_in_currency") or 0),
+                    "market_cap": float(entry.get("market_cap") or 0),
+                    "24h_volume": float(entry.get("total_volume") or 0),
+                })
+                for i, entry in enumerate(data[:size])
+            ]
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch market listings: {ex}") from ex
+
+
+    def _get_market_page_size(self) -> int:
+        return PROVIDER_COINGECKO_LISTINGS_PAGE_SIZE
+
+
     def _get_request_headers(self, api_key: str) -> Dict[str, str]:
         return {
             "Accept": "application/json",
@@ -74,26 +146,49 @@ class CoinGeckoAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
         }
 
 
-    def _parse_json_response(self, data: Dict[str, Any], currency_code: str) -> Dict[str, Dict[str, float]]:
+    def _parse_json_response(self, data: Dict[str, Any], currency_code: str, ticker_ids: Dict[str, str]) -> Dict[str, Dict[str, float]]:
         result: Dict[str, Dict[str, float]] = {}
         currency_lower = currency_code.lower()
+        change_key, market_cap_key, volume_key = f"{currency_lower}_24h_change", f"{currency_lower}_market_cap", f"{currency_lower}_24h_vol"
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        for ticker in self._ticker_list:
-            coin_id = self._ticker_to_id_map[ticker]
+        for ticker, coin_id in ticker_ids.items():
             coin_data = data.get(coin_id, {})
-            logger.debug(f"Parsed JSON response for '{coin_id}': '{coin_data}'")
+            if debug:
+                logger.debug("Parsed JSON response for '%s': '%s'", coin_id, coin_data)
 
             result[ticker.upper()] = {
                 "price": float(coin_data.get(currency_lower, 0)),
                 # "1h_change": float(coin_data.get(f"{currency_lower}_1h_change", 0)),
-                "24h_change": float(coin_data.get(f"{currency_lower}_24h_change", 0)),
+                "24h_change": float(coin_data.get(change_key, 0)),
                 # "7d_change": float(coin_data.get(f"{currency_lower}_7d_change", 0)),
-                "market_cap": float(coin_data.get(f"{currency_lower}_market_cap", 0)),
-                "24h_volume": float(coin_data.get(f"{currency_lower}_24h_vol", 0)),
+                "market_cap": float(coin_data.get(market_cap_key, 0)),
+                "24h_volume": float(coin_data.get(volume_key, 0)),
             }
         return result
 
 
+    def _parse_history_response(self, data: Dict[str, Any], ticker: str) -> List[PricePoint]:
+        """
+        Parses a market chart response into price points. CoinGecko only returns a single
+        price per sample, so open/high/low/close are all set to that price.
+
+        :param data: The data received from the API.
+        :param ticker: The requested ticker.
+
+        :return: The parsed price points.
+        """
+        volumes: Dict[int, float] = {int(ts_ms) // 1000: float(v) for ts_ms, v in data.get("total_volumes", [])}
+
+        points: List[PricePoint] = []
+        for ts_ms, price in data.get("prices", []):
+            timestamp = int(ts_ms) // 1000
+            price = float(price)
+            points.append(PricePoint(timestamp, price, price, price, price, volumes.get(timestamp, 0.0)))
+        logger.debug("Parsed %s history point(s) for '%s'", len(points), ticker)
+        return points
+
+
     def _validate_api_key_format(self, api_key: str):
         # CG key format: CG-<24 alphanumeric characters>
         if not api_key.startswith("CG-"):
@@ -118,7 +213,7 @@ class CoinGeckoAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
         coin_id = CG_COIN_ID_MAP.get(ticker_upper)
 
         if not coin_id:
-            logger.warning(f"Ticker '{ticker}' not in mapping. Using lowercase as ID")
+            logger.warning("Ticker '%s' not in mapping. Using lowercase as ID", ticker)
             return ticker.lower()
 
         return coin_id
\ No newline at end of file
@@ -0,0 +1,78 @@
+import logging
+from typing import Any, Dict, Optional
+
+from crypto_fetch.api.api_client import APIConfig, BaseAPIClient
+from crypto_fetch.api.cg_api_client import CoinGeckoAPIClient
+from crypto_fetch.api.cmc_api_client import CoinMarketCapAPIClient
+from crypto_fetch.config.config import DEFAULT_API_CONFIG, load_api_config_from_file, parse_api_keys
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    CONFIG_DEFAULTS_API_TIMEOUT,
+    CONFIG_DEFAULTS_HTTP_BACKEND,
+    CONFIG_HEADER_API_KEYS,
+    CONFIG_HEADER_DEFAULTS,
+    CONFIG_KEY_DEFAULTS_API_TIMEOUT,
+    CONFIG_KEY_DEFAULTS_HTTP_BACKEND,
+    CONFIG_KEY_PROVIDER_BASE_URL,
+    CONFIG_KEY_PROVIDER_DAILY_CREDIT_BUDGET,
+    CONFIG_KEY_PROVIDER_FX_EP,
+    CONFIG_KEY_PROVIDER_HISTORY_EP,
+    CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT,
+    CONFIG_KEY_PROVIDER_LISTINGS_EP,
+    CONFIG_KEY_PROVIDER_MONTHLY_CREDIT_BUDGET,
+    CONFIG_KEY_PROVIDER_NAME,
+    CONFIG_KEY_PROVIDER_PRICE_EP,
+    PROVIDER_COINGECKO,
+)
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+def create_api_config(provider: str, config: Optional[Dict[str, Any]] = None) -> APIConfig:
+    """
+    Builds an APIConfig from a loaded config. The API keys, timeout and HTTP backend are captured
+    in the APIConfig so the client does not need to re-read the config file for every request.
+
+    :param provider: The provider name.
+    :param config: The loaded config (read from the config file if None).
+    :return: The APIConfig for the given provider.
+    """
+    logger.debug("Creating API config for provider: '%s'", provider)
+    config = config if config is not None else load_api_config_from_file()
+    provider_config: Dict[str, Any] = config.get(provider) or {}
+    if not provider_config:
+        logger.warning("No API config found for provider '%s'. Using defaults", provider)
+        provider_config = DEFAULT_API_CONFIG[provider]
+
+    defaults: Dict[str, Any] = DEFAULT_API_CONFIG[provider]
+    config_defaults: Dict[str, Any] = config.get(CONFIG_HEADER_DEFAULTS) or {}
+    api_keys = parse_api_keys((config.get(CONFIG_HEADER_API_KEYS) or {}).get(provider))
+
+    return APIConfig(
+        name=provider_config.get(CONFIG_KEY_PROVIDER_NAME, provider),
+        base_url=provider_config.get(CONFIG_KEY_PROVIDER_BASE_URL, ""),
+        price_endpoint=provider_config.get(CONFIG_KEY_PROVIDER_PRICE_EP, ""),
+        history_endpoint=provider_config.get(CONFIG_KEY_PROVIDER_HISTORY_EP, defaults[CONFIG_KEY_PROVIDER_HISTORY_EP]),
+        fx_endpoint=provider_config.get(CONFIG_KEY_PROVIDER_FX_EP, defaults[CONFIG_KEY_PROVIDER_FX_EP]),
+        listings_endpoint=provider_config.get(CONFIG_KEY_PROVIDER_LISTINGS_EP, defaults[CONFIG_KEY_PROVIDER_LISTINGS_EP]),
+        # Budgets are opt-in: the ledger only sees this machine's calls, and plans differ in their limits
+        daily_credit_budget=provider_config.get(CONFIG_KEY_PROVIDER_DAILY_CREDIT_BUDGET) or None,
+        monthly_credit_budget=provider_config.get(CONFIG_KEY_PROVIDER_MONTHLY_CREDIT_BUDGET) or None,
+        key_rate_limit=provider_config.get(CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT, defaults.get(CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT)) or None,
+        api_keys=api_keys,
+        timeout=config_defaults.get(CONFIG_KEY_DEFAULTS_API_TIMEOUT, CONFIG_DEFAULTS_API_TIMEOUT),
+        http_backend=config_defaults.get(CONFIG_KEY_DEFAULTS_HTTP_BACKEND, CONFIG_DEFAULTS_HTTP_BACKEND),
+    )
+
+
+def create_api_client(provider: str, config: Optional[Dict[str, Any]] = None) -> BaseAPIClient:
+    """
+    Creates the API client for a provider.
+
+    :param provider: The provider name.
+    :param config: The loaded config (read from the config file if None).
+    :return: The API client.
+    """
+    if provider == PROVIDER_COINGECKO:
+        return CoinGeckoAPIClient(create_api_config(provider, config))
+    return CoinMarketCapAPIClient(create_api_config(provider, config))
@@ -1,47 +1,144 @@
+from datetime import datetime
 import logging
+import math
 import re
-from typing import Any, Dict
-
-from crypto_fetch.api.api_client import BaseAPIClient
-from crypto_fetch.constants import CF_LOGGER
+from typing import Any, Dict, List, Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient, MarketEntry
+from crypto_fetch.api.key_pool import mask_key
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    PROVIDER_COINMARKETCAP_HISTORY_INTERVAL,
+    PROVIDER_COINMARKETCAP_LISTINGS_PAGE_SIZE,
+    PROVIDER_COINMARKETCAP_LISTINGS_PER_CREDIT,
+    PROVIDER_COINMARKETCAP_QUOTES_PER_CREDIT,
+)
 from crypto_fetch.exceptions import APIError
+from crypto_fetch.history.price_series import PricePoint
 
 logger = logging.getLogger(CF_LOGGER)
 
+_MARKET_SORT_PARAMS: Dict[str, str] = {
+    "market_cap": "market_cap",
+    "24h_volume": "volume_24h",
+    "price": "price",
+    "1h_change": "percent_change_1h",
+    "24h_change": "percent_change_24h",
+    "7d_change": "percent_change_7d",
+}
+
 
 class CoinMarketCapAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
     """Impl of the BaseAPIClient class for the CoinMarketCap API."""
 
     def fetch_single_price_data(self, ticker: str, currency_code: str) -> float:
         try:
-            logger.debug(f"Fetching price data for ticker: '{ticker}'")
+            logger.debug("Fetching price data for ticker: '%s'", ticker)
 
-            api_key: str = self._get_api_key()
-            headers: Dict[str, str] = self._get_request_headers(api_key)
             params: Dict[str, str] = self._get_request_params(ticker, currency_code)
 
-            data = self._make_request(headers, params)
+            data = self._make_request(params)
             return data['data'][ticker]['quote'][currency_code.upper()]['price']
         except APIError:
             raise
         except Exception as ex:
             raise APIError(f"Failed to fetch price for '{ticker}': {ex}") from ex
 
-    def fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
+    def _fetch_multiple_price_data(self, tickers: str, currency_code: str) -> Dict[str, Dict[str, float]]:
         try:
-            logger.debug(f"Fetching price data for tickers: '{tickers}'")
+            logger.debug("Fetching price data for tickers: '%s'", tickers)
 
-            api_key: str = self._get_api_key()
-            headers: Dict[str, str] = self._get_request_headers(api_key)
             params: Dict[str, str] = self._get_request_params(tickers, currency_code)
 
-            data = self._make_request(headers, params)
-            return self._parse_json_response(data, currency_code)
+            data = self._make_request(params)
+            # CoinMarketCap is queried (and answers) by symbol
+            return self._parse_json_response(data, currency_code, {t.strip(): t.strip() for t in tickers.split(",")})
         except APIError:
             raise
         except Exception as ex:
             raise APIError(f"Failed to fetch price for '{tickers}': {ex}") from ex
 
+    def fetch_fx_rates(self, base_currency: str, currency_codes: List[str]) -> Dict[str, float]:
+        try:
+            logger.debug("Fetching FX rates from '%s' to: %s", base_currency, currency_codes)
+
+            params: Dict[str, str] = {"amount": "1", "symbol": base_currency, "convert": ",".join(currency_codes)}
+            data = self._make_request(params, self.config.fx_endpoint)
+
+            raw_data: Any = data.get("data", {})
+            if isinstance(raw_data, list):
+                raw_data = raw_data[0] if raw_data else {}
+            quote: Dict[str, Any] = raw_data.get("quote", {})
+            return {c: float(quote[c]["price"]) for c in currency_codes if c in quote}
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch FX rates for '{base_currency}': {ex}") from ex
+
+    def _fetch_price_history_range(self, ticker: str, currency_code: str, start: int, end: int) -> List[PricePoint]:
+        try:
+            logger.debug("Fetching price history for ticker: '%s' between %s and %s", ticker, start, end)
+
+            params: Dict[str, str] = {
+                "symbol": ticker,
+                "convert": currency_code,
+                "time_start": str(start),
+                "time_end": str(end),
+                "time_period": PROVIDER_COINMARKETCAP_HISTORY_INTERVAL,
+                "interval": PROVIDER_COINMARKETCAP_HISTORY_INTERVAL,
+            }
+
+            data = self._make_request(params, self.config.history_endpoint)
+            return self._parse_history_response(data, ticker, currency_code)
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch price history for '{ticker}': {ex}") from ex
+
+    def _fetch_market_page(self, offset: int, size: int, currency_code: str, sort: str) -> List[MarketEntry]:
+        try:
+            logger.debug("Fetching market listings %s to %s sorted by '%s'", offset + 1, offset + size, sort)
+
+            params: Dict[str, str] = {
+                "start": str(offset + 1),
+                "limit": str(size),
+                "convert": currency_code,
+                "sort": _MARKET_SORT_PARAMS[sort],
+                "sort_dir": "desc",
+            }
+
+            data = self._make_request(params, self.config.listings_endpoint)
+            return [
+                MarketEntry(offset + i + 1, entry.get("symbol", ""), entry.get("name", ""),
+                            self._parse_quote(entry.get("quote", {}).get(currency_code, {})))
+                for i, entry in enumerate(data.get("data", []))
+            ]
+        except APIError:
+            raise
+        except Exception as ex:
+            raise APIError(f"Failed to fetch market listings: {ex}") from ex
+
+    def _get_market_page_size(self) -> int:
+        return PROVIDER_COINMARKETCAP_LISTINGS_PAGE_SIZE
+
+    def _get_request_credits(self, endpoint: str, params: Dict[str, Any], data: Optional[Dict[str, Any]] = None) -> int:
+        # Responses report what they were billed; otherwise estimate from CoinMarketCap's credit rules:
+        # 1 credit per 100 quotes (200 listings or 100 history points), plus 1 per extra convert currency
+        credit_count = (data or {}).get("status", {}).get("credit_count")
+        if isinstance(credit_count, int):
+            return credit_count
+
+        if endpoint == self.config.listings_endpoint:
+            credits = math.ceil(int(params.get("limit", 1)) / PROVIDER_COINMARKETCAP_LISTINGS_PER_CREDIT)
+        elif endpoint == self.config.history_endpoint:
+            points = (int(params.get("time_end", 0)) - int(params.get("time_start", 0))) // 3600
+            credits = math.ceil(max(points, 1) / PROVIDER_COINMARKETCAP_QUOTES_PER_CREDIT)
+        elif endpoint == self.config.price_endpoint:
+            credits = math.ceil(len(str(params.get("symbol", "")).split(",")) / PROVIDER_COINMARKETCAP_QUOTES_PER_CREDIT)
+        else:
+            credits = 1
+        return credits + max(len(str(params.get("convert", "")).split(",")) - 1, 0)
+
     def _get_request_headers(self, api_key: str) -> Dict[str, str]:
         return {
             "Accept": "application/json",
@@ -54,28 +151,72 @@ class CoinMarketCapAPIClient(BaseAPIClient[Dict[str, Dict[str, float]]]):
             "convert": currency_code.upper()
         }
 
-    def _parse_json_response(self, data: Dict[str, Any], currency_code: str) -> Dict[str, Dict[str, float]]:
+    def _parse_json_response(self, data: Dict[str, Any], currency_code: str, ticker_ids: Dict[str, str]) -> Dict[str, Dict[str, float]]:
         result: Dict[str, Dict[str, float]] = {}
         raw_data: Dict[str, Any] = data.get("data", {})
         currency_code: str = currency_code.upper()
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         for ticker, data in raw_data.items():
             quote: Dict[str, Any] = data.get("quote", {}).get(currency_code, {})
-            logger.debug(f"Parsed JSON response for '{ticker}': '{quote}'")
-
-            result[ticker] = {
-                "price": float(quote.get("price", 0)),
-                "1h_change": float(quote.get("percent_change_1h", 0)),
-                "24h_change": float(quote.get("percent_change_24h", 0)),
-                "7d_change": float(quote.get("percent_change_7d", 0)),
-                "market_cap": float(quote.get("market_cap", 0)),
-                "24h_volume": float(quote.get("volume_24h", 0)),
-            }
+            if debug:
+                logger.debug("Parsed JSON response for '%s': '%s'", ticker, quote)
+            result[ticker] = self._parse_quote(quote)
         return result
 
+    def _parse_quote(self, quote: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Parses a single currency quote.
+
+        :param quote: The quote for one currency.
+
+        :return: The parsed price data.
+        """
+        return {
+            "price": float(quote.get("price") or 0),
+            "1h_change": float(quote.get("percent_change_1h") or 0),
+            "24h_change": float(quote.get("percent_change_24h") or 0),
+            "7d_change": float(quote.get("percent_change_7d") or 0),
+            "market_cap": float(quote.get("market_cap") or 0),
+            "24h_volume": float(quote.get("volume_24h") or 0),
+        }
+
+    def _parse_history_response(self, data: Dict[str, Any], ticker: str, currency_code: str) -> List[PricePoint]:
+        """
+        Parses an OHLCV historical response into price points.
+
+        :param data: The data received from the API.
+        :param ticker: The requested ticker.
+        :param currency_code: The uppercase fiat currency code.
+
+        :return: The parsed price points.
+        """
+        raw_data: Any = data.get("data", {})
+        if "quotes" not in raw_data:
+            # Multi-symbol responses are keyed by symbol (and may be a list per symbol)
+            raw_data = raw_data.get(ticker, {})
+            if isinstance(raw_data, list):
+                raw_data = raw_data[0] if raw_data else {}
+
+        points: List[PricePoint] = []
+        for entry in raw_data.get("quotes", []):
+            quote: Dict[str, Any] = entry.get("quote", {}).get(currency_code, {})
+            time_open: str = entry.get("time_open") or quote.get("timestamp", "")
+            timestamp = int(datetime.fromisoformat(time_open.replace("Z", "+00:00")).timestamp())
+            points.append(PricePoint(
+                timestamp,
+                float(quote.get("open", 0)),
+                float(quote.get("high", 0)),
+                float(quote.get("low", 0)),
+                float(quote.get("close", 0)),
+                float(quote.get("volume", 0)),
+            ))
+        logger.debug("Parsed %s history point(s) for '%s'", len(points), ticker)
+        return points
+
     def _validate_api_key_format(self, api_key: str):
         # cmc key contains letters, numbers and hyphens (usually UUID format, 32 chars + 4 hyphens)
-        logger.debug(f"Validating API key format: '{api_key}'")
+        logger.debug("Validating API key format: '%s'", mask_key(api_key))
         if len(api_key) < 32:
             raise APIError(f"Invalid {self.config.name} key. Too short: {len(api_key)} characters")
 
@@ -1,29 +1,103 @@
+from contextlib import contextmanager
+from datetime import datetime
+import io
 import math
-from typing import Dict, List, Optional
+from pathlib import Path
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.table import Table
+from rich.text import Text
 
 
 from crypto_fetch.commands.command_utils import get_timestamp
 from crypto_fetch.constants import (
+    ANALYTICS_MAX_CORRELATION_COLUMNS,
+    CONSENSUS_MIN_OUTLIER_PRICES,
     CURRENCY_CODE_ONLY_MAP,
     CURRENCY_SYMBOL_MAP,
+    DATE_TIME_FORMAT,
     PRECISION_HIGH,
     PRECISION_LOW,
     PRECISION_MEDIUM,
+    USAGE_BUDGET_SOFT_LIMIT,
 )
 
-_console = Console(highlight=False)
+if TYPE_CHECKING:
+    from crypto_fetch.alerts.engine import AlertEvent
+    from crypto_fetch.api.api_client import MarketEntry
+    from crypto_fetch.api.usage_ledger import DailyUsage, UsageTotals
+    from crypto_fetch.history.analytics import AnalyticsResult
+    from crypto_fetch.history.price_series import PricePoint
+    from crypto_fetch.loadtest.runner import LoadTestResult
+    from crypto_fetch.portfolio.history_store import ValuationSummary
+    from crypto_fetch.rates.consensus import ConsensusQuote
+
+_default_console = Console(highlight=False)
+_thread_local = threading.local()
+
+
+class _ConsoleProxy:
+    """Delegates to the console capturing the current thread's output, or the default console."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_console(), name)
+
+
+_console = _ConsoleProxy()
+
+
+def get_console() -> Console:
+    """
+    Gets the console output should be printed to from the current thread.
+
+    :return: The console of the enclosing capture_output() block, or the default console.
+    """
+    return getattr(_thread_local, "console", None) or _default_console
+
+
+@contextmanager
+def capture_output() -> Iterator[io.StringIO]:
+    """
+    Captures everything printed to the console (including INFO/WARNING logs) by the current thread,
+    rendered as it would be on the default console, so concurrent commands can be written out in order.
+
+    :return: The buffer the output is captured in.
+    """
+    buffer = io.StringIO()
+    _thread_local.console = Console(
+        file=buffer,
+        highlight=False,
+        width=_default_console.width,
+        color_system=_default_console.color_system,
+        force_terminal=_default_console.is_terminal,
+    )
+    try:
+        yield buffer
+    finally:
+        _thread_local.console = None
+
+
+def print_captured_output(text: str) -> None:
+    """
+    Writes output captured by capture_output() to the default console.
+
+    :param text: The captured output.
+    """
+    _default_console.file.write(text)
+    _default_console.file.flush()
 
 
 def print_output(text: str) -> None:
     """Prints formatted output via rich console."""
     _console.print(text)
 
-def format_price_output(data: Dict[str, Dict[str, float]], currency_code: str, api_url: str, verbose: bool) -> Optional[str]:
+def format_price_output(data: Dict[str, Dict[str, float]], currency_code: str, api_url: str, verbose: bool,
+                        limit: Optional[int] = None, page: bool = False) -> Optional[str]:
     """
     Formats the cryptocurrency price data received from the API.
 
@@ -31,6 +105,8 @@ def format_price_output(data: Dict[str, Dict[str, float]], currency_code: str, a
     :param currency_code: The fiat currency code.
     :param api_url: The API URL.
     :param verbose: Whether the output should be verbose.
+    :param limit: The maximum number of tickers to show in verbose mode (None for all).
+    :param page: Whether verbose output should be shown through the console pager.
 
     :returns: Formatted output string, or None if verbose (prints directly).
     """
@@ -39,60 +115,98 @@ def format_price_output(data: Dict[str, Dict[str, float]], currency_code: str, a
 
     currency_code: str = currency_code.upper()
     currency_symbol: str = _get_currency_symbol(currency_code)
+    price_template: str = _get_price_template(currency_symbol, currency_code)
 
     if not verbose:
         output: List[str] = []
         for ticker, ticker_data in data.items():
-            price: float = ticker_data.get("price", 0)
-            output.append(_get_base_price_output(price, ticker, currency_symbol, currency_code))
+            price_str = price_template.format(price=ticker_data.get("price", 0))
+            line = f"🔹 [bold]${ticker}[/bold]: [bold cyan]{price_str}[/bold cyan]"
+            if "age" in ticker_data:
+                line += f" [yellow](cached, {_format_age(ticker_data['age'])} old)[/yellow]"
+            output.append(line)
         return "\n".join(output)
 
-    for ticker, ticker_data in data.items():
-        price: float = ticker_data.get("price", 0)
-        price_str = _format_price(price, currency_symbol, currency_code)
-        _print_verbose_price_table(ticker, price_str, ticker_data, currency_code)
-
-    _console.print(f"[dim]data fetched from '{api_url}'[/dim]\n")
+    shown = list(data.items())[:limit] if limit is not None else list(data.items())
+    renderables: List[RenderableType] = []
+    for ticker, ticker_data in shown:
+        price_str = price_template.format(price=ticker_data.get("price", 0))
+        renderables.extend(_build_verbose_price_table(ticker, price_str, ticker_data, currency_code))
+
+    if len(shown) < len(data):
+        renderables.append(Text(f"... {len(data) - len(shown)} more ticker(s) not shown (raise --limit or use --page)\n", style="dim"))
+    renderables.append(Text(f"data fetched from '{api_url}'\n", style="dim"))
+
+    # Everything is rendered as one group so the console performs a single write
+    group = Group(*renderables)
+    if page:
+        with _console.pager(styles=True):
+            _console.print(group)
+    else:
+        _console.print(group)
     return None
 
 
-def _format_price(price: float, currency_symbol: str, currency_code: str) -> str:
+def _get_price_template(currency_symbol: str, currency_code: str) -> str:
+    """
+    Gets the str.format template used to render prices in a currency, so the symbol placement
+    only has to be worked out once per call rather than once per ticker.
+
+    :param currency_symbol: The fiat currency symbol.
+    :param currency_code: The fiat currency code.
+
+    :returns: A template with a single '{price}' field.
+    """
+    symbol = currency_symbol.replace("{", "{{").replace("}", "}}")
     if currency_symbol in ("$", "¥"):
-        return f"{currency_symbol}{price:.4f} ({currency_code})"
+        return f"{symbol}{{price:.4f}} ({currency_code})"
     elif currency_code in CURRENCY_CODE_ONLY_MAP:
-        return f"{price:.4f}{currency_symbol} ({currency_code})"
+        return f"{{price:.4f}}{symbol} ({currency_code})"
     else:
-        return f"{currency_symbol}{price:.4f}"
+        return f"{symbol}{{price:.4f}}"
+
+
+def _format_price(price: float, currency_symbol: str, currency_code: str) -> str:
+    return _get_price_template(currency_symbol, currency_code).format(price=price)
 
 
-def _get_base_price_output(price: float, ticker: str, currency_symbol: str, currency_code: str) -> str:
-    price_str = _format_price(price, currency_symbol, currency_code)
-    return f"🔹 [bold]${ticker}[/bold]: [bold cyan]{price_str}[/bold cyan]"
+def _build_verbose_price_table(ticker: str, price_str: str, data: Dict[str, float], currency_code: str) -> List[RenderableType]:
+    """
+    Builds the renderables for a single ticker in verbose mode. Text objects are styled
+    directly so no markup has to be parsed per row.
 
+    :param ticker: The cryptocurrency ticker.
+    :param price_str: The formatted price.
+    :param data: The parsed price data for the ticker.
+    :param currency_code: The fiat currency code.
 
-def _print_verbose_price_table(ticker: str, price_str: str, data: Dict[str, float], currency_code: str) -> None:
+    :returns: The renderables (header, rule, detail rows).
+    """
     change_1hr = data.get("1h_change")
     change_24hr: float = data.get("24h_change", 0)
     change_7d = data.get("7d_change")
     volume_24hr: float = data.get("24h_volume", 0)
     market_cap: float = data.get("market_cap", 0)
 
-    _console.print(f"[bold]${ticker}[/bold]  [bold cyan]{price_str}[/bold cyan]")
-    _console.rule(style="dim")
-
     rows = []
     if change_1hr is not None:
-        rows.append(("1h Change", _format_percentage_change(change_1hr)))
-    rows.append(("24h Change", _format_percentage_change(change_24hr)))
+        rows.append(("1h Change", _percentage_change_text(change_1hr)))
+    rows.append(("24h Change", _percentage_change_text(change_24hr)))
     if change_7d is not None:
-        rows.append(("7d Change", _format_percentage_change(change_7d)))
-    rows.append(("24h Volume", _format_large_number(volume_24hr, currency_code)))
-    rows.append(("Market Cap", _format_large_number(market_cap, currency_code)))
+        rows.append(("7d Change", _percentage_change_text(change_7d)))
+    rows.append(("24h Volume", Text(_format_large_number(volume_24hr, currency_code))))
+    rows.append(("Market Cap", Text(_format_large_number(market_cap, currency_code))))
 
+    body = Text()
     for label, value in rows:
-        _console.print(f"  [dim]{label:<12}[/dim]{value}")
+        body.append(f"  {label:<12}", style="dim")
+        body.append_text(value)
+        body.append("\n")
 
-    _console.print()
+    header = Text.assemble((f"${ticker}", "bold"), "  ", (price_str, "bold cyan"))
+    if "age" in data:
+        header.append(f"  (cached, {_format_age(data['age'])} old)", style="yellow")
+    return [header, Rule(style="dim"), body]
 
 
 def format_convert_output(ticker: str, currency_code: str, amount_to_convert: float, converted_amount: float) -> str:
@@ -119,20 +233,132 @@ def format_convert_output(ticker: str, currency_code: str, amount_to_convert: fl
     return output
 
 
-def format_portfolio_output(holdings: Dict[str, float], price_data: Dict[str, Dict[str, float]], currency_code: str) -> None:
+def format_crypto_convert_output(ticker: str, to_ticker: str, amount_to_convert: float, converted_amount: float) -> str:
+    """
+    Formats the output for a crypto-to-crypto conversion.
+
+    :param ticker: The source cryptocurrency ticker.
+    :param to_ticker: The target cryptocurrency ticker.
+    :param amount_to_convert: The amount of the source cryptocurrency.
+    :param converted_amount: The equivalent amount of the target cryptocurrency.
+
+    :returns: Formatted output string.
+    """
+    return f"🔸 {amount_to_convert} ${ticker} => [bold]{converted_amount:.8g} ${to_ticker}[/bold]"
+
+
+def format_cross_rate_matrix_output(tickers: List[str], matrix: List[List[float]], currency_code: str) -> None:
+    """
+    Renders the cross-rate matrix: each cell is how many units of the column asset one unit of the row asset is worth.
+
+    :param tickers: The tickers, in matrix order.
+    :param matrix: The N x N cross-rate matrix.
+    :param currency_code: The fiat currency the rates were derived from.
+    """
+    table = Table(title=f"Cross Rates (via {currency_code.upper()})", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("1 unit of", style="bold")
+    for ticker in tickers:
+        table.add_column(ticker, justify="right")
+    for ticker, row in zip(tickers, matrix):
+        table.add_row(ticker, *(f"{rate:.6g}" for rate in row))
+    _console.print(table)
+
+
+def format_market_output(entries: List["MarketEntry"], currency_code: str, show_header: bool) -> None:
+    """
+    Renders one page of market listings. Column widths are fixed so that pages printed
+    one after another line up as a single table.
+
+    :param entries: The listings in the page, in rank order.
+    :param currency_code: The fiat currency code.
+    :param show_header: Whether to print the column headers (first page only).
+    """
+    currency_code = currency_code.upper()
+
+    table = Table(box=None, show_header=show_header, header_style="bold", padding=(0, 1, 0, 0))
+    table.add_column("#", justify="right", width=5)
+    table.add_column("Ticker", style="bold", width=7, no_wrap=True)
+    table.add_column(f"Price {currency_code}", justify="right", style="cyan", width=12, no_wrap=True)
+    for column in ("1h", "24h", "7d"):
+        table.add_column(column, justify="right", width=9, no_wrap=True)
+    table.add_column("Vol 24h", justify="right", width=9, no_wrap=True)
+    table.add_column("Mkt Cap", justify="right", width=9, no_wrap=True)
+
+    for entry in entries:
+        quote = entry.quote
+        table.add_row(
+            str(entry.rank),
+            entry.ticker,
+            f"{quote.get('price', 0):,.6g}",
+            _percentage_change_text(quote.get("1h_change", 0)),
+            _percentage_change_text(quote.get("24h_change", 0)),
+            _percentage_change_text(quote.get("7d_change", 0)),
+            _format_compact_number(quote.get("24h_volume", 0)),
+            _format_compact_number(quote.get("market_cap", 0)),
+        )
+    _console.print(table)
+
+
+def format_consensus_output(quotes: List["ConsensusQuote"], providers: List[str], currency_code: str, outlier_threshold: float) -> None:
+    """
+    Renders the consensus prices with each provider's price and the divergence between them.
+
+    :param quotes: The consensus quotes.
+    :param providers: The providers that were queried, in column order.
+    :param currency_code: The fiat currency code.
+    :param outlier_threshold: The divergence (in percent) above which prices are flagged.
+    """
+    currency_code = currency_code.upper()
+
+    table = Table(title=f"Consensus Prices ({currency_code})", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Ticker", style="bold")
+    for provider in providers:
+        table.add_column(provider, justify="right")
+    table.add_column("Median", justify="right", style="bold cyan")
+    table.add_column("Mean", justify="right")
+    table.add_column("Divergence", justify="right")
+
+    for quote in quotes:
+        cells = []
+        for provider in providers:
+            price = quote.prices.get(provider)
+            if price is None:
+                cells.append("[dim]-[/dim]")
+            elif provider in quote.outliers:
+                cells.append(f"[red]{price:,.4f}[/red]")
+            else:
+                cells.append(f"{price:,.4f}")
+        divergence = f"{quote.divergence:.2f}%"
+        table.add_row(
+            f"${quote.ticker}",
+            *cells,
+            f"{quote.median:,.4f}",
+            f"{quote.mean:,.4f}",
+            f"[bold red]{divergence} ⚠[/bold red]" if quote.divergence > outlier_threshold else divergence,
+        )
+
+    _console.print(table)
+    _console.print(f"[dim]divergences over {outlier_threshold:g}% are flagged, and with {CONSENSUS_MIN_OUTLIER_PRICES}+ providers "
+                   f"so are the prices more than {outlier_threshold:g}% from the median[/dim]\n")
+
+
+def format_portfolio_output(holdings: Dict[str, float], price_data: Dict[str, Dict[str, float]], currency_code: str, title: str = "Portfolio Holdings") -> float:
     """
     Renders the portfolio holdings table and summary panel.
 
     :param holdings: Map of ticker -> amount held.
     :param price_data: Map of ticker -> price data from API.
     :param currency_code: The fiat currency code.
+    :param title: The title of the holdings table.
+
+    :returns: The total value of the portfolio.
     """
     currency_code = currency_code.upper()
     symbol = _get_currency_symbol(currency_code)
 
     console = _console
 
-    table = Table(title="Portfolio Holdings", box=box.HEAVY_HEAD, show_footer=False)
+    table = Table(title=title, box=box.HEAVY_HEAD, show_footer=False)
     table.add_column("Asset", style="bold")
     table.add_column("Holding", justify="right")
     table.add_column("Value", justify="right")
@@ -144,24 +370,311 @@ def format_portfolio_output(holdings: Dict[str, float], price_data: Dict[str, Di
         value = amount * price
         total_value += value
 
-        if symbol in ("$", "¥"):
-            value_str = f"{symbol}{value:,.2f}"
-            price_str = f"{symbol}{price:,.2f}"
-        else:
-            value_str = f"{value:,.2f} {symbol}"
-            price_str = f"{price:,.2f} {symbol}"
-
-        table.add_row(ticker, str(amount), value_str, price_str)
+        table.add_row(ticker, str(amount), _format_value(value, symbol), _format_value(price, symbol))
 
     console.print(table)
 
     summary = (
         f"Total Assets: {len(holdings)}\n"
-        f"Total Value:  {f'{symbol}{total_value:,.2f}' if symbol in ('$', '¥') else f'{total_value:,.2f} {symbol}'}\n"
+        f"Total Value:  {_format_value(total_value, symbol)}\n"
         "\n"
         f"Timestamp:    {get_timestamp()}"
     )
     console.print(Panel(summary, title="Portfolio Summary", expand=False))
+    return total_value
+
+
+def format_portfolio_summary_output(valuations: Dict[str, float], distinct_assets: int, currency_code: str) -> None:
+    """
+    Renders the combined summary for multiple portfolio files.
+
+    :param valuations: Map of portfolio file -> total value.
+    :param distinct_assets: The number of distinct assets across all files.
+    :param currency_code: The fiat currency code.
+    """
+    symbol = _get_currency_symbol(currency_code.upper())
+
+    table = Table(title="Portfolio Valuations", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Portfolio", style="bold")
+    table.add_column("Value", justify="right")
+    for name, value in valuations.items():
+        table.add_row(name, _format_value(value, symbol))
+    _console.print(table)
+
+    summary = (
+        f"Total Portfolios: {len(valuations)}\n"
+        f"Distinct Assets:  {distinct_assets}\n"
+        f"Total Value:      {_format_value(sum(valuations.values()), symbol)}\n"
+        "\n"
+        f"Timestamp:        {get_timestamp()}"
+    )
+    _console.print(Panel(summary, title="Combined Summary", expand=False))
+
+
+def format_account_breakdown_output(account_holdings: Dict[str, Dict[str, float]], price_data: Dict[str, Dict[str, float]], currency_code: str) -> None:
+    """
+    Renders a table of the total value held in each account.
+
+    :param account_holdings: Map of account -> (ticker -> amount held).
+    :param price_data: Map of ticker -> price data from API.
+    :param currency_code: The fiat currency code.
+    """
+    symbol = _get_currency_symbol(currency_code.upper())
+
+    table = Table(title="Holdings by Account", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Account", style="bold")
+    table.add_column("Assets", justify="right")
+    table.add_column("Value", justify="right")
+
+    for account, holdings in sorted(account_holdings.items()):
+        value = sum(amount * price_data.get(ticker, {}).get("price", 0.0) for ticker, amount in holdings.items())
+        table.add_row(account, str(len(holdings)), _format_value(value, symbol))
+
+    _console.print(table)
+
+
+def format_usage_output(totals: Dict[str, "UsageTotals"], budgets: Dict[str, Tuple[Optional[int], Optional[int]]], daily: List["DailyUsage"]) -> None:
+    """
+    Renders API usage against the credit budgets, and the usage per day.
+
+    :param totals: Map of provider -> usage in the current day and month.
+    :param budgets: Map of provider -> (daily credit budget, monthly credit budget), None for no budget.
+    :param daily: The usage per provider per day, most recent first.
+    """
+    table = Table(title="API Usage (UTC)", box=box.HEAVY_HEAD)
+    table.add_column("Provider", style="bold")
+    table.add_column("Calls Today", justify="right")
+    table.add_column("Credits Today", justify="right")
+    table.add_column("Calls Month", justify="right")
+    table.add_column("Credits Month", justify="right")
+    for provider, usage in totals.items():
+        daily_budget, monthly_budget = budgets.get(provider, (None, None))
+        table.add_row(
+            provider,
+            f"{usage.day_calls:,}",
+            _format_budget_usage(usage.day_credits, daily_budget),
+            f"{usage.month_calls:,}",
+            _format_budget_usage(usage.month_credits, monthly_budget),
+        )
+    _console.print(table)
+
+    if not daily:
+        _console.print("[dim]no API usage recorded in this period[/dim]")
+        return
+
+    daily_table = Table(title="Daily Usage", box=box.SIMPLE_HEAD)
+    daily_table.add_column("Day")
+    daily_table.add_column("Provider")
+    daily_table.add_column("Calls", justify="right")
+    daily_table.add_column("Credits", justify="right")
+    for row in daily:
+        daily_table.add_row(row.day, row.provider, f"{row.calls:,}", f"{row.credits:,}")
+    _console.print(daily_table)
+
+
+def _format_budget_usage(used: int, budget: Optional[int]) -> str:
+    """
+    Formats credits used against a budget, highlighted once the budget is nearly spent.
+
+    :param used: The credits used.
+    :param budget: The credit budget (None for no budget).
+    :return: The formatted usage.
+    """
+    if not budget:
+        return f"{used:,}"
+
+    text = f"{used:,}/{budget:,} ({used / budget * 100:.0f}%)"
+    if used >= budget:
+        return f"[red]{text}[/red]"
+    if used >= budget * USAGE_BUDGET_SOFT_LIMIT:
+        return f"[color(208)]{text}[/color(208)]"
+    return text
+
+
+def format_loadtest_output(provider: str, mode: str, result: "LoadTestResult") -> None:
+    """
+    Renders the throughput and latency percentiles of a load test, and its errors.
+
+    :param provider: The API provider whose client was tested.
+    :param mode: The load the test was run at (e.g. '8 worker(s)').
+    :param result: The load test result.
+    """
+    table = Table(title=f"Load Test: {provider} ({mode})", box=box.HEAVY_HEAD)
+    table.add_column("Requests", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("Succeeded/s", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+    table.add_column("Max", justify="right")
+    failed = f"{result.failed:,} ({result.failed / result.requests * 100:.1f}%)" if result.requests else "0"
+    table.add_row(
+        f"{result.requests:,}",
+        f"[red]{failed}[/red]" if result.failed else failed,
+        f"{result.duration:.2f}s",
+        f"{result.throughput:,.1f}/s",
+        *(f"{result.percentile(percent) * 1000:,.1f}ms" for percent in (50, 95, 99, 100)),
+    )
+    _console.print(table)
+
+    if result.errors:
+        error_table = Table(title="Errors", box=box.SIMPLE_HEAD)
+        error_table.add_column("Count", justify="right")
+        error_table.add_column("Error")
+        for error, count in result.errors.most_common():
+            error_table.add_row(f"{count:,}", error)
+        _console.print(error_table)
+
+
+def format_portfolio_history_output(summaries: List["ValuationSummary"]) -> None:
+    """
+    Renders aggregated portfolio valuations, one row per portfolio and period.
+
+    :param summaries: The aggregated valuations.
+    """
+    table = Table(title="Portfolio History", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Portfolio", style="bold")
+    table.add_column("Period")
+    table.add_column("Samples", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("Avg", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Last", justify="right")
+
+    for summary in summaries:
+        symbol = _get_currency_symbol(summary.currency)
+        table.add_row(
+            Path(summary.portfolio).name,
+            summary.period,
+            str(summary.samples),
+            _format_value(summary.min_value, symbol),
+            _format_value(summary.avg_value, symbol),
+            _format_value(summary.max_value, symbol),
+            _format_value(summary.last_value, symbol),
+        )
+
+    _console.print(table)
+
+
+def format_price_history_output(ticker: str, points: List["PricePoint"], currency_code: str, limit: int) -> None:
+    """
+    Renders the most recent price history points as an OHLCV table.
+
+    :param ticker: The cryptocurrency ticker.
+    :param points: The price points, sorted by timestamp.
+    :param currency_code: The fiat currency code.
+    :param limit: The maximum number of (most recent) points to display.
+    """
+    if not points:
+        _console.print(f"❌ No price history available for ${ticker}")
+        return
+
+    currency_code = currency_code.upper()
+    symbol = _get_currency_symbol(currency_code)
+    shown = points[-limit:]
+
+    table = Table(title=f"${ticker} Price History ({currency_code})", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Time", style="bold")
+    for column in ("Open", "High", "Low", "Close", "Volume"):
+        table.add_column(column, justify="right")
+
+    for point in shown:
+        table.add_row(
+            datetime.fromtimestamp(point.timestamp).strftime(DATE_TIME_FORMAT),
+            _format_value(point.open, symbol),
+            _format_value(point.high, symbol),
+            _format_value(point.low, symbol),
+            _format_value(point.close, symbol),
+            _format_large_number(point.volume, currency_code),
+        )
+
+    _console.print(table)
+    if len(shown) < len(points):
+        _console.print(f"[dim]showing the latest {len(shown)} of {len(points)} point(s)[/dim]")
+
+
+def format_analytics_output(result: "AnalyticsResult", samples: int, interval: str) -> None:
+    """
+    Renders per-ticker analytics, the correlation matrix and (if weighted) a portfolio summary.
+
+    :param result: The computed analytics.
+    :param samples: The number of aligned samples the metrics were computed over.
+    :param interval: The sampling interval name.
+    """
+    table = Table(title=f"Analytics ({samples} {interval} samples)", box=box.HEAVY_HEAD, show_footer=False)
+    table.add_column("Asset", style="bold")
+    table.add_column("Return", justify="right")
+    table.add_column("Volatility (ann.)", justify="right")
+    table.add_column("Latest Rolling Vol.", justify="right")
+    table.add_column("Max Drawdown", justify="right")
+    if result.weights is not None:
+        table.add_column("Weight", justify="right")
+
+    latest_rolling = result.rolling_volatility[-1] if len(result.rolling_volatility) else None
+    for i, ticker in enumerate(result.tickers):
+        row = [
+            ticker,
+            _format_percentage_change(result.total_return[i] * 100),
+            f"{result.volatility[i] * 100:.2f}%",
+            f"{latest_rolling[i] * 100:.2f}%" if latest_rolling is not None else "-",
+            f"{result.max_drawdown[i] * 100:.2f}%",
+        ]
+        if result.weights is not None:
+            row.append(f"{result.weights[i] * 100:.2f}%")
+        table.add_row(*row)
+    _console.print(table)
+
+    if 1 < len(result.tickers) <= ANALYTICS_MAX_CORRELATION_COLUMNS:
+        corr_table = Table(title="Correlation Matrix", box=box.SIMPLE_HEAD, show_footer=False)
+        corr_table.add_column("", style="bold")
+        for ticker in result.tickers:
+            corr_table.add_column(ticker, justify="right")
+        for i, ticker in enumerate(result.tickers):
+            corr_table.add_row(ticker, *(f"{c:.2f}" for c in result.correlation[i]))
+        _console.print(corr_table)
+    elif len(result.tickers) > ANALYTICS_MAX_CORRELATION_COLUMNS:
+        _console.print(f"[dim]correlation matrix omitted for more than {ANALYTICS_MAX_CORRELATION_COLUMNS} tickers[/dim]")
+
+    if result.portfolio_return is not None:
+        summary = (
+            f"Return:       {_format_percentage_change(result.portfolio_return * 100)}\n"
+            f"Volatility:   {result.portfolio_volatility * 100:.2f}% (ann.)\n"
+            f"Max Drawdown: {result.portfolio_max_drawdown * 100:.2f}%"
+        )
+        _console.print(Panel(summary, title="Portfolio Analytics", expand=False))
+
+
+def format_alert_output(event: "AlertEvent") -> str:
+    """
+    Formats a triggered alert.
+
+    :param event: The triggered alert.
+
+    :returns: Formatted output string.
+    """
+    rule = event.rule
+    if rule.field == "price":
+        value_str = _format_price(event.value, _get_currency_symbol(rule.currency), rule.currency)
+    elif rule.field.endswith("_change"):
+        value_str = _format_percentage_change(event.value)
+    else:
+        value_str = _format_large_number(event.value, rule.currency)
+    return f"🔔 [bold]${rule.ticker}[/bold] {rule.field} {rule.operator} {rule.threshold:g}: now [bold cyan]{value_str}[/bold cyan] [dim](rule {rule.rule_id}: '{rule.text}')[/dim]"
+
+
+def _format_value(value: float, symbol: str) -> str:
+    """
+    Formats a fiat value to 2 decimal places with its currency symbol.
+
+    :param value: The value to format.
+    :param symbol: The fiat currency symbol.
+
+    :returns: The formatted value str.
+    """
+    if symbol in ("$", "¥"):
+        return f"{symbol}{value:,.2f}"
+    return f"{value:,.2f} {symbol}"
 
 
 def _format_large_number(number: float, currency_code: str) -> str:
@@ -171,12 +684,23 @@ def _format_large_number(number: float, currency_code: str) -> str:
     :param number: The number to format.
     :param currency_code: The currency code.
 
+    :returns: The formatted number as a str.
+    """
+    return f"{_format_compact_number(number)} ({currency_code})"
+
+
+def _format_compact_number(number: float) -> str:
+    """
+    Formats a number with units (K, M, B, T) and no currency.
+
+    :param number: The number to format.
+
     :returns: The formatted number as a str.
     """
     if number == 0:
-        return f"0 ({currency_code})"
+        return "0"
 
-    magnitude: int = int(math.floor(math.log10(abs(number)) / 3))
+    magnitude: int = max(0, int(math.floor(math.log10(abs(number)) / 3)))
     units: List[str] = ["", "K", "M", "B", "T"]
     unit: str = units[magnitude] if magnitude < len(units) else f"e{magnitude*3}"
     
@@ -189,7 +713,7 @@ def _format_large_number(number: float, currency_code: str) -> str:
     else:
         precision = PRECISION_LOW
     
-    return f"{scaled:,.{precision}f}{unit} ({currency_code})"
+    return f"{scaled:,.{precision}f}{unit}"
 
 
 def _format_percentage_change(change: float) -> str:
@@ -208,6 +732,36 @@ def _format_percentage_change(change: float) -> str:
         return f"{change:.2f}%"
 
 
+def _percentage_change_text(change: float) -> Text:
+    """
+    Builds a styled Text for a percentage change without going through markup.
+
+    :param change: The percentage change.
+
+    :returns: The styled percentage Text.
+    """
+    if change > 0:
+        return Text.assemble(("▲", "green"), f" {change:.2f}%")
+    elif change < 0:
+        return Text.assemble(("▼", "red"), f" {change:.2f}%")
+    else:
+        return Text(f"{change:.2f}%")
+
+
+def _format_age(seconds: float) -> str:
+    """
+    Formats an age in seconds using its largest whole unit (e.g. '45s', '12m', '3h', '2d').
+
+    :param seconds: The age in seconds.
+
+    :returns: The formatted age str.
+    """
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
 def _get_currency_symbol(currency: str) -> str:
     """
     Get the symbol corresponding to a fiat currency.
@@ -0,0 +1,133 @@
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Deque, List, Optional
+
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    KEY_POOL_AUTH_QUARANTINE,
+    KEY_POOL_AUTH_STATUS_CODES,
+    KEY_POOL_RATE_LIMIT_QUARANTINE,
+    KEY_POOL_RATE_LIMIT_STATUS_CODE,
+    KEY_POOL_RATE_WINDOW,
+)
+from crypto_fetch.exceptions import APIError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+@dataclass
+class _KeyState:
+    """Load and health of a single API key."""
+
+    key: str
+    in_flight: int = 0
+    requests: Deque[float] = field(default_factory=deque)
+    quarantined_until: float = 0.0
+
+
+class KeyPool:
+    """
+    Thread-safe pool of API keys for one provider. Each request goes to the least-loaded healthy key
+    (fewest requests in flight, then fewest in the last KEY_POOL_RATE_WINDOW seconds), and each key
+    makes at most `rate_limit` requests per window; when every healthy key is at its limit, acquire()
+    waits for the first one to free up. Keys rejected by the API are quarantined (see release()).
+    """
+
+    def __init__(self, provider: str, keys: List[str], rate_limit: Optional[int] = None):
+        """
+        :param provider: The API provider name (for messages).
+        :param keys: The validated API keys.
+        :param rate_limit: The maximum number of requests per key per KEY_POOL_RATE_WINDOW seconds (None for no limit).
+        """
+        self.provider = provider
+        self.rate_limit = rate_limit
+        self._states = [_KeyState(key) for key in keys]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def acquire(self) -> str:
+        """
+        Gets a key to make a request with. Release it with release() once the request is done.
+
+        :return: The API key.
+        :raises APIError: If every key is quarantined.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                healthy = [state for state in self._states if state.quarantined_until <= now]
+                if not healthy:
+                    retry_in = min(state.quarantined_until for state in self._states) - now
+                    raise APIError(f"All {len(self._states)} {self.provider} API key(s) are quarantined. Retry in {int(retry_in) + 1}s")
+
+                for state in healthy:
+                    while state.requests and state.requests[0] <= now - KEY_POOL_RATE_WINDOW:
+                        state.requests.popleft()
+                available = [state for state in healthy if not self.rate_limit or len(state.requests) < self.rate_limit]
+                if available:
+                    state = min(available, key=lambda s: (s.in_flight, len(s.requests)))
+                    state.in_flight += 1
+                    state.requests.append(now)
+                    return state.key
+
+                wait = min(state.requests[0] for state in healthy) + KEY_POOL_RATE_WINDOW - now
+
+            logger.debug("All %s API keys are at their rate limit. Waiting %.1fs", self.provider, wait)
+            time.sleep(max(wait, 0.01))
+
+    def release(self, key: str, status_code: Optional[int] = None, retry_after: Optional[str] = None) -> None:
+        """
+        Releases a key after a request. Keys rejected as unauthorized or out of credits are quarantined
+        for KEY_POOL_AUTH_QUARANTINE seconds, and rate limited keys for the Retry-After period (or
+        KEY_POOL_RATE_LIMIT_QUARANTINE seconds).
+
+        :param key: The key the request was made with.
+        :param status_code: The HTTP status of the response (None if no response was received).
+        :param retry_after: The Retry-After header of the response, if any.
+        """
+        with self._lock:
+            state = next((state for state in self._states if state.key == key), None)
+            if state is None:
+                return
+            state.in_flight = max(state.in_flight - 1, 0)
+
+            if status_code in KEY_POOL_AUTH_STATUS_CODES:
+                quarantine = float(KEY_POOL_AUTH_QUARANTINE)
+            elif status_code == KEY_POOL_RATE_LIMIT_STATUS_CODE:
+                delay = _parse_retry_after(retry_after)
+                quarantine = float(KEY_POOL_RATE_LIMIT_QUARANTINE) if delay is None else delay
+            else:
+                return
+
+            state.quarantined_until = time.monotonic() + quarantine
+            healthy = sum(1 for s in self._states if s.quarantined_until <= time.monotonic())
+        logger.warning("%s API key %s was rejected (status %s). Quarantined for %ss, %s of %s key(s) healthy",
+                       self.provider, mask_key(key), status_code, int(quarantine), healthy, len(self._states))
+
+
+def mask_key(key: str) -> str:
+    """
+    Masks an API key for logging.
+
+    :param key: The API key.
+    :return: The last four characters of the key, prefixed with '...'.
+    """
+    return f"...{key[-4:]}"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header given in seconds (HTTP dates are not used by the supported providers).
+
+    :param value: The header value.
+    :return: The delay in seconds, or None if missing or not a number.
+    """
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+import glob
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.client_factory import create_api_client
+from crypto_fetch.api.request_log import RequestLog
+from crypto_fetch.config.config import get_prefetch_portfolios
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    CONFIG_DEFAULTS_CURRENCY,
+    CONFIG_HEADER_DEFAULTS,
+    CONFIG_KEY_DEFAULTS_API_PROVIDER,
+    CONFIG_KEY_DEFAULTS_CURRENCY,
+    PREFETCH_DEFAULT_LEAD,
+    PREFETCH_REFRESH_AGE,
+    PROVIDER_COINMARKETCAP,
+)
+from crypto_fetch.exceptions import APIError, CommandError
+from crypto_fetch.portfolio.holdings_reader import read_holdings
+
+logger = logging.getLogger(CF_LOGGER)
+
+PrefetchKey = Tuple[str, str]
+
+
+class Prefetcher:
+    """
+    Warms the quote cache before quotes are usually needed. Ticker sets that the request log shows
+    are requested around the same time of day are fetched shortly before that time. The tickers of
+    the configured prefetch portfolios are fetched with them (in the default currency and provider),
+    or on every run while there is no request history yet.
+    """
+
+    def __init__(self, config: Dict[str, Any], request_log: Optional[RequestLog] = None):
+        """
+        :param config: The loaded config.
+        :param request_log: The request log to learn from.
+        """
+        self.config = config
+        self.request_log = request_log or RequestLog()
+        self.clients: Dict[str, BaseAPIClient] = {}
+
+    def plan(self, lead: int = PREFETCH_DEFAULT_LEAD, now: Optional[datetime] = None) -> Dict[PrefetchKey, List[str]]:
+        """
+        Gets the quotes that are expected to be needed within the lead time.
+
+        :param lead: How far ahead to look, in seconds.
+        :param now: The current time (defaults to now).
+        :return: Map of (provider, currency) -> tickers.
+        """
+        now = now or datetime.now()
+        plan: Dict[PrefetchKey, Dict[str, None]] = {}
+        for expected in self.request_log.get_expected(now, now + timedelta(seconds=lead)):
+            logger.debug("Expecting %s in '%s' from %s (requested on %s day(s))", expected.tickers, expected.currency, expected.provider, expected.days)
+            plan.setdefault((expected.provider, expected.currency), {}).update(dict.fromkeys(expected.tickers))
+
+        portfolio_tickers = self._get_portfolio_tickers()
+        if portfolio_tickers:
+            defaults: Dict[str, Any] = self.config.get(CONFIG_HEADER_DEFAULTS) or {}
+            key = (defaults.get(CONFIG_KEY_DEFAULTS_API_PROVIDER, PROVIDER_COINMARKETCAP),
+                   str(defaults.get(CONFIG_KEY_DEFAULTS_CURRENCY, CONFIG_DEFAULTS_CURRENCY)).upper())
+            if plan or self.request_log.is_empty():
+                plan.setdefault(key, {}).update(dict.fromkeys(portfolio_tickers))
+
+        return {key: list(tickers) for key, tickers in plan.items()}
+
+    def warm(self, plan: Dict[PrefetchKey, List[str]]) -> int:
+        """
+        Fetches the planned quotes into the quote cache with one request per provider and currency,
+        skipping quotes cached less than PREFETCH_REFRESH_AGE seconds ago. A failed request is logged
+        and the other requests still run.
+
+        :param plan: Map of (provider, currency) -> tickers.
+        :return: The number of quotes fetched.
+        """
+        fetched = 0
+        for (provider, currency), tickers in plan.items():
+            client = self._get_client(provider)
+            fresh = client.quote_cache.get(provider, currency, tickers, PREFETCH_REFRESH_AGE)
+            stale = [ticker for ticker in tickers if ticker not in fresh]
+            if not stale:
+                logger.debug("Cached quotes in '%s' from %s are fresh", currency, provider)
+                continue
+            try:
+                fetched += len(client.fetch_multiple_price_data(",".join(stale), currency))
+            except APIError as ex:
+                logger.warning("Failed to prefetch %s quote(s) in '%s' from %s: %s", len(stale), currency, provider, ex)
+        return fetched
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+        self.clients.clear()
+
+    def _get_client(self, provider: str) -> BaseAPIClient:
+        if provider not in self.clients:
+            self.clients[provider] = create_api_client(provider, self.config)
+        return self.clients[provider]
+
+    def _get_portfolio_tickers(self) -> List[str]:
+        """
+        Reads the tickers of the configured prefetch portfolios. Files are re-read on every call,
+        so changes to them are picked up; files that cannot be read are logged and skipped.
+
+        :return: The tickers.
+        """
+        tickers: Dict[str, None] = {}
+        for pattern in get_prefetch_portfolios():
+            pattern = str(Path(pattern).expanduser())
+            paths = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+            for path in paths:
+                try:
+                    tickers.update(dict.fromkeys(read_holdings(Path(path)).totals))
+                except (CommandError, OSError) as ex:
+                    logger.warning("Skipping prefetch portfolio '%s': %s", path, ex)
+        return list(tickers)
@@ -0,0 +1,159 @@
+from contextlib import closing
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH
+from crypto_fetch.constants import CF_LOGGER, RESPONSE_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(CF_LOGGER)
+
+QUOTE_CACHE_DB_PATH: Path = CONFIG_DIRECTORY_PATH / "quotes.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    provider   TEXT    NOT NULL,
+    currency   TEXT    NOT NULL,
+    ticker     TEXT    NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    data       TEXT    NOT NULL,
+    PRIMARY KEY (provider, currency, ticker)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS responses (
+    provider      TEXT    NOT NULL,
+    request_key   TEXT    NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    fetched_at    INTEGER NOT NULL,
+    data          TEXT    NOT NULL,
+    PRIMARY KEY (provider, request_key)
+) WITHOUT ROWID;
+"""
+
+CachedQuote = Tuple[int, Dict[str, float]]
+
+
+class CachedResponse(NamedTuple):
+    """A response body stored with the validators needed to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Dict[str, Any]
+
+
+class QuoteCache:
+    """
+    SQLite (WAL mode) store of the last quote fetched for each (provider, currency, ticker), and of
+    the last response (with its ETag/Last-Modified validators) for each (provider, request). Only the
+    RESPONSE_CACHE_MAX_ENTRIES most recently fetched responses are kept per provider.
+    A short-lived connection is used per call so the cache can be shared with background refreshes.
+    """
+
+    def __init__(self, db_path: Path = QUOTE_CACHE_DB_PATH):
+        """
+        :param db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._initialized = False
+
+    def get(self, provider: str, currency_code: str, tickers: List[str], max_age: Optional[int] = None) -> Dict[str, CachedQuote]:
+        """
+        Gets the last persisted quotes for some tickers.
+
+        :param provider: The API provider name.
+        :param currency_code: The uppercase fiat currency code.
+        :param tickers: The uppercase tickers.
+        :param max_age: Only return quotes fetched at most this many seconds ago (any age if None).
+        :return: Map of ticker -> (fetched at unix timestamp, quote). Tickers without a usable quote are omitted.
+        """
+        if not tickers:
+            return {}
+
+        sql = f"SELECT ticker, fetched_at, data FROM quotes WHERE provider = ? AND currency = ? AND ticker IN ({', '.join('?' for _ in tickers)})"
+        params: List = [provider, currency_code, *tickers]
+        if max_age is not None:
+            sql += " AND fetched_at >= ?"
+            params.append(int(time.time()) - max_age)
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(sql, params).fetchall()
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read cached quotes: %s", ex)
+            return {}
+        return {ticker: (fetched_at, json.loads(data)) for ticker, fetched_at, data in rows}
+
+    def put(self, provider: str, currency_code: str, quotes: Dict[str, Dict[str, float]], fetched_at: Optional[int] = None) -> None:
+        """
+        Persists quotes, replacing any previous quote for the same ticker.
+        A failure to write is logged but not raised.
+
+        :param provider: The API provider name.
+        :param currency_code: The uppercase fiat currency code.
+        :param quotes: Map of ticker -> quote.
+        :param fetched_at: When the quotes were fetched as a unix timestamp (defaults to now).
+        """
+        if not quotes:
+            return
+
+        fetched_at = fetched_at if fetched_at is not None else int(time.time())
+        rows = [(provider, currency_code, ticker, fetched_at, json.dumps(quote)) for ticker, quote in quotes.items()]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO quotes VALUES (?, ?, ?, ?, ?)", rows)
+            logger.debug("Persisted %s quote(s) for provider '%s' in '%s'", len(rows), provider, currency_code)
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to persist quotes: %s", ex)
+
+    def get_response(self, provider: str, request_key: str) -> Optional[CachedResponse]:
+        """
+        Gets the last persisted response for a request.
+
+        :param provider: The API provider name.
+        :param request_key: Identifies the request (endpoint and parameters).
+        :return: The response and its validators, or None if there is none.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified, data FROM responses WHERE provider = ? AND request_key = ?",
+                    (provider, request_key),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read cached response: %s", ex)
+            return None
+        return CachedResponse(row[0], row[1], json.loads(row[2])) if row else None
+
+    def put_response(self, provider: str, request_key: str, response: CachedResponse) -> None:
+        """
+        Persists a response and its validators, replacing any previous response for the same request and
+        dropping the provider's oldest responses beyond RESPONSE_CACHE_MAX_ENTRIES. A failure to write is logged but not raised.
+
+        :param provider: The API provider name.
+        :param request_key: Identifies the request (endpoint and parameters).
+        :param response: The response and its validators.
+        """
+        row = (provider, request_key, response.etag, response.last_modified, int(time.time()), json.dumps(response.data))
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", row)
+                conn.execute(
+                    "DELETE FROM responses WHERE provider = ? AND request_key NOT IN "
+                    "(SELECT request_key FROM responses WHERE provider = ? ORDER BY fetched_at DESC LIMIT ?)",
+                    (provider, provider, RESPONSE_CACHE_MAX_ENTRIES),
+                )
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to persist response: %s", ex)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
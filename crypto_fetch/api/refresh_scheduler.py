@@ -0,0 +1,206 @@
+from collections import deque
+from dataclasses import dataclass
+import logging
+import math
+import time
+from typing import Deque, Dict, List, Optional, Tuple
+
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    REFRESH_ACCESS_HALF_LIFE,
+    REFRESH_BUDGET_WINDOW,
+    REFRESH_CHUNK_SIZE,
+    REFRESH_COALESCE_FRACTION,
+    REFRESH_DEFAULT_REQUEST_BUDGET,
+    REFRESH_MAX_INTERVAL_FACTOR,
+    REFRESH_MIN_INTERVAL_FACTOR,
+    REFRESH_VOLATILITY_REFERENCE,
+)
+
+logger = logging.getLogger(CF_LOGGER)
+
+TickerKey = Tuple[str, str]
+RefreshRequest = Tuple[str, List[str]]
+
+
+@dataclass
+class _TickerState:
+    """Refresh state of a single (ticker, currency)."""
+
+    interval: float
+    next_due: float
+    accesses: float = 0.0
+    accessed_at: float = 0.0
+    price: Optional[float] = None
+    refreshed_at: Optional[float] = None
+
+
+class RefreshScheduler:
+    """
+    Schedules quote refreshes per (ticker, currency) for long-running polling. Each ticker's interval
+    is the base interval divided by its heat: its recent volatility (the largest of the 1h change, the
+    24h change scaled to an hour, and the move since its last refresh) relative to
+    REFRESH_VOLATILITY_REFERENCE, boosted by how often it has recently been accessed. Quiet tickers
+    such as stablecoins drift towards REFRESH_MAX_INTERVAL_FACTOR times the base interval, volatile
+    or hot ones towards REFRESH_MIN_INTERVAL_FACTOR times it.
+
+    Due tickers are grouped per currency into requests of up to `chunk_size` tickers (topped up with
+    tickers that are nearly due), and at most `request_budget` requests are made per REFRESH_BUDGET_WINDOW
+    seconds; the most overdue tickers are refreshed first.
+    """
+
+    def __init__(self, base_interval: float, request_budget: int = REFRESH_DEFAULT_REQUEST_BUDGET,
+                 chunk_size: int = REFRESH_CHUNK_SIZE):
+        """
+        :param base_interval: The interval in seconds for a ticker of reference volatility.
+        :param request_budget: The maximum number of requests per REFRESH_BUDGET_WINDOW seconds.
+        :param chunk_size: The maximum number of tickers per request.
+        """
+        self.base_interval = base_interval
+        self.request_budget = request_budget
+        self.chunk_size = chunk_size
+        self._states: Dict[TickerKey, _TickerState] = {}
+        self._requests: Deque[float] = deque()
+
+    def add(self, ticker: str, currency_code: str, now: Optional[float] = None) -> None:
+        """
+        Starts scheduling a ticker. It is due immediately.
+
+        :param ticker: The cryptocurrency ticker symbol.
+        :param currency_code: The fiat currency code.
+        :param now: The current time (defaults to now).
+        """
+        now = time.time() if now is None else now
+        self._states.setdefault((ticker.upper(), currency_code.upper()), _TickerState(self.base_interval, now))
+
+    def record_access(self, ticker: str, currency_code: str, count: float = 1.0, now: Optional[float] = None) -> None:
+        """
+        Records that a ticker's quote was used, making it hotter. Accesses decay with a half-life of
+        REFRESH_ACCESS_HALF_LIFE seconds.
+
+        :param ticker: The cryptocurrency ticker symbol.
+        :param currency_code: The fiat currency code.
+        :param count: The number of accesses.
+        :param now: The current time (defaults to now).
+        """
+        state = self._states.get((ticker.upper(), currency_code.upper()))
+        if state is None:
+            return
+        now = time.time() if now is None else now
+        state.accesses = self._get_accesses(state, now) + count
+        state.accessed_at = now
+
+    def due(self, now: Optional[float] = None) -> List[RefreshRequest]:
+        """
+        Gets the requests to make now, and counts them against the request budget.
+
+        :param now: The current time (defaults to now).
+        :return: List of (currency, tickers) requests, most overdue first.
+        """
+        now = time.time() if now is None else now
+        while self._requests and self._requests[0] <= now - REFRESH_BUDGET_WINDOW:
+            self._requests.popleft()
+
+        by_currency: Dict[str, List[Tuple[float, str]]] = {}
+        for (ticker, currency), state in self._states.items():
+            if state.next_due <= now:
+                by_currency.setdefault(currency, []).append((state.next_due, ticker))
+
+        requests: List[Tuple[float, RefreshRequest]] = []
+        for currency, due in by_currency.items():
+            due.sort()
+            tickers = [ticker for _, ticker in due]
+            chunks = [tickers[i:i + self.chunk_size] for i in range(0, len(tickers), self.chunk_size)]
+            # Top up the last request with tickers that are nearly due, as they cost no extra request
+            room = self.chunk_size - len(chunks[-1])
+            if room > 0:
+                chunks[-1] += self._get_nearly_due(currency, now, room)
+            for i, chunk in enumerate(chunks):
+                requests.append((due[i * self.chunk_size][0], (currency, chunk)))
+
+        requests.sort(key=lambda request: request[0])
+        allowed = max(self.request_budget - len(self._requests), 0)
+        if len(requests) > allowed:
+            logger.debug("Refresh budget of %s request(s) per %ss reached. Deferring %s request(s)",
+                         self.request_budget, REFRESH_BUDGET_WINDOW, len(requests) - allowed)
+        self._requests.extend(now for _ in range(min(allowed, len(requests))))
+        return [request for _, request in requests[:allowed]]
+
+    def update(self, currency_code: str, tickers: List[str], data: Dict[str, Dict[str, float]], now: Optional[float] = None) -> None:
+        """
+        Reschedules refreshed tickers from their new quotes. Tickers without a quote (or whose
+        request failed, with empty data) keep their interval.
+
+        :param currency_code: The fiat currency code of the request.
+        :param tickers: The tickers that were requested.
+        :param data: Map of ticker -> parsed quote fields returned for the request.
+        :param now: The current time (defaults to now).
+        """
+        now = time.time() if now is None else now
+        currency_code = currency_code.upper()
+        for ticker in tickers:
+            state = self._states.get((ticker, currency_code))
+            if state is None:
+                continue
+            quote = data.get(ticker)
+            if quote is not None:
+                state.interval = self._get_interval(state, quote, now)
+                state.price = quote.get("price") or state.price
+                state.refreshed_at = now
+            state.next_due = now + state.interval
+
+        if logger.isEnabledFor(logging.DEBUG):
+            intervals = {ticker: round(self._states[(ticker, currency_code)].interval) for ticker in tickers if (ticker, currency_code) in self._states}
+            logger.debug("Refresh intervals in '%s': %s", currency_code, intervals)
+
+    def next_wakeup(self, now: Optional[float] = None) -> float:
+        """
+        Gets when the next request can be made: when the next ticker is due, or when the request
+        budget frees up if it is spent.
+
+        :param now: The current time (defaults to now).
+        :return: The time as a unix timestamp.
+        """
+        now = time.time() if now is None else now
+        wakeup = min((state.next_due for state in self._states.values()), default=now + self.base_interval)
+        if len(self._requests) >= self.request_budget:
+            wakeup = max(wakeup, self._requests[len(self._requests) - self.request_budget] + REFRESH_BUDGET_WINDOW)
+        return wakeup
+
+    def _get_nearly_due(self, currency_code: str, now: float, limit: int) -> List[str]:
+        """
+        Gets tickers that are not yet due but will be within REFRESH_COALESCE_FRACTION of their interval.
+
+        :param currency_code: The fiat currency code.
+        :param now: The current time.
+        :param limit: The maximum number of tickers.
+        :return: The tickers, soonest due first.
+        """
+        nearly_due = sorted(
+            (state.next_due, ticker) for (ticker, currency), state in self._states.items()
+            if currency == currency_code and now < state.next_due <= now + state.interval * REFRESH_COALESCE_FRACTION
+        )
+        return [ticker for _, ticker in nearly_due[:limit]]
+
+    def _get_interval(self, state: _TickerState, quote: Dict[str, float], now: float) -> float:
+        """
+        Gets the refresh interval of a ticker from its latest quote.
+
+        :param state: The ticker's refresh state (before applying the quote).
+        :param quote: The ticker's latest quote.
+        :param now: The current time.
+        :return: The interval in seconds.
+        """
+        moves = [abs(quote.get("1h_change", 0.0)), abs(quote.get("24h_change", 0.0)) / math.sqrt(24)]
+        price = quote.get("price")
+        if price and state.price and state.refreshed_at is not None and now > state.refreshed_at:
+            hours = (now - state.refreshed_at) / 3600
+            moves.append(abs(price / state.price - 1) * 100 / math.sqrt(hours))
+
+        heat = max(moves) / REFRESH_VOLATILITY_REFERENCE * (1 + math.log1p(self._get_accesses(state, now)))
+        interval = self.base_interval / heat if heat > 0 else math.inf
+        return min(max(interval, self.base_interval * REFRESH_MIN_INTERVAL_FACTOR), self.base_interval * REFRESH_MAX_INTERVAL_FACTOR)
+
+    @staticmethod
+    def _get_accesses(state: _TickerState, now: float) -> float:
+        return state.accesses * 0.5 ** ((now - state.accessed_at) / REFRESH_ACCESS_HALF_LIFE)
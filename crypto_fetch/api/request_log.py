@@ -0,0 +1,141 @@
+from contextlib import closing
+from datetime import datetime, timedelta
+import logging
+from pathlib import Path
+import sqlite3
+from typing import Iterable, List, NamedTuple, Optional
+
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH
+from crypto_fetch.constants import CF_LOGGER, PREFETCH_HISTORY_DAYS, PREFETCH_MIN_DAYS, PREFETCH_SLOT_MINUTES
+
+logger = logging.getLogger(CF_LOGGER)
+
+REQUEST_LOG_DB_PATH: Path = CONFIG_DIRECTORY_PATH / "requests.db"
+
+SLOTS_PER_DAY: int = 24 * 60 // PREFETCH_SLOT_MINUTES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    provider TEXT    NOT NULL,
+    currency TEXT    NOT NULL,
+    tickers  TEXT    NOT NULL,
+    day      TEXT    NOT NULL,
+    slot     INTEGER NOT NULL,
+    PRIMARY KEY (provider, currency, tickers, slot, day)
+) WITHOUT ROWID;
+"""
+
+
+class ExpectedRequest(NamedTuple):
+    """A ticker set that is usually requested around a time of day."""
+
+    provider: str
+    currency: str
+    tickers: List[str]
+    days: int
+
+
+class RequestLog:
+    """
+    SQLite (WAL mode) log of which ticker sets are requested, per provider and currency, in which
+    PREFETCH_SLOT_MINUTES slot of the (local) day. Each set is logged at most once per slot per day,
+    so a set's count for a slot is the number of days it was requested then.
+    """
+
+    def __init__(self, db_path: Path = REQUEST_LOG_DB_PATH):
+        """
+        :param db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._initialized = False
+
+    def record(self, provider: str, currency_code: str, tickers: Iterable[str], when: Optional[datetime] = None) -> None:
+        """
+        Records a request. Days older than PREFETCH_HISTORY_DAYS are pruned.
+        A failure to write is logged but not raised.
+
+        :param provider: The API provider name.
+        :param currency_code: The fiat currency code.
+        :param tickers: The requested tickers.
+        :param when: When the request was made (defaults to now).
+        """
+        when = _get_local_time(when)
+        ticker_set = ",".join(sorted({t.upper() for t in tickers}))
+        if not ticker_set:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO requests VALUES (?, ?, ?, ?, ?)",
+                    (provider, currency_code.upper(), ticker_set, when.strftime("%Y-%m-%d"), get_slot(when)),
+                )
+                conn.execute("DELETE FROM requests WHERE day < ?", (_get_first_day(when),))
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to record request for prefetching: %s", ex)
+
+    def get_expected(self, start: datetime, end: datetime) -> List[ExpectedRequest]:
+        """
+        Gets the ticker sets that were requested between the times of day of start and end on at least
+        PREFETCH_MIN_DAYS of the last PREFETCH_HISTORY_DAYS days.
+
+        :param start: The start of the time window.
+        :param end: The end of the time window (at most a day after start).
+        :return: The expected requests, most regular first.
+        """
+        start, end = _get_local_time(start), _get_local_time(end)
+        if end - start >= timedelta(days=1):
+            slots = list(range(SLOTS_PER_DAY))
+        else:
+            first = get_slot(start)
+            slots = [(first + i) % SLOTS_PER_DAY for i in range((get_slot(end) - first) % SLOTS_PER_DAY + 1)]
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT provider, currency, tickers, COUNT(DISTINCT day) AS days FROM requests "
+                    f"WHERE day >= ? AND slot IN ({','.join('?' * len(slots))}) "
+                    f"GROUP BY provider, currency, tickers HAVING days >= ? ORDER BY days DESC",
+                    (_get_first_day(start), *slots, PREFETCH_MIN_DAYS),
+                ).fetchall()
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read request history for prefetching: %s", ex)
+            return []
+        return [ExpectedRequest(provider, currency, tickers.split(","), days) for provider, currency, tickers, days in rows]
+
+    def is_empty(self) -> bool:
+        """
+        :return: Whether no requests have been recorded (or the log cannot be read).
+        """
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute("SELECT 1 FROM requests LIMIT 1").fetchone() is None
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read request history for prefetching: %s", ex)
+            return True
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+
+def get_slot(when: datetime) -> int:
+    """
+    Gets the slot of the day of a time.
+
+    :param when: The (local) time.
+    :return: The slot, from 0 to SLOTS_PER_DAY - 1.
+    """
+    return (when.hour * 60 + when.minute) // PREFETCH_SLOT_MINUTES
+
+
+def _get_local_time(when: Optional[datetime] = None) -> datetime:
+    return (when or datetime.now()).astimezone()
+
+
+def _get_first_day(when: datetime) -> str:
+    return (when - timedelta(days=PREFETCH_HISTORY_DAYS)).strftime("%Y-%m-%d")
@@ -0,0 +1,109 @@
+from abc import ABC, abstractmethod
+import importlib.util
+import json
+import logging
+from typing import Any, Dict, Mapping, NamedTuple
+
+import requests  # type: ignore
+
+from crypto_fetch.constants import CF_LOGGER, HTTP_BACKEND_HTTP2
+
+try:
+    import httpx  # type: ignore
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    httpx = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+# Both backends decode brotli responses when a brotli package is installed
+ACCEPT_ENCODING: str = "gzip, deflate, br" if any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi")) else "gzip, deflate"
+
+
+class HTTPResponse(NamedTuple):
+    """A response received by a transport."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of an API client."""
+
+    @abstractmethod
+    def get(self, url: str, headers: Dict[str, str], params: Dict[str, Any], timeout: float) -> HTTPResponse:
+        """
+        Sends a GET request.
+
+        :param url: The request URL.
+        :param headers: The request headers.
+        :param params: The query parameters.
+        :param timeout: The timeout in seconds.
+        :return: The response.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Closes any open connections."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport using a requests session, so connections are reused across requests."""
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def get(self, url: str, headers: Dict[str, str], params: Dict[str, Any], timeout: float) -> HTTPResponse:
+        response = self.session.get(url=url, headers=headers, params=params, timeout=timeout)
+        return HTTPResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    HTTP/2 transport using httpx. Concurrent requests to the same host (e.g. market pages or
+    chunked quote fetches from a thread pool) are multiplexed over a single connection instead
+    of each needing its own TCP/TLS connection.
+    """
+
+    def __init__(self):
+        """
+        :raises ImportError: If httpx or its HTTP/2 support (h2) is not installed.
+        """
+        if httpx is None:
+            raise ImportError("httpx is not installed")
+        self.client = httpx.Client(http2=True)
+
+    def get(self, url: str, headers: Dict[str, str], params: Dict[str, Any], timeout: float) -> HTTPResponse:
+        response = self.client.get(url, headers=headers, params=params, timeout=timeout)
+        return HTTPResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def create_transport(backend: str) -> Transport:
+    """
+    Creates the transport for a configured HTTP backend. The HTTP/2 backend falls back
+    to requests if httpx (with HTTP/2 support) is not installed.
+
+    :param backend: The HTTP backend name.
+    :return: The transport.
+    """
+    if backend == HTTP_BACKEND_HTTP2:
+        try:
+            return HTTP2Transport()
+        except ImportError as ex:
+            logger.warning("HTTP/2 backend unavailable (%s). Install with: pip install 'httpx[http2]'. Falling back to requests", ex)
+    return RequestsTransport()
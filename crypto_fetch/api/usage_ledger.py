@@ -0,0 +1,266 @@
+import atexit
+from contextlib import closing
+from datetime import datetime, timezone
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import weakref
+
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH
+from crypto_fetch.constants import CF_LOGGER, USAGE_FLUSH_INTERVAL
+from crypto_fetch.exceptions import BudgetExceededError
+
+logger = logging.getLogger(CF_LOGGER)
+
+USAGE_LEDGER_DB_PATH: Path = CONFIG_DIRECTORY_PATH / "usage.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    provider TEXT    NOT NULL,
+    day      TEXT    NOT NULL,
+    calls    INTEGER NOT NULL,
+    credits  INTEGER NOT NULL,
+    PRIMARY KEY (provider, day)
+) WITHOUT ROWID;
+"""
+
+
+class UsageTotals(NamedTuple):
+    """API calls made and credits spent with a provider in the current day and month."""
+
+    day_calls: int
+    day_credits: int
+    month_calls: int
+    month_credits: int
+
+
+class DailyUsage(NamedTuple):
+    """API calls made and credits spent with a provider on one day."""
+
+    provider: str
+    day: str
+    calls: int
+    credits: int
+
+
+class Reservation(NamedTuple):
+    """Credits reserved in the ledger for an API call that is being made."""
+
+    provider: str
+    day: str
+    credits: int
+
+
+class UsageLedger:
+    """
+    SQLite (WAL mode) ledger of the API calls made and credits spent per provider per day (UTC,
+    matching the providers' quota resets). Monthly usage is the sum of the month's days.
+    A short-lived connection is used per write or read so usage from concurrent processes is combined.
+
+    To keep the database off the request path, calls are counted in memory and written every
+    USAGE_FLUSH_INTERVAL seconds (and when the client is closed or the process exits), and totals are the stored totals, re-read at most
+    that often, plus the calls not yet written. Usage from other processes shows up within that delay.
+    A call is reserved before it is made (checked against the budgets and counted under one lock, so
+    concurrent calls cannot together exceed a budget) and settled with its actual cost once it completes.
+    """
+
+    def __init__(self, db_path: Path = USAGE_LEDGER_DB_PATH):
+        """
+        :param db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._initialized = False
+        self._lock = threading.Lock()
+        # (provider, day) -> [calls, credits] not written yet
+        self._pending: Dict[Tuple[str, str], List[int]] = {}
+        # (provider, day) -> (when read, stored totals)
+        self._stored: Dict[Tuple[str, str], Tuple[float, UsageTotals]] = {}
+        self._flushed_at = time.monotonic()
+        _LEDGERS.add(self)
+
+    def reserve(self, provider: str, credits: int, daily_budget: Optional[int] = None, monthly_budget: Optional[int] = None,
+                when: Optional[datetime] = None) -> Reservation:
+        """
+        Records an API call about to be made at the credits it is expected to cost, if that keeps the
+        provider within its budgets.
+
+        :param provider: The API provider name.
+        :param credits: The credits the call is expected to cost.
+        :param daily_budget: The provider's daily credit budget (None for no budget).
+        :param monthly_budget: The provider's monthly credit budget (None for no budget).
+        :param when: When the call is made (defaults to now).
+        :return: The reservation, to settle once the call completes.
+        :raises BudgetExceededError: If the call would exceed a budget.
+        """
+        day = _get_day(when)
+        with self._lock:
+            if daily_budget or monthly_budget:
+                usage = self._get_totals(provider, day)
+                for period, used, budget in (("daily", usage.day_credits, daily_budget), ("monthly", usage.month_credits, monthly_budget)):
+                    if budget and used + credits > budget:
+                        raise BudgetExceededError(f"Request would exceed the {period} {provider} credit budget ({used}/{budget} credits used)")
+            self._add_pending(provider, day, 1, credits)
+        return Reservation(provider, day, credits)
+
+    def settle(self, reservation: Reservation, credits: Optional[int]) -> None:
+        """
+        Settles a reservation once its API call completes. The call is written with the next flush.
+
+        :param reservation: The reservation.
+        :param credits: The credits the call cost, or None if it failed (the reservation is released).
+        """
+        with self._lock:
+            if credits is None:
+                self._add_pending(reservation.provider, reservation.day, -1, -reservation.credits)
+            else:
+                self._add_pending(reservation.provider, reservation.day, 0, credits - reservation.credits)
+            due = time.monotonic() - self._flushed_at >= USAGE_FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def _add_pending(self, provider: str, day: str, calls: int, credits: int) -> None:
+        """
+        Adds to the calls not written yet. The lock must be held.
+
+        :param provider: The API provider name.
+        :param day: The day (YYYY-MM-DD).
+        :param calls: The calls to add.
+        :param credits: The credits to add.
+        """
+        pending = self._pending.setdefault((provider, day), [0, 0])
+        pending[0] += calls
+        pending[1] += credits
+
+    def flush(self) -> None:
+        """Writes the recorded calls to the database. A failure to write is logged, and the calls are kept for the next flush."""
+        with self._lock:
+            self._flushed_at = time.monotonic()
+            if not self._pending:
+                return
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.executemany(
+                        "INSERT INTO usage VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (provider, day) DO UPDATE SET calls = calls + excluded.calls, credits = credits + excluded.credits",
+                        [(provider, day, calls, credits) for (provider, day), (calls, credits) in self._pending.items() if calls or credits],
+                    )
+            except (sqlite3.Error, OSError) as ex:
+                logger.warning("Failed to record API usage: %s", ex)
+                return
+            self._pending.clear()
+            # The stored totals read before now do not include what was just written
+            self._stored.clear()
+
+    def get_totals(self, provider: str, when: Optional[datetime] = None) -> UsageTotals:
+        """
+        Gets the usage of a provider in the current day and month.
+
+        :param provider: The API provider name.
+        :param when: The day to get the usage for (defaults to today).
+        :return: The usage totals (only the calls not written yet if the database cannot be read).
+        """
+        with self._lock:
+            return self._get_totals(provider, _get_day(when))
+
+    def _get_totals(self, provider: str, day: str) -> UsageTotals:
+        """
+        Gets the usage of a provider on a day and in its month: the stored totals plus the calls not
+        written yet. The lock must be held.
+
+        :param provider: The API provider name.
+        :param day: The day (YYYY-MM-DD).
+        :return: The usage totals.
+        """
+        read_at, stored = self._stored.get((provider, day), (0.0, None))
+        if stored is None or time.monotonic() - read_at >= USAGE_FLUSH_INTERVAL:
+            stored = self._read_totals(provider, day)
+            self._stored[(provider, day)] = (time.monotonic(), stored)
+
+        day_calls, day_credits = self._pending.get((provider, day), (0, 0))
+        month_calls = month_credits = 0
+        for (pending_provider, pending_day), (calls, credits) in self._pending.items():
+            if pending_provider == provider and pending_day[:7] == day[:7] and pending_day <= day:
+                month_calls += calls
+                month_credits += credits
+
+        return UsageTotals(stored.day_calls + day_calls, stored.day_credits + day_credits,
+                           stored.month_calls + month_calls, stored.month_credits + month_credits)
+
+    def _read_totals(self, provider: str, day: str) -> UsageTotals:
+        """
+        Reads the stored usage of a provider on a day and in its month.
+
+        :param provider: The API provider name.
+        :param day: The day (YYYY-MM-DD).
+        :return: The usage totals (zero if they cannot be read).
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT SUM(CASE WHEN day = ? THEN calls ELSE 0 END), SUM(CASE WHEN day = ? THEN credits ELSE 0 END), "
+                    "SUM(calls), SUM(credits) FROM usage WHERE provider = ? AND day >= ? AND day <= ?",
+                    (day, day, provider, f"{day[:7]}-01", day),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read API usage: %s", ex)
+            return UsageTotals(0, 0, 0, 0)
+        return UsageTotals(*(value or 0 for value in row))
+
+    def get_daily_usage(self, since: str, provider: Optional[str] = None) -> List[DailyUsage]:
+        """
+        Gets the usage per provider per day.
+
+        :param since: The first day (YYYY-MM-DD) to include.
+        :param provider: Only include this provider (all providers if None).
+        :return: The usage, most recent day first.
+        """
+        self.flush()
+        sql = "SELECT provider, day, calls, credits FROM usage WHERE day >= ?"
+        params: List = [since]
+        if provider is not None:
+            sql += " AND provider = ?"
+            params.append(provider)
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(f"{sql} ORDER BY day DESC, provider", params).fetchall()
+        except (sqlite3.Error, OSError) as ex:
+            logger.warning("Failed to read API usage: %s", ex)
+            return []
+        return [DailyUsage(*row) for row in rows]
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+
+def _get_day(when: Optional[datetime] = None) -> str:
+    """
+    Gets the UTC day of a time.
+
+    :param when: The time (defaults to now).
+    :return: The day as YYYY-MM-DD.
+    """
+    return (when or datetime.now(timezone.utc)).astimezone(timezone.utc).strftime("%Y-%m-%d")
+
+
+# Ledgers still in use, so the calls they have not written yet are written at exit. Held weakly, so a
+# ledger (and the calls it has buffered) is not kept alive for the whole process by the exit hook
+_LEDGERS: "weakref.WeakSet[UsageLedger]" = weakref.WeakSet()
+
+
+def _flush_ledgers() -> None:
+    """Writes the recorded calls of every ledger still in use."""
+    for ledger in list(_LEDGERS):
+        ledger.flush()
+
+
+atexit.register(_flush_ledgers)
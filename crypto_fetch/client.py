@@ -0,0 +1,249 @@
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.client_factory import create_api_client
+from crypto_fetch.commands.command_utils import validate_currency, validate_provider, validate_tickers
+from crypto_fetch.config.config import load_api_config_from_file
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    CONFIG_DEFAULTS_CURRENCY,
+    CONFIG_DEFAULTS_FX_BASE_CURRENCY,
+    CONFIG_DEFAULTS_FX_RATES_TTL,
+    CONFIG_HEADER_DEFAULTS,
+    CONFIG_KEY_DEFAULTS_API_PROVIDER,
+    CONFIG_KEY_DEFAULTS_CURRENCY,
+    CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY,
+    CONFIG_KEY_DEFAULTS_FX_RATES_TTL,
+    PROVIDER_COINMARKETCAP,
+)
+from crypto_fetch.exceptions import APIError, CommandError
+from crypto_fetch.portfolio.holdings_reader import read_holdings
+from crypto_fetch.rates.cross_rates import cross_rate
+from crypto_fetch.rates.fx import FXConverter
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+@dataclass(frozen=True)
+class Quote:
+    """The latest quote for a cryptocurrency."""
+
+    ticker: str
+    currency: str
+    price: float
+    change_24h: float
+    market_cap: float
+    volume_24h: float
+    change_1h: Optional[float] = None
+    change_7d: Optional[float] = None
+    age: Optional[float] = None
+
+    @classmethod
+    def from_price_data(cls, ticker: str, currency: str, data: Dict[str, float]) -> "Quote":
+        """
+        Builds a quote from parsed price data.
+
+        :param ticker: The uppercase ticker.
+        :param currency: The uppercase fiat currency code.
+        :param data: The parsed price data for the ticker.
+        :return: The quote.
+        """
+        return cls(
+            ticker=ticker,
+            currency=currency,
+            price=data.get("price", 0.0),
+            change_24h=data.get("24h_change", 0.0),
+            market_cap=data.get("market_cap", 0.0),
+            volume_24h=data.get("24h_volume", 0.0),
+            change_1h=data.get("1h_change"),
+            change_7d=data.get("7d_change"),
+            age=data.get("age"),
+        )
+
+
+@dataclass(frozen=True)
+class Conversion:
+    """The result of converting an amount of a cryptocurrency."""
+
+    amount: float
+    ticker: str
+    target: str
+    rate: float
+    value: float
+
+
+@dataclass(frozen=True)
+class HoldingValue:
+    """The value of a single holding."""
+
+    ticker: str
+    amount: float
+    price: float
+    value: float
+
+
+@dataclass(frozen=True)
+class PortfolioValuation:
+    """The value of a set of holdings."""
+
+    currency: str
+    total_value: float
+    holdings: Dict[str, HoldingValue] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+
+class Client:
+    """
+    In-process Python API for crypto-fetch. A Client reads the config once and keeps one API client
+    (and so one HTTP session, history cache and quote cache) for its lifetime, so it should be
+    created once and reused.
+
+        with Client(currency="USD") as client:
+            quotes = client.prices(["BTC", "ETH"])
+            print(quotes["BTC"].price)
+    """
+
+    def __init__(self, provider: Optional[str] = None, currency: Optional[str] = None,
+                 config: Optional[Dict[str, Any]] = None, max_stale: Optional[int] = None):
+        """
+        :param provider: The API provider name (defaults to config).
+        :param currency: The default fiat currency code (defaults to config).
+        :param config: A config dict in the config file format (read from the config file if None).
+        :param max_stale: Serve cached quotes up to this many seconds old (see BaseAPIClient.max_stale).
+        :raises CommandError: If the provider or currency is not supported.
+        """
+        self.config: Dict[str, Any] = config if config is not None else load_api_config_from_file()
+        defaults: Dict[str, Any] = self.config.get(CONFIG_HEADER_DEFAULTS) or {}
+
+        self.provider = validate_provider(provider or defaults.get(CONFIG_KEY_DEFAULTS_API_PROVIDER, PROVIDER_COINMARKETCAP))
+        self.currency = validate_currency(currency or defaults.get(CONFIG_KEY_DEFAULTS_CURRENCY, CONFIG_DEFAULTS_CURRENCY))
+        self.api: BaseAPIClient = create_api_client(self.provider, self.config)
+        self.api.max_stale = max_stale
+        self._fx = FXConverter(
+            self.api,
+            base_currency=defaults.get(CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY, CONFIG_DEFAULTS_FX_BASE_CURRENCY),
+            ttl=defaults.get(CONFIG_KEY_DEFAULTS_FX_RATES_TTL, CONFIG_DEFAULTS_FX_RATES_TTL),
+        )
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session."""
+        self.api.close()
+
+    def prices(self, tickers: Union[str, Iterable[str]], currency: Optional[str] = None) -> Dict[str, Quote]:
+        """
+        Fetches the latest quotes for several cryptocurrencies in a single request.
+
+        :param tickers: The tickers, as an iterable or a comma-separated str.
+        :param currency: The fiat currency code (defaults to the client's currency).
+        :return: Map of ticker -> quote. Tickers the provider returned no data for are omitted.
+        :raises CommandError: If a ticker or the currency is not supported.
+        :raises APIError: If the quotes cannot be fetched.
+        """
+        ticker_list = _normalize_tickers(tickers)
+        currency = self._resolve_currency(currency)
+        data = self.api.fetch_multiple_price_data(",".join(ticker_list), currency)
+        return {t: Quote.from_price_data(t, currency, data[t]) for t in ticker_list if t in data}
+
+    def prices_in(self, tickers: Union[str, Iterable[str]], currencies: Iterable[str]) -> Dict[str, Dict[str, Quote]]:
+        """
+        Fetches the latest quotes in several fiat currencies, deriving the others from one base fetch and cached FX rates.
+
+        :param tickers: The tickers, as an iterable or a comma-separated str.
+        :param currencies: The fiat currency codes.
+        :return: Map of currency -> (ticker -> quote).
+        :raises CommandError: If a ticker or currency is not supported.
+        :raises APIError: If the quotes or FX rates cannot be fetched.
+        """
+        ticker_list = _normalize_tickers(tickers)
+        currency_list = list(dict.fromkeys(validate_currency(c) for c in currencies))
+        by_currency = self._fx.fetch_multiple_price_data(",".join(ticker_list), currency_list)
+        return {
+            currency: {t: Quote.from_price_data(t, currency, data[t]) for t in ticker_list if t in data}
+            for currency, data in by_currency.items()
+        }
+
+    def convert(self, amount: float, ticker: str, currency: Optional[str] = None, to_ticker: Optional[str] = None) -> Conversion:
+        """
+        Converts an amount of a cryptocurrency to fiat, or to another cryptocurrency.
+
+        :param amount: The amount to convert.
+        :param ticker: The ticker to convert from.
+        :param currency: The fiat currency code (defaults to the client's currency). Also used to derive crypto cross rates.
+        :param to_ticker: The ticker to convert to instead of fiat.
+        :return: The conversion.
+        :raises CommandError: If a ticker or the currency is not supported.
+        :raises APIError: If a price cannot be fetched.
+        """
+        tickers = _normalize_tickers([ticker] + ([to_ticker] if to_ticker else []))
+        quotes = self.prices(tickers, currency)
+        missing = [t for t in tickers if not (t in quotes and quotes[t].price)]
+        if missing:
+            raise APIError(f"No price data returned for: {', '.join(missing)}")
+
+        source = quotes[tickers[0]]
+        if to_ticker is None:
+            return Conversion(amount, source.ticker, source.currency, source.price, amount * source.price)
+
+        target = quotes[tickers[-1]]
+        rate = cross_rate(source.price, target.price)
+        return Conversion(amount, source.ticker, target.ticker, rate, amount * rate)
+
+    def value_portfolio(self, holdings: Union[str, Path, Dict[str, float]], currency: Optional[str] = None) -> PortfolioValuation:
+        """
+        Values a set of holdings at the latest prices.
+
+        :param holdings: Map of ticker -> amount, or the path of a portfolio file (YAML, CSV, NDJSON or txt).
+        :param currency: The fiat currency code (defaults to the client's currency).
+        :return: The valuation.
+        :raises CommandError: If the portfolio cannot be read or contains an unsupported ticker.
+        :raises APIError: If the prices cannot be fetched.
+        """
+        if isinstance(holdings, (str, Path)):
+            path = Path(holdings)
+            if not path.exists():
+                raise CommandError(f"Supplied portfolio file not found: '{path}'")
+            amounts = read_holdings(path).totals
+        else:
+            amounts = {t.strip().upper(): float(a) for t, a in holdings.items()}
+
+        currency = self._resolve_currency(currency)
+        quotes = self.prices(list(amounts), currency) if amounts else {}
+        values = {
+            t: HoldingValue(t, amount, quotes[t].price, amount * quotes[t].price)
+            for t, amount in amounts.items() if t in quotes
+        }
+        return PortfolioValuation(
+            currency=currency,
+            total_value=sum(v.value for v in values.values()),
+            holdings=values,
+            missing=[t for t in amounts if t not in quotes],
+        )
+
+    def _resolve_currency(self, currency: Optional[str]) -> str:
+        return validate_currency(currency) if currency else self.currency
+
+
+def _normalize_tickers(tickers: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Normalizes tickers to a de-duplicated list of uppercase symbols and validates them.
+
+    :param tickers: The tickers, as an iterable or a comma-separated str.
+    :return: The normalized tickers.
+    :raises CommandError: If no tickers are given or a ticker is not supported.
+    """
+    if isinstance(tickers, str):
+        tickers = tickers.split(",")
+    ticker_list = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if not ticker_list:
+        raise CommandError("No tickers provided")
+    validate_tickers(ticker_list)
+    return ticker_list
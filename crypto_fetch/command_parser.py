@@ -1,24 +1,40 @@
 import argparse
 import logging
-from typing import Optional
+from typing import Dict, NoReturn, Optional
 
-from crypto_fetch.api.api_client import APIConfig, BaseAPIClient
-from crypto_fetch.api.cmc_api_client import CoinMarketCapAPIClient
-from crypto_fetch.api.cg_api_client import CoinGeckoAPIClient
-from crypto_fetch.config.config import get_api_provider_config, get_default_api_provider
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.client_factory import create_api_client
+from crypto_fetch.config.config import get_default_api_provider, get_default_max_stale
+from crypto_fetch.commands.alerts_command import AlertsCommand
+from crypto_fetch.commands.analytics_command import AnalyticsCommand
+from crypto_fetch.commands.batch_command import BatchCommand
+from crypto_fetch.commands.command_utils import parse_duration_arg
 from crypto_fetch.commands.config_command import ConfigCommand
+from crypto_fetch.commands.consensus_command import ConsensusCommand
 from crypto_fetch.constants import (
-    CF_LOGGER, CF_VERSION,
-    CMD_PRICE, CMD_CONVERT, CMD_CONFIG, CMD_PORTFOLIO,
-    CMD_CONFIG_INIT, CMD_CONFIG_VALIDATE, CMD_CONFIG_RECREATE,
+    CF_LOGGER, CF_VERSION, LOG_FORMATS, LOG_FORMAT_RICH,
+    CMD_PRICE, CMD_CONVERT, CMD_CONFIG, CMD_PORTFOLIO, CMD_HISTORY, CMD_ANALYTICS, CMD_ALERTS, CMD_MATRIX, CMD_MARKET, CMD_SCREEN, CMD_CONSENSUS, CMD_BATCH, CMD_USAGE, CMD_PREFETCH, CMD_LOADTEST,
+    CMD_CONFIG_INIT, CMD_CONFIG_VALIDATE, CMD_CONFIG_RECREATE, CMD_PORTFOLIO_HISTORY,
+    HISTORY_INTERVAL_DAY, HISTORY_INTERVAL_HOUR, HISTORY_INTERVALS,
+    ANALYTICS_DEFAULT_WINDOW, ANALYTICS_INTERVAL_SECONDS, ALERT_SINK_STDOUT, VERBOSE_DEFAULT_LIMIT,
+    MARKET_DEFAULT_LIMIT, MARKET_SORT_FIELDS, SCREEN_DEFAULT_TOP, SCREEN_DEFAULT_UNIVERSE, SCREEN_FIELDS,
+    CONSENSUS_OUTLIER_THRESHOLD, PROVIDERS_SUPPORTED, BATCH_MAX_WORKERS, USAGE_DEFAULT_DAYS, REFRESH_DEFAULT_REQUEST_BUDGET, PREFETCH_DEFAULT_LEAD,
+    LOADTEST_DEFAULT_DURATION, LOADTEST_DEFAULT_LATENCY_MS, LOADTEST_DEFAULT_TICKERS, LOADTEST_DEFAULT_WORKERS,
     PROVIDER_COINMARKETCAP, PROVIDER_COINGECKO,
-    CONFIG_KEY_PROVIDER_NAME, CONFIG_KEY_PROVIDER_BASE_URL, CONFIG_KEY_PROVIDER_PRICE_EP,
 )
 from crypto_fetch.commands.convert_command import ConvertCommand
-from crypto_fetch.exceptions import CryptoFetchError
+from crypto_fetch.commands.history_command import HistoryCommand
+from crypto_fetch.commands.market_command import MarketCommand
+from crypto_fetch.commands.matrix_command import MatrixCommand
+from crypto_fetch.exceptions import CommandError, CryptoFetchError
 from crypto_fetch.logger import setup_logger
 from crypto_fetch.commands.portfolio_command import PortfolioCommand
+from crypto_fetch.commands.portfolio_history_command import PortfolioHistoryCommand
+from crypto_fetch.commands.prefetch_command import PrefetchCommand
+from crypto_fetch.commands.loadtest_command import LoadTestCommand
 from crypto_fetch.commands.price_command import PriceCommand
+from crypto_fetch.commands.screen_command import ScreenCommand
+from crypto_fetch.commands.usage_command import UsageCommand
 
 logger = logging.getLogger(CF_LOGGER)
 
@@ -29,52 +45,121 @@ def main():
     """
     parser = argparse.ArgumentParser(prog="crypto-fetch", description="A command line tool to fetch cryptocurrency prices")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, default=LOG_FORMAT_RICH, help="Log format: rich console output, or JSON lines on stderr (default: rich)")
     parser.add_argument("--version", action='version', version=f"%(prog)s {CF_VERSION}")
+    parser.add_argument("--max-stale", default=None, help="Serve cached quotes up to this old (e.g. 10m) and refresh them in the background (default: config max_stale)")
 
     subparser = parser.add_subparsers(dest="command", required=True)
     _setup_price_command(subparser)
     _setup_convert_command(subparser)
     _setup_config_command(subparser)
     _setup_portfolio_command(subparser)
+    _setup_portfolio_history_command(subparser)
+    _setup_history_command(subparser)
+    _setup_analytics_command(subparser)
+    _setup_alerts_command(subparser)
+    _setup_matrix_command(subparser)
+    _setup_market_command(subparser)
+    _setup_screen_command(subparser)
+    _setup_consensus_command(subparser)
+    _setup_batch_command(subparser)
+    _setup_usage_command(subparser)
+    _setup_prefetch_command(subparser)
+    _setup_loadtest_command(subparser)
 
     args: argparse.Namespace = parser.parse_args()
 
-    setup_logger(args.debug)
+    setup_logger(args.debug, args.log_format)
     logger.debug("Debug logs enabled")
 
     client = _create_api_client(args)
+    consensus_clients: Dict[str, BaseAPIClient] = {}
     try:
+        max_stale = parse_duration_arg(args.max_stale or get_default_max_stale())
+        if client is not None:
+            client.max_stale = max_stale
+
         if args.command == CMD_PRICE:
-            command = PriceCommand(client, args.tickers, args.currency, args.provider, args.verbose, args.date)
+            command = PriceCommand(client, args.tickers, args.currency, args.provider, args.verbose, args.date, args.limit, args.page, args.export)
             command.run()
         elif args.command == CMD_CONVERT:
-            command = ConvertCommand(client, args.amount, args.ticker, args.currency, args.date, args.provider)
+            command = ConvertCommand(client, args.amount, args.ticker, args.currency, args.date, args.provider, args.to)
             command.run()
         elif args.command == CMD_CONFIG:
             command = ConfigCommand(args.action)
             command.run()
+        elif args.command == CMD_PORTFOLIO_HISTORY:
+            command = PortfolioHistoryCommand(args.files, args.since, args.until, args.interval, args.currency, args.export)
+            command.run()
         elif args.command == CMD_PORTFOLIO:
-            command = PortfolioCommand(client, args.file, args.currency, args.provider)
+            command = PortfolioCommand(client, args.files, args.currency, args.provider, args.by_account, not args.no_history, args.export)
+            command.run()
+        elif args.command == CMD_HISTORY:
+            command = HistoryCommand(client, args.ticker, args.currency, args.provider, args.since, args.until, args.limit, args.export)
+            command.run()
+        elif args.command == CMD_ANALYTICS:
+            command = AnalyticsCommand(client, args.tickers, args.portfolio, args.currency, args.provider,
+                                       args.since, args.until, args.interval, args.window)
+            command.run()
+        elif args.command == CMD_ALERTS:
+            command = AlertsCommand(client, args.rules, args.currency, args.provider, args.sink, args.interval, args.count,
+                                    args.adaptive, args.max_requests)
+            command.run()
+        elif args.command == CMD_MATRIX:
+            command = MatrixCommand(client, args.tickers, args.currency, args.provider)
+            command.run()
+        elif args.command == CMD_MARKET:
+            command = MarketCommand(client, args.limit, args.sort, args.currency, args.provider, args.output)
+            command.run()
+        elif args.command == CMD_CONSENSUS:
+            for provider in PROVIDERS_SUPPORTED:
+                consensus_clients[provider] = create_api_client(provider)
+                consensus_clients[provider].max_stale = max_stale
+            command = ConsensusCommand(consensus_clients, args.tickers, args.currency, args.threshold)
+            command.run()
+        elif args.command == CMD_SCREEN:
+            command = ScreenCommand(client, args.expression, args.currency, args.provider, args.sort, args.ascending, args.top, args.universe)
+            command.run()
+        elif args.command == CMD_BATCH:
+            command = BatchCommand(args.file, _build_batch_line_parser().parse_args, max_stale, args.workers)
+            command.run()
+        elif args.command == CMD_USAGE:
+            command = UsageCommand(args.provider, args.days)
+            command.run()
+        elif args.command == CMD_PREFETCH:
+            command = PrefetchCommand(args.lead, args.watch)
+            command.run()
+        elif args.command == CMD_LOADTEST:
+            command = LoadTestCommand(args.tickers, args.currency, args.provider, args.workers, args.rps, args.duration, args.requests,
+                                      args.latency, args.jitter, args.error_rate, args.throttle_rate, args.keys)
             command.run()
     except CryptoFetchError as ex:
-        logger.error(f"'{args.command}' command failed. Error: {ex}")
+        logger.error("'%s' command failed. Error: %s", args.command, ex)
+    finally:
+        for consensus_client in consensus_clients.values():
+            consensus_client.close()
 
 
 def _setup_price_command(subparser: argparse._SubParsersAction) -> None:
     """Sets up the price subcommand."""
     price_parser = subparser.add_parser(CMD_PRICE, help="Fetch the price of a cryptocurrency")
     price_parser.add_argument("tickers", help="Comma-separated tickers (e.g. BTC,XRP)")
-    price_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    price_parser.add_argument("-c", "--currency", default=None, help="Currency, or comma-separated currencies (default: EUR)")
     price_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output")
     price_parser.add_argument("-d", "--date", action="store_true", help="Display the date/time in the output")
+    price_parser.add_argument("-l", "--limit", type=int, default=VERBOSE_DEFAULT_LIMIT,
+                              help=f"Maximum number of tickers shown in verbose mode, 0 for all (default: {VERBOSE_DEFAULT_LIMIT})")
+    price_parser.add_argument("--page", action="store_true", help="Show verbose output through a pager")
+    _add_export_arg(price_parser)
     _add_provider_arg(price_parser)
 
 
 def _setup_convert_command(subparser: argparse._SubParsersAction) -> None:
     """Sets up the convert subcommand."""
-    convert_parser = subparser.add_parser(CMD_CONVERT, help="Convert crypto to fiat")
+    convert_parser = subparser.add_parser(CMD_CONVERT, help="Convert crypto to fiat or to another crypto")
     convert_parser.add_argument("amount", help="Amount to convert")
     convert_parser.add_argument("-t", "--ticker", required=True, help="Target cryptocurrency")
+    convert_parser.add_argument("--to", default=None, help="Cryptocurrency to convert to instead of fiat (e.g. ETH)")
     convert_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
     convert_parser.add_argument("-d", "--date", action="store_true", help="Display the date/time in the output")
     _add_provider_arg(convert_parser)
@@ -89,11 +174,172 @@ def _setup_config_command(subparser: argparse._SubParsersAction) -> None:
 def _setup_portfolio_command(subparser: argparse._SubParsersAction) -> None:
     """Sets up the portfolio subcommand."""
     portfolio_parser = subparser.add_parser(CMD_PORTFOLIO, help="Display portfolio holdings with live prices")
-    portfolio_parser.add_argument("file", help="Path to portfolio YAML file")
+    portfolio_parser.add_argument("files", nargs="+", help="Path(s) or glob pattern(s) of portfolio files (YAML, CSV, NDJSON or txt)")
     portfolio_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    portfolio_parser.add_argument("-a", "--by-account", action="store_true", help="Show a per-account breakdown")
+    portfolio_parser.add_argument("--no-history", action="store_true", help="Do not record the valuation in the portfolio history")
+    _add_export_arg(portfolio_parser)
     _add_provider_arg(portfolio_parser)
 
 
+def _setup_portfolio_history_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the portfolio-history subcommand."""
+    history_parser = subparser.add_parser(CMD_PORTFOLIO_HISTORY, help="Show recorded portfolio valuations over time")
+    history_parser.add_argument("files", nargs="*", help="Portfolio file(s) to include (default: all recorded portfolios)")
+    history_parser.add_argument("-c", "--currency", default=None, help="Only include valuations in this currency")
+    history_parser.add_argument("--since", default=None, help="Start of range (YYYY-MM-DD[ HH:MM:SS] or offset like 7d)")
+    history_parser.add_argument("--until", default=None, help="End of range (YYYY-MM-DD[ HH:MM:SS] or offset like 1h)")
+    history_parser.add_argument("--interval", choices=HISTORY_INTERVALS, default=HISTORY_INTERVAL_DAY, help="Aggregation period (default: day)")
+    _add_export_arg(history_parser)
+
+
+def _setup_history_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the history subcommand."""
+    history_parser = subparser.add_parser(CMD_HISTORY, help="Fetch the price history of a cryptocurrency")
+    history_parser.add_argument("ticker", help="Cryptocurrency ticker (e.g. BTC)")
+    history_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    history_parser.add_argument("--since", default="7d", help="Start of range (YYYY-MM-DD[ HH:MM:SS] or offset like 7d, default: 7d)")
+    history_parser.add_argument("--until", default=None, help="End of range (YYYY-MM-DD[ HH:MM:SS] or offset like 1h, default: now)")
+    history_parser.add_argument("-n", "--limit", type=int, default=24, help="Number of most recent points to display (default: 24)")
+    _add_export_arg(history_parser)
+    _add_provider_arg(history_parser)
+
+
+def _setup_analytics_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the analytics subcommand."""
+    analytics_parser = subparser.add_parser(CMD_ANALYTICS, help="Compute returns, volatility, drawdown and correlation")
+    analytics_parser.add_argument("tickers", nargs="?", default=None, help="Comma-separated tickers (e.g. BTC,ETH)")
+    analytics_parser.add_argument("--portfolio", default=None, help="Portfolio file to take tickers and weights from")
+    analytics_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    analytics_parser.add_argument("--since", default="30d", help="Start of range (YYYY-MM-DD[ HH:MM:SS] or offset like 30d, default: 30d)")
+    analytics_parser.add_argument("--until", default=None, help="End of range (YYYY-MM-DD[ HH:MM:SS] or offset like 1h, default: now)")
+    analytics_parser.add_argument("--interval", choices=list(ANALYTICS_INTERVAL_SECONDS), default=HISTORY_INTERVAL_HOUR, help="Sampling interval (default: hour)")
+    analytics_parser.add_argument("-w", "--window", type=int, default=ANALYTICS_DEFAULT_WINDOW, help=f"Rolling volatility window in samples (default: {ANALYTICS_DEFAULT_WINDOW})")
+    _add_provider_arg(analytics_parser)
+
+
+def _setup_alerts_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the alerts subcommand."""
+    alerts_parser = subparser.add_parser(CMD_ALERTS, help="Evaluate price alert rules against live quotes")
+    alerts_parser.add_argument("rules", help="Path to alert rules file (e.g. 'BTC < 50k EUR' per line)")
+    alerts_parser.add_argument("-c", "--currency", default=None, help="Currency for rules without one (default: EUR)")
+    alerts_parser.add_argument("-s", "--sink", default=ALERT_SINK_STDOUT, help="Alert sink: stdout, file:<path> or webhook:<url> (default: stdout)")
+    alerts_parser.add_argument("-i", "--interval", type=int, default=60, help="Seconds between polls (default: 60)")
+    alerts_parser.add_argument("-n", "--count", type=int, default=1, help="Number of polls, 0 to run until interrupted (default: 1)")
+    alerts_parser.add_argument("--adaptive", action="store_true",
+                               help="Refresh volatile and frequently alerting tickers more often than quiet ones, based on the interval")
+    alerts_parser.add_argument("--max-requests", type=int, default=REFRESH_DEFAULT_REQUEST_BUDGET,
+                               help=f"With --adaptive, maximum requests per minute (default: {REFRESH_DEFAULT_REQUEST_BUDGET})")
+    _add_provider_arg(alerts_parser)
+
+
+def _setup_matrix_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the matrix subcommand."""
+    matrix_parser = subparser.add_parser(CMD_MATRIX, help="Display the crypto-to-crypto cross-rate matrix")
+    matrix_parser.add_argument("tickers", help="Comma-separated tickers (e.g. BTC,ETH,SOL)")
+    matrix_parser.add_argument("-c", "--currency", default=None, help="Currency the rates are derived from (default: EUR)")
+    _add_provider_arg(matrix_parser)
+
+
+def _setup_market_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the market subcommand."""
+    market_parser = subparser.add_parser(CMD_MARKET, help="List the top cryptocurrencies by market")
+    market_parser.add_argument("-n", "--limit", type=int, default=MARKET_DEFAULT_LIMIT, help=f"Number of listings to fetch (default: {MARKET_DEFAULT_LIMIT})")
+    market_parser.add_argument("-s", "--sort", choices=MARKET_SORT_FIELDS, default=MARKET_SORT_FIELDS[0], help="Field to sort by, descending (default: market_cap)")
+    market_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    market_parser.add_argument("-o", "--output", default=None, help="Write the listings to a CSV file instead of the console")
+    _add_provider_arg(market_parser)
+
+
+def _setup_screen_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the screen subcommand."""
+    screen_parser = subparser.add_parser(CMD_SCREEN, help="Filter the market listings with an expression")
+    screen_parser.add_argument("expression", help=f"Filter expression, e.g. \"market_cap > 1b and 24h_change < -5\" (fields: {', '.join(SCREEN_FIELDS)})")
+    screen_parser.add_argument("-s", "--sort", choices=SCREEN_FIELDS, default="market_cap", help="Field to rank matches by (default: market_cap)")
+    screen_parser.add_argument("--ascending", action="store_true", help="Rank the smallest values first")
+    screen_parser.add_argument("-n", "--top", type=int, default=SCREEN_DEFAULT_TOP, help=f"Number of matches to show (default: {SCREEN_DEFAULT_TOP})")
+    screen_parser.add_argument("-u", "--universe", type=int, default=SCREEN_DEFAULT_UNIVERSE, help=f"Number of listings (by market cap) to screen (default: {SCREEN_DEFAULT_UNIVERSE})")
+    screen_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    _add_provider_arg(screen_parser)
+
+
+def _setup_consensus_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the consensus subcommand."""
+    consensus_parser = subparser.add_parser(CMD_CONSENSUS, help="Fetch the consensus price across all providers")
+    consensus_parser.add_argument("tickers", help="Comma-separated tickers (e.g. BTC,ETH)")
+    consensus_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    consensus_parser.add_argument("-t", "--threshold", type=float, default=CONSENSUS_OUTLIER_THRESHOLD,
+                                  help=f"Flag prices more than this percent from the median (default: {CONSENSUS_OUTLIER_THRESHOLD:g})")
+
+
+def _setup_batch_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the batch subcommand."""
+    batch_parser = subparser.add_parser(CMD_BATCH, help="Run price, convert and portfolio commands from a file, one per line")
+    batch_parser.add_argument("file", help="Path to the batch file, or - to read from stdin")
+    batch_parser.add_argument("-w", "--workers", type=int, default=BATCH_MAX_WORKERS, help=f"Maximum number of commands run at the same time (default: {BATCH_MAX_WORKERS})")
+
+
+def _setup_usage_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the usage subcommand."""
+    usage_parser = subparser.add_parser(CMD_USAGE, help="Show API calls and credits spent against the credit budgets")
+    usage_parser.add_argument("-d", "--days", type=int, default=USAGE_DEFAULT_DAYS, help=f"Number of days of daily usage to show (default: {USAGE_DEFAULT_DAYS})")
+    _add_provider_arg(usage_parser)
+
+
+def _setup_prefetch_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the prefetch subcommand."""
+    prefetch_parser = subparser.add_parser(CMD_PREFETCH, help="Warm the quote cache with the quotes usually requested around this time")
+    prefetch_parser.add_argument("-l", "--lead", default=None,
+                                 help=f"Prefetch quotes usually requested within this long (e.g. 30m, default: {PREFETCH_DEFAULT_LEAD // 60}m)")
+    prefetch_parser.add_argument("-w", "--watch", action="store_true", help="Keep prefetching until interrupted")
+
+
+def _setup_loadtest_command(subparser: argparse._SubParsersAction) -> None:
+    """Sets up the loadtest subcommand."""
+    loadtest_parser = subparser.add_parser(CMD_LOADTEST, help="Load test an API client against a local stub server (offline)")
+    loadtest_parser.add_argument("-t", "--tickers", default=None, help=f"Comma-separated tickers to request (default: {LOADTEST_DEFAULT_TICKERS})")
+    loadtest_parser.add_argument("-c", "--currency", default=None, help="Currency (default: EUR)")
+    _add_provider_arg(loadtest_parser)
+    loadtest_parser.add_argument("-w", "--workers", type=int, default=LOADTEST_DEFAULT_WORKERS,
+                                 help=f"Number of concurrent workers (default: {LOADTEST_DEFAULT_WORKERS})")
+    loadtest_parser.add_argument("--rps", type=float, default=None,
+                                 help="Start requests at this rate instead of as fast as the workers allow")
+    loadtest_parser.add_argument("-d", "--duration", type=float, default=LOADTEST_DEFAULT_DURATION,
+                                 help=f"Seconds to send requests for (default: {LOADTEST_DEFAULT_DURATION})")
+    loadtest_parser.add_argument("-n", "--requests", type=int, default=None, help="Stop after this many requests")
+    loadtest_parser.add_argument("--latency", type=float, default=LOADTEST_DEFAULT_LATENCY_MS,
+                                 help=f"Stub server latency in milliseconds (default: {LOADTEST_DEFAULT_LATENCY_MS})")
+    loadtest_parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random latency added per response, in milliseconds")
+    loadtest_parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed with a 500 (e.g. 0.01)")
+    loadtest_parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests rejected with a 429 (e.g. 0.05)")
+    loadtest_parser.add_argument("--keys", type=int, default=1, help="Number of fake API keys to spread requests over (default: 1)")
+
+
+class _BatchLineParser(argparse.ArgumentParser):
+    """Argument parser for a batch line, raising CommandError instead of exiting."""
+
+    def error(self, message: str) -> NoReturn:
+        raise CommandError(message)
+
+    def exit(self, status: int = 0, message: Optional[str] = None) -> NoReturn:
+        raise CommandError(message or "Unexpected exit while parsing arguments")
+
+
+def _build_batch_line_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser for a single batch line, using the same subcommand definitions as the command line.
+
+    :return: The parser.
+    """
+    parser = _BatchLineParser(prog="crypto-fetch", add_help=False)
+    subparser = parser.add_subparsers(dest="command", required=True)
+    _setup_price_command(subparser)
+    _setup_convert_command(subparser)
+    _setup_portfolio_command(subparser)
+    _setup_portfolio_history_command(subparser)
+    return parser
+
+
 def _add_provider_arg(parser: argparse.ArgumentParser) -> None:
     """Adds the shared --provider argument to a subcommand parser.
 
@@ -102,34 +348,24 @@ def _add_provider_arg(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-p", "--provider", choices=[PROVIDER_COINMARKETCAP, PROVIDER_COINGECKO], default=None, help="Choose API provider (default: coinmarketcap)")
 
 
+def _add_export_arg(parser: argparse.ArgumentParser) -> None:
+    """Adds the shared --export argument to a subcommand parser.
+
+    :param parser: The subcommand parser to add the argument to.
+    """
+    parser.add_argument("--export", default=None, metavar="PATH",
+                        help="Also export the results to a .parquet or .arrow file, or append them to a Parquet dataset directory (requires pyarrow)")
+
+
 def _create_api_client(args: argparse.Namespace) -> Optional[BaseAPIClient]:
     """
     Creates the appropriate API client based on the supplied provider.
 
     :param args: The parsed command line arguments.
-    :return: The API client, or None if the config command is being run.
+    :return: The API client, or None if a command that needs no client (or creates its own) is being run.
     """
-    if args.command == CMD_CONFIG:
+    if args.command in (CMD_CONFIG, CMD_BATCH, CMD_USAGE, CMD_PREFETCH, CMD_LOADTEST, CMD_PORTFOLIO_HISTORY, CMD_CONSENSUS):
         return None
 
     provider = getattr(args, "provider", None) or get_default_api_provider()
-    if provider == PROVIDER_COINGECKO:
-        return CoinGeckoAPIClient(_create_api_config(PROVIDER_COINGECKO))
-    return CoinMarketCapAPIClient(_create_api_config(PROVIDER_COINMARKETCAP))
-
-
-def _create_api_config(provider: str) -> APIConfig:
-    """
-    Builds an APIConfig from the provider's configuration in the config file.
-
-    :param provider: The provider name.
-    :return: The APIConfig for the given provider.
-    """
-    logger.debug(f"Creating API client for provider: '{provider}'")
-    config = get_api_provider_config(provider)
-
-    return APIConfig(
-        name=config.get(CONFIG_KEY_PROVIDER_NAME, provider),
-        base_url=config.get(CONFIG_KEY_PROVIDER_BASE_URL, ""),
-        price_endpoint=config.get(CONFIG_KEY_PROVIDER_PRICE_EP, ""),
-    )
\ No newline at end of file
+    return create_api_client(provider)
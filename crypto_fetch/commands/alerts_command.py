@@ -0,0 +1,134 @@
+import logging
+from pathlib import Path
+import time
+from typing import List
+
+from crypto_fetch.alerts.engine import AlertEngine
+from crypto_fetch.alerts.rules import AlertRule, load_rules
+from crypto_fetch.alerts.sinks import AlertSink, create_sink
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.refresh_scheduler import RefreshScheduler
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider, validate_currency, validate_tickers
+from crypto_fetch.constants import CF_LOGGER, REFRESH_DEFAULT_REQUEST_BUDGET
+from crypto_fetch.exceptions import APIError, CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class AlertsCommand(Command):
+    """Evaluate price alert rules against live quotes."""
+
+    def __init__(self, client: BaseAPIClient, rules_file: str, currency: str, provider: str, sink: str, interval: int, count: int,
+                 adaptive: bool = False, max_requests: int = REFRESH_DEFAULT_REQUEST_BUDGET):
+        """
+        :param client: The API client to use for fetching price data.
+        :param rules_file: Path to the alert rules file.
+        :param currency: The default fiat currency for rules that do not specify one.
+        :param provider: The API provider name.
+        :param sink: The alert sink spec ('stdout', 'file:<path>' or 'webhook:<url>').
+        :param interval: Seconds between polls (with adaptive, the interval for a ticker of reference volatility).
+        :param count: Number of polls to run (0 = until interrupted).
+        :param adaptive: Whether to refresh each ticker at its own interval (see RefreshScheduler).
+        :param max_requests: With adaptive, the maximum number of requests per minute.
+        """
+        super().__init__(client)
+        self.rules_file = Path(rules_file)
+        self.rules: List[AlertRule] = []
+        self.currency = currency
+        self.provider = provider
+        self.sink_spec = sink
+        self.sink: AlertSink = None  # type: ignore
+        self.interval = interval
+        self.count = count
+        self.adaptive = adaptive
+        self.max_requests = max_requests
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for alerts command")
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        self.rules = load_rules(self.rules_file, self.currency)
+        validate_tickers(sorted({r.ticker for r in self.rules}))
+        for currency in {r.currency for r in self.rules}:
+            validate_currency(currency)
+
+        self.sink = create_sink(self.sink_spec)
+
+        if self.interval <= 0:
+            raise CommandError(f"Interval must be positive. Received: '{self.interval}'")
+        if self.count < 0:
+            raise CommandError(f"Count must not be negative. Received: '{self.count}'")
+        if self.max_requests <= 0:
+            raise CommandError(f"Maximum requests must be positive. Received: '{self.max_requests}'")
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        engine = AlertEngine(self.rules)
+        watched = engine.watched
+        logger.info("EVALUATING %s ALERT RULE(S) FOR %s TICKER(S)...", len(self.rules), sum(len(t) for t in watched.values()))
+
+        if self.adaptive:
+            self._poll_adaptive(engine)
+            return
+
+        poll = 0
+        while self.count == 0 or poll < self.count:
+            if poll > 0:
+                time.sleep(self.client.get_poll_interval(self.interval))
+            poll += 1
+
+            for currency, tickers in watched.items():
+                try:
+                    data = self.client.fetch_multiple_price_data(",".join(tickers), currency)
+                except APIError as ex:
+                    if self.count == 1:
+                        raise
+                    logger.error("Alert poll %s failed for '%s': %s", poll, currency, ex)
+                    continue
+
+                events = engine.update(data, currency)
+                if events:
+                    self.sink.send(events)
+
+
+    def _poll_adaptive(self, engine: AlertEngine) -> None:
+        """
+        Polls with a RefreshScheduler: each poll refreshes only the tickers that are due, batched into
+        requests per currency. Tickers whose alerts fire count as accessed, so they are refreshed sooner.
+
+        :param engine: The alert engine.
+        """
+        scheduler = RefreshScheduler(self.interval, self.max_requests)
+        for currency, tickers in engine.watched.items():
+            for ticker in tickers:
+                scheduler.add(ticker, currency)
+
+        poll = 0
+        while self.count == 0 or poll < self.count:
+            if poll > 0:
+                time.sleep(max(scheduler.next_wakeup() - time.time(), 0))
+            poll += 1
+            scheduler.base_interval = self.client.get_poll_interval(self.interval)
+
+            for currency, tickers in scheduler.due():
+                try:
+                    data = self.client.fetch_multiple_price_data(",".join(tickers), currency)
+                except APIError as ex:
+                    if self.count == 1:
+                        raise
+                    logger.error("Alert poll %s failed for '%s': %s", poll, currency, ex)
+                    scheduler.update(currency, tickers, {})
+                    continue
+
+                scheduler.update(currency, tickers, data)
+                events = engine.update(data, currency)
+                for event in events:
+                    scheduler.record_access(event.rule.ticker, currency)
+                if events:
+                    self.sink.send(events)
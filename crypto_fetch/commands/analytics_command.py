@@ -0,0 +1,87 @@
+import logging
+from pathlib import Path
+import time
+from typing import Dict, List, Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_analytics_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import parse_time_arg, resolve_currency, resolve_provider, validate_tickers
+from crypto_fetch.constants import ANALYTICS_INTERVAL_SECONDS, CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.history.analytics import compute_analytics, load_price_matrix, require_numpy
+from crypto_fetch.portfolio.holdings_reader import read_holdings
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class AnalyticsCommand(Command):
+    """Compute returns, volatility, drawdown and correlation over cached price history."""
+
+    def __init__(self, client: BaseAPIClient, tickers: Optional[str], portfolio_file: Optional[str], currency: str, provider: str,
+                 since: str, until: Optional[str], interval: str, window: int):
+        """
+        :param client: The API client to use for fetching price history.
+        :param tickers: Comma-separated cryptocurrency ticker symbols.
+        :param portfolio_file: Portfolio file whose holdings are used as tickers and weights.
+        :param currency: The fiat currency code.
+        :param provider: The API provider name.
+        :param since: Start of the time range (absolute date or relative offset).
+        :param until: End of the time range (absolute date or relative offset, default: now).
+        :param interval: The sampling interval (hour or day).
+        :param window: The rolling volatility window, in samples.
+        """
+        super().__init__(client)
+        self.tickers = tickers
+        self.ticker_list: List[str] = []
+        self.portfolio_file = Path(portfolio_file) if portfolio_file else None
+        self.weights: Optional[Dict[str, float]] = None
+        self.currency = currency
+        self.provider = provider
+        self.since_raw = since
+        self.until_raw = until
+        self.since: int = 0
+        self.until: int = 0
+        self.interval = interval
+        self.window = window
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for analytics command")
+        require_numpy()
+
+        if self.portfolio_file is not None:
+            if not self.portfolio_file.exists():
+                raise CommandError(f"Supplied portfolio file not found: '{self.portfolio_file}'")
+            self.weights = read_holdings(self.portfolio_file).totals
+            self.ticker_list = list(self.weights)
+        if self.tickers:
+            self.ticker_list += [t.strip().upper() for t in self.tickers.split(",") if t.strip() and t.strip().upper() not in self.ticker_list]
+        if not self.ticker_list:
+            raise CommandError("No tickers provided. Supply tickers and/or --portfolio")
+        validate_tickers(self.ticker_list)
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        self.since = parse_time_arg(self.since_raw)  # type: ignore
+        self.until = parse_time_arg(self.until_raw) or int(time.time())
+        if self.since >= self.until:
+            raise CommandError(f"Invalid time range: '{self.since_raw}' is not before '{self.until_raw}'")
+
+        if self.interval not in ANALYTICS_INTERVAL_SECONDS:
+            raise CommandError(f"Unsupported analytics interval: '{self.interval}'")
+        if self.window < 2:
+            raise CommandError(f"Window must be at least 2. Received: '{self.window}'")
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.debug("Executing analytics command for %s ticker(s), range=[%s, %s]", len(self.ticker_list), self.since, self.until)
+        logger.info("COMPUTING ANALYTICS FOR %s TICKER(S)...", len(self.ticker_list))
+
+        matrix = load_price_matrix(self.client, self.ticker_list, self.currency, self.since, self.until,
+                                   ANALYTICS_INTERVAL_SECONDS[self.interval])
+        result = compute_analytics(matrix, self.window, self.weights)
+        format_analytics_output(result, len(matrix.timestamps), self.interval)
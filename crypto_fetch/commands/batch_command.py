@@ -0,0 +1,185 @@
+import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+from pathlib import Path
+import shlex
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.client_factory import create_api_client
+from crypto_fetch.api.formatter import capture_output, print_captured_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import validate_currency, validate_provider
+from crypto_fetch.commands.convert_command import ConvertCommand
+from crypto_fetch.commands.portfolio_command import PortfolioCommand
+from crypto_fetch.commands.portfolio_history_command import PortfolioHistoryCommand
+from crypto_fetch.commands.price_command import PriceCommand
+from crypto_fetch.config.config import load_api_config_from_file
+from crypto_fetch.constants import (
+    BATCH_MAX_WORKERS,
+    CF_LOGGER,
+    CMD_BATCH_STDIN,
+    CMD_CONVERT,
+    CMD_PORTFOLIO,
+    CMD_PORTFOLIO_HISTORY,
+    CMD_PRICE,
+    CONFIG_DEFAULTS_CURRENCY,
+    CONFIG_HEADER_DEFAULTS,
+    CONFIG_KEY_DEFAULTS_API_PROVIDER,
+    CONFIG_KEY_DEFAULTS_CURRENCY,
+    PROVIDER_COINMARKETCAP,
+)
+from crypto_fetch.exceptions import CommandError, CryptoFetchError
+
+logger = logging.getLogger(CF_LOGGER)
+
+BatchLine = Tuple[int, str, argparse.Namespace]
+
+
+class BatchCommand(Command):
+    """Run price, convert and portfolio commands read from a file, one command per line."""
+
+    def __init__(self, source: str, parse_line: Callable[[List[str]], argparse.Namespace],
+                 max_stale: Optional[int] = None, workers: int = BATCH_MAX_WORKERS):
+        """
+        :param source: Path of the batch file, or '-' to read from stdin.
+        :param parse_line: Parses the arguments of one line (e.g. ['price', 'BTC', '-c', 'USD']).
+        :param max_stale: Serve cached quotes up to this many seconds old (see BaseAPIClient.max_stale).
+        :param workers: The maximum number of lines run at the same time.
+        """
+        super().__init__()
+        self.source = source
+        self.parse_line = parse_line
+        self.max_stale = max_stale
+        self.workers = workers
+        self.config: Dict[str, Any] = {}
+        self.lines: List[BatchLine] = []
+        self.clients: Dict[str, BaseAPIClient] = {}
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for batch command")
+
+        if self.workers < 1:
+            raise CommandError(f"Number of workers must be at least 1. Got: {self.workers}")
+
+        self.lines = []
+        for number, line in enumerate(self._read_lines(), start=1):
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as ex:
+                raise CommandError(f"Line {number}: {ex}") from ex
+            if argv and argv[0] == "crypto-fetch":
+                argv = argv[1:]
+            if not argv:
+                continue
+            try:
+                args = self.parse_line(argv)
+            except CommandError as ex:
+                raise CommandError(f"Line {number}: {ex}") from ex
+            if getattr(args, "page", False):
+                raise CommandError(f"Line {number}: --page is not supported in batch mode")
+            self.lines.append((number, line.strip(), args))
+
+        if not self.lines:
+            raise CommandError(f"No commands found in '{self.source}'")
+
+        # Every line is resolved against one snapshot of the config, and every line using the
+        # same provider shares one API client (and so one HTTP session and quote cache)
+        self.config = load_api_config_from_file()
+        defaults: Dict[str, Any] = self.config.get(CONFIG_HEADER_DEFAULTS) or {}
+        default_currency = validate_currency(defaults.get(CONFIG_KEY_DEFAULTS_CURRENCY, CONFIG_DEFAULTS_CURRENCY))
+        default_provider = validate_provider(defaults.get(CONFIG_KEY_DEFAULTS_API_PROVIDER, PROVIDER_COINMARKETCAP))
+        for _, _, args in self.lines:
+            args.currency = args.currency or default_currency
+            if args.command != CMD_PORTFOLIO_HISTORY:
+                args.provider = args.provider or default_provider
+
+        logger.debug("Parsed %s command(s) from '%s'", len(self.lines), self.source)
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.info("RUNNING %s BATCH COMMAND(S)...", len(self.lines))
+
+        for provider in dict.fromkeys(args.provider for _, _, args in self.lines if args.command != CMD_PORTFOLIO_HISTORY):
+            self.clients[provider] = create_api_client(provider, self.config)
+            self.clients[provider].max_stale = self.max_stale
+
+        workers = min(self.workers, len(self.lines))
+        logger.debug("Running %s batch command(s) using %s worker(s)", len(self.lines), workers)
+        failed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures: List[Future] = [executor.submit(self._run_line, args) for _, _, args in self.lines]
+
+                # Lines run concurrently but are written out in input order, each as soon as it and
+                # every line before it have finished
+                for (number, line, _), future in zip(self.lines, futures):
+                    output, error = future.result()
+                    print_captured_output(output)
+                    if error is not None:
+                        failed += 1
+                        logger.error("Line %s ('%s') failed. Error: %s", number, line, error)
+        finally:
+            for client in self.clients.values():
+                client.close()
+
+        if failed:
+            raise CommandError(f"{failed} of {len(self.lines)} command(s) failed")
+
+
+    def _run_line(self, args: argparse.Namespace) -> Tuple[str, Optional[CryptoFetchError]]:
+        """
+        Runs the command of one line, capturing its output.
+
+        :param args: The parsed arguments of the line.
+        :return: The captured output, and the error the command failed with (None if it succeeded).
+        """
+        error: Optional[CryptoFetchError] = None
+        with capture_output() as buffer:
+            try:
+                self._create_command(args).run()
+            except CryptoFetchError as ex:
+                error = ex
+        return buffer.getvalue(), error
+
+
+    def _create_command(self, args: argparse.Namespace) -> Command:
+        """
+        Creates the command for the parsed arguments of one line.
+
+        :param args: The parsed arguments of the line.
+        :return: The command, using the shared client for its provider.
+        """
+        if args.command == CMD_PORTFOLIO_HISTORY:
+            return PortfolioHistoryCommand(args.files, args.since, args.until, args.interval, args.currency, args.export)
+
+        client = self.clients[args.provider]
+        if args.command == CMD_PRICE:
+            return PriceCommand(client, args.tickers, args.currency, args.provider, args.verbose, args.date, args.limit, export=args.export)
+        if args.command == CMD_CONVERT:
+            return ConvertCommand(client, args.amount, args.ticker, args.currency, args.date, args.provider, args.to)
+        if args.command == CMD_PORTFOLIO:
+            return PortfolioCommand(client, args.files, args.currency, args.provider, args.by_account, not args.no_history, args.export)
+        raise CommandError(f"'{args.command}' is not supported in batch mode")
+
+
+    def _read_lines(self) -> List[str]:
+        """
+        Reads the lines of the batch file, or of stdin.
+
+        :return: The lines.
+        :raises CommandError: If the file cannot be read.
+        """
+        if self.source == CMD_BATCH_STDIN:
+            return sys.stdin.read().splitlines()
+
+        path = Path(self.source)
+        if not path.exists():
+            raise CommandError(f"Supplied batch file not found: '{path}'")
+        try:
+            return path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError) as ex:
+            raise CommandError(f"Failed to read batch file '{path}': {ex}") from ex
@@ -1,5 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import re
 from typing import List, Optional
 
 from crypto_fetch.constants import (
@@ -23,7 +24,7 @@ def resolve_currency(value: Optional[str]) -> str:
     """
     if value is None:
         value = get_default_fiat_currency()
-        logger.debug(f"Fiat currency not specified. Using default: '{value}'")
+        logger.debug("Fiat currency not specified. Using default: '%s'", value)
     return validate_currency(value)
 
 
@@ -36,7 +37,7 @@ def resolve_provider(value: Optional[str]) -> str:
     """
     if value is None:
         value = get_default_api_provider()
-        logger.debug(f"API provider not specified. Using default: '{value}'")
+        logger.debug("API provider not specified. Using default: '%s'", value)
     return validate_provider(value)
 
 
@@ -48,7 +49,7 @@ def validate_currency(value: str) -> str:
     :return: The validated currency code, in uppercase.
     :raises CommandError: If the supplied currency is not supported.
     """
-    logger.debug(f"Validating fiat currency: '{value.upper()}'")
+    logger.debug("Validating fiat currency: '%s'", value.upper())
     currency = value.upper()
     if currency not in CURRENCY_SYMBOL_MAP:
         raise CommandError(f"Unknown/Unsupported currency. Received '{currency}'")
@@ -63,7 +64,7 @@ def validate_provider(value: str) -> str:
     :return: The lowercased, validated provider name.
     :raises CommandError: If the supplied provider is not supported.
     """
-    logger.debug(f"Validating provider: '{value.lower()}'")
+    logger.debug("Validating provider: '%s'", value.lower())
     provider = value.lower()
     if provider not in PROVIDERS_SUPPORTED:
         raise CommandError(f"Unknown/Unsupported provider. Received: '{provider}'")
@@ -77,7 +78,7 @@ def validate_tickers(tickers: List[str]) -> None:
     :param tickers: List of uppercase ticker symbols (e.g. ['BTC', 'XRP']).
     :raises CommandError: If any ticker is not supported.
     """
-    logger.debug(f"Validating supplied crypto tickers: {tickers}")
+    logger.debug("Validating supplied crypto tickers: %s", tickers)
     invalid_tickers = [t for t in tickers if t not in SUPPORTED_CRYPTO_TICKERS]
     if invalid_tickers:
         raise CommandError(f"Unknown/Unsupported ticker(s). Received: {', '.join(invalid_tickers)}")
@@ -89,4 +90,52 @@ def get_timestamp() -> str:
 
     :return: the current timestamp.
     """
-    return datetime.now().strftime(DATE_TIME_FORMAT)
\ No newline at end of file
+    return datetime.now().strftime(DATE_TIME_FORMAT)
+
+
+def parse_time_arg(value: Optional[str]) -> Optional[int]:
+    """
+    Parses a time argument into a unix timestamp.
+    Accepts absolute dates ('YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS') or relative offsets
+    from now ('30m', '12h', '7d', '4w').
+
+    :param value: The time argument.
+    :return: The unix timestamp, or None if no value was supplied.
+    :raises CommandError: If the value cannot be parsed.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    relative = re.fullmatch(r"(\d+)([mhdw])", value.lower())
+    if relative:
+        amount, unit = int(relative.group(1)), relative.group(2)
+        delta = {"m": timedelta(minutes=amount), "h": timedelta(hours=amount),
+                 "d": timedelta(days=amount), "w": timedelta(weeks=amount)}[unit]
+        return int((datetime.now() - delta).timestamp())
+
+    for time_format in (DATE_TIME_FORMAT, "%Y-%m-%d"):
+        try:
+            return int(datetime.strptime(value, time_format).timestamp())
+        except ValueError:
+            continue
+    raise CommandError(f"Invalid time: '{value}'. Use 'YYYY-MM-DD[ HH:MM:SS]' or a relative offset like '7d'")
+
+
+def parse_duration_arg(value: Optional[str]) -> Optional[int]:
+    """
+    Parses a duration argument ('90s', '30m', '12h', '7d' or a plain number of seconds) into seconds.
+
+    :param value: The duration argument.
+    :return: The duration in seconds, or None if no value was supplied.
+    :raises CommandError: If the value cannot be parsed.
+    """
+    if value is None:
+        return None
+
+    duration = re.fullmatch(r"(\d+)([smhdw]?)", value.strip().lower())
+    if not duration:
+        raise CommandError(f"Invalid duration: '{value}'. Use seconds or a value like '90s', '10m', '2h' or '1d'")
+
+    amount, unit = int(duration.group(1)), duration.group(2) or "s"
+    return amount * {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[unit]
@@ -27,7 +27,7 @@ class ConfigCommand(Command):
 
 
     def _execute(self) -> None:
-        logger.debug(f"Executing config action: '{self.action}'")
+        logger.debug("Executing config action: '%s'", self.action)
         if self.action == CMD_CONFIG_INIT:
             init_api_config_file()
         elif self.action == CMD_CONFIG_VALIDATE:
@@ -51,7 +51,7 @@ class ConfigCommand(Command):
                 logger.error("Config file is empty or invalid")
                 raise ConfigError("Config file is empty or invalid")
         except yaml.YAMLError as ex:
-            logger.error(f"Config file has YAML syntax errors: {ex}")
+            logger.error("Config file has YAML syntax errors: %s", ex)
             raise ConfigError(
                 f"Config file has YAML syntax errors: {ex}. Run 'crypto-fetch config recreate' to restore defaults")
 
@@ -61,7 +61,7 @@ class ConfigCommand(Command):
         else:
             logger.error("API config validation failed ❌")
             for error in errors:
-                logger.error(f"  - {error}")
+                logger.error("  - %s", error)
             raise ConfigError("Run 'crypto-fetch config recreate' to restore defaults")
 
 
@@ -70,5 +70,5 @@ class ConfigCommand(Command):
         Recreates the config file with default values.
         """
         save_api_config_to_file(DEFAULT_API_CONFIG)
-        logger.info(f"Config file recreated at: '{CONFIG_FILE_PATH}' ✅")
+        logger.info("Config file recreated at: '%s' ✅", CONFIG_FILE_PATH)
         logger.info("*** Remember to add your API keys ***")
\ No newline at end of file
@@ -0,0 +1,63 @@
+import logging
+from typing import Dict, List
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_consensus_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, validate_tickers
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.rates.consensus import fetch_consensus
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class ConsensusCommand(Command):
+    """Fetch the consensus price of cryptocurrencies across providers."""
+
+    def __init__(self, clients: Dict[str, BaseAPIClient], tickers: str, currency: str, outlier_threshold: float):
+        """
+        :param clients: Map of provider name -> API client to query.
+        :param tickers: Comma-separated cryptocurrency ticker symbols.
+        :param currency: The fiat currency code.
+        :param outlier_threshold: Percentage deviation from the median above which a provider's price is flagged.
+        """
+        super().__init__(next(iter(clients.values()), None))
+        self.clients = clients
+        self.tickers = tickers
+        self.ticker_list: List[str] = []
+        self.currency = currency
+        self.outlier_threshold = outlier_threshold
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for consensus command")
+
+        if len(self.clients) < 2:
+            raise CommandError("Consensus requires at least two providers")
+        if self.outlier_threshold < 0:
+            raise CommandError(f"Outlier threshold must not be negative. Got: {self.outlier_threshold}")
+
+        self.currency = resolve_currency(self.currency)
+        self.ticker_list = list(dict.fromkeys(t.strip().upper() for t in self.tickers.split(",") if t.strip()))
+        if not self.ticker_list:
+            raise CommandError(f"No valid tickers provided. Got: {self.tickers}")
+        validate_tickers(self.ticker_list)
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        providers = list(self.clients)
+        logger.info("FETCHING CONSENSUS PRICE FOR TICKER(S): %s FROM %s...", ','.join(f'${t}' for t in self.ticker_list), ', '.join(providers))
+
+        quotes = fetch_consensus(self.clients, self.ticker_list, self.currency, self.outlier_threshold)
+        missing = [t for t in self.ticker_list if t not in quotes]
+        if missing:
+            logger.warning("No price data returned for: %s", ', '.join(missing))
+
+        flagged = [q.ticker for q in quotes.values() if q.divergence > self.outlier_threshold]
+        if flagged:
+            logger.warning("Providers disagree by more than %g%% on: %s", self.outlier_threshold, ", ".join(flagged))
+
+        format_consensus_output(list(quotes.values()), providers, self.currency, self.outlier_threshold)
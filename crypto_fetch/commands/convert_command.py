@@ -1,26 +1,28 @@
 import logging
 
 from crypto_fetch.api.api_client import BaseAPIClient
-from crypto_fetch.api.formatter import format_convert_output, print_output
+from crypto_fetch.api.formatter import format_convert_output, format_crypto_convert_output, print_output
 from crypto_fetch.commands.command import Command
 from crypto_fetch.commands.command_utils import get_timestamp, resolve_currency, resolve_provider, validate_tickers
 from crypto_fetch.constants import CF_LOGGER
-from crypto_fetch.exceptions import CommandError
+from crypto_fetch.exceptions import APIError, CommandError
+from crypto_fetch.rates.cross_rates import cross_rate
 
 logger = logging.getLogger(CF_LOGGER)
 
 
 class ConvertCommand(Command):
-    """Convert cryptocurrency to fiat currency."""
+    """Convert cryptocurrency to fiat currency, or to another cryptocurrency."""
 
-    def __init__(self, client: BaseAPIClient, amount: str, ticker: str, currency: str, show_date: bool, provider: str):
+    def __init__(self, client: BaseAPIClient, amount: str, ticker: str, currency: str, show_date: bool, provider: str, to_ticker: str = None):
         """
         :param client: The API client to use for fetching price data.
         :param amount: The raw amount string to convert.
         :param ticker: The cryptocurrency ticker symbol.
-        :param currency: The fiat currency code to convert to.
+        :param currency: The fiat currency code to convert to (or to price both sides in when converting to a cryptocurrency).
         :param show_date: Whether to display the current timestamp in the output.
         :param provider: The API provider name.
+        :param to_ticker: The cryptocurrency ticker to convert to, if converting crypto to crypto.
         """
         super().__init__(client)
         self.amount_raw = amount
@@ -29,6 +31,7 @@ class ConvertCommand(Command):
         self.currency = currency
         self.provider = provider
         self.show_date = show_date
+        self.to_ticker = to_ticker
 
 
     def _validate(self) -> None:
@@ -48,22 +51,50 @@ class ConvertCommand(Command):
         self.ticker = self.ticker.strip().upper()
         validate_tickers([self.ticker])
 
+        if self.to_ticker is not None:
+            self.to_ticker = self.to_ticker.strip().upper()
+            validate_tickers([self.to_ticker])
+
         logger.debug("Validated arguments successfully")
 
 
     def _execute(self) -> None:
-        logger.debug(f"Executing convert command: amount='{self.amount_to_convert}', ticker='{self.ticker}', currency='{self.currency}'")
-        logger.info(f"CONVERTING {self.amount_to_convert} ${self.ticker} to {self.currency}...")
+        logger.debug("Executing convert command: amount='%s', ticker='%s', currency='%s'", self.amount_to_convert, self.ticker, self.currency)
+        logger.info("CONVERTING %s $%s to %s...", self.amount_to_convert, self.ticker, f'${self.to_ticker}' if self.to_ticker else self.currency)
 
         if self.show_date:
-            logger.info(f"Timestamp: {get_timestamp()}")
+            logger.info("Timestamp: %s", get_timestamp())
+
+        if self.to_ticker is not None:
+            self._execute_crypto_conversion()
+            return
 
-        price: float = self.client.fetch_single_price_data(self.ticker, self.currency)
+        # Fetched as a batch of one so the quote cache (max_stale, serving the last quote on failure) applies
+        data = self.client.fetch_multiple_price_data(self.ticker, self.currency)
+        price: float = data.get(self.ticker, {}).get("price", 0.0)
+        if not price:
+            raise APIError(f"No price data returned for '{self.ticker}'")
 
         converted_amount: float = self._calculate_conversion(price)
         print_output(format_convert_output(self.ticker, self.currency, self.amount_to_convert, converted_amount))
 
 
+    def _execute_crypto_conversion(self) -> None:
+        """
+        Converts between two cryptocurrencies using a single batched quote fetch.
+
+        :raises APIError: If either price is missing.
+        """
+        data = self.client.fetch_multiple_price_data(f"{self.ticker},{self.to_ticker}", self.currency)
+        from_price = data.get(self.ticker, {}).get("price", 0.0)
+        to_price = data.get(self.to_ticker, {}).get("price", 0.0)
+        if not from_price or not to_price:
+            raise APIError(f"No price data returned for '{self.ticker}' and/or '{self.to_ticker}'")
+
+        converted_amount = self.amount_to_convert * cross_rate(from_price, to_price)
+        print_output(format_crypto_convert_output(self.ticker, self.to_ticker, self.amount_to_convert, converted_amount))
+
+
     def _calculate_conversion(self, fetched_crypto_price: float) -> float:
         """
         Calculates conversion between supplied amount and the fetched crypto price.
@@ -0,0 +1,76 @@
+import logging
+from pathlib import Path
+import time
+from typing import Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_price_history_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import parse_time_arg, resolve_currency, resolve_provider, validate_tickers
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.export.arrow_export import export_table, price_history_to_table, validate_export_path
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class HistoryCommand(Command):
+    """Fetch the price history of a cryptocurrency."""
+
+    def __init__(self, client: BaseAPIClient, ticker: str, currency: str, provider: str, since: str, until: Optional[str], limit: int,
+                 export: Optional[str] = None):
+        """
+        :param client: The API client to use for fetching price history.
+        :param ticker: The cryptocurrency ticker symbol.
+        :param currency: The fiat currency code to fetch prices in.
+        :param provider: The API provider name.
+        :param since: Start of the time range (absolute date or relative offset).
+        :param until: End of the time range (absolute date or relative offset, default: now).
+        :param limit: The maximum number of (most recent) points to display.
+        :param export: Path of a Parquet/Arrow file or Parquet dataset directory to also export the full range to.
+        """
+        super().__init__(client)
+        self.ticker = ticker
+        self.currency = currency
+        self.provider = provider
+        self.since_raw = since
+        self.until_raw = until
+        self.since: int = 0
+        self.until: int = 0
+        self.limit = limit
+        self.export = export
+        self.export_path: Optional[Path] = None
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for history command")
+
+        self.ticker = self.ticker.strip().upper()
+        validate_tickers([self.ticker])
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        self.since = parse_time_arg(self.since_raw)  # type: ignore
+        self.until = parse_time_arg(self.until_raw) or int(time.time())
+        if self.since > self.until:
+            raise CommandError(f"Invalid time range: '{self.since_raw}' is after '{self.until_raw}'")
+
+        if self.limit <= 0:
+            raise CommandError(f"Limit must be positive. Received: '{self.limit}'")
+
+        if self.export:
+            self.export_path = validate_export_path(self.export)
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.debug("Executing history command: ticker='%s', currency='%s', range=[%s, %s]", self.ticker, self.currency, self.since, self.until)
+        logger.info("FETCHING PRICE HISTORY FOR $%s...", self.ticker)
+
+        points = self.client.fetch_price_history(self.ticker, self.currency, self.since, self.until)
+        format_price_history_output(self.ticker, points, self.currency, self.limit)
+
+        if self.export_path is not None:
+            export_table(price_history_to_table(self.ticker, self.currency, points), self.export_path)
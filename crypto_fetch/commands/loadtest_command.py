@@ -0,0 +1,158 @@
+import dataclasses
+import logging
+from pathlib import Path
+import tempfile
+from typing import List, Optional
+
+from crypto_fetch.api.api_client import APIConfig, BaseAPIClient
+from crypto_fetch.api.cg_api_client import CoinGeckoAPIClient
+from crypto_fetch.api.client_factory import create_api_config
+from crypto_fetch.api.cmc_api_client import CoinMarketCapAPIClient
+from crypto_fetch.api.formatter import format_loadtest_output
+from crypto_fetch.api.quote_cache import QuoteCache
+from crypto_fetch.api.usage_ledger import UsageLedger
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider, validate_tickers
+from crypto_fetch.config.config import load_api_config_from_file
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    LOADTEST_DEFAULT_DURATION,
+    LOADTEST_DEFAULT_LATENCY_MS,
+    LOADTEST_DEFAULT_TICKERS,
+    LOADTEST_DEFAULT_WORKERS,
+    PROVIDER_COINGECKO,
+    PROVIDER_COINGECKO_PRICE_EP,
+    PROVIDER_COINMARKETCAP_PRICE_EP,
+)
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.history.series_cache import PriceSeriesCache
+from crypto_fetch.loadtest.runner import LoadRunner
+from crypto_fetch.loadtest.stub_server import StubConfig, StubProviderServer
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class LoadTestCommand(Command):
+    """
+    Load test an API client against a local stub of the provider's price endpoint. Runs offline:
+    no API keys or credits are used, and the user's caches and usage ledger are left untouched.
+    """
+
+    def __init__(self, tickers: Optional[str], currency: Optional[str], provider: Optional[str], workers: int = LOADTEST_DEFAULT_WORKERS,
+                 rps: Optional[float] = None, duration: float = LOADTEST_DEFAULT_DURATION, requests: Optional[int] = None,
+                 latency: float = LOADTEST_DEFAULT_LATENCY_MS, jitter: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, keys: int = 1):
+        """
+        :param tickers: Comma separated tickers to request (default: LOADTEST_DEFAULT_TICKERS).
+        :param currency: The fiat currency to request quotes in.
+        :param provider: The API provider whose client and endpoint are tested.
+        :param workers: The number of concurrent workers.
+        :param rps: The target requests per second (None to send requests as fast as the workers allow).
+        :param duration: How long to send requests for, in seconds.
+        :param requests: Stop after this many requests (None for no limit).
+        :param latency: The latency of the stub server, in milliseconds.
+        :param jitter: The maximum random latency added to each response, in milliseconds.
+        :param error_rate: The fraction of requests the stub fails with a 500.
+        :param throttle_rate: The fraction of requests the stub rejects with a 429.
+        :param keys: The number of (fake) API keys the client spreads requests over.
+        """
+        super().__init__(client=None)
+        self.tickers_raw = tickers
+        self.tickers: List[str] = []
+        self.currency = currency
+        self.provider = provider
+        self.workers = workers
+        self.rps = rps
+        self.duration = duration
+        self.requests = requests
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.keys = keys
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for loadtest command")
+
+        self.tickers = list(dict.fromkeys(t.strip().upper() for t in (self.tickers_raw or LOADTEST_DEFAULT_TICKERS).split(",") if t.strip()))
+        if not self.tickers:
+            raise CommandError("At least one ticker is required")
+        validate_tickers(self.tickers)
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        if self.workers <= 0:
+            raise CommandError(f"Number of workers must be positive. Received: '{self.workers}'")
+        if self.rps is not None and self.rps <= 0:
+            raise CommandError(f"Requests per second must be positive. Received: '{self.rps}'")
+        if self.duration <= 0:
+            raise CommandError(f"Duration must be positive. Received: '{self.duration}'")
+        if self.requests is not None and self.requests <= 0:
+            raise CommandError(f"Number of requests must be positive. Received: '{self.requests}'")
+        if self.latency < 0 or self.jitter < 0:
+            raise CommandError("Latency and jitter must not be negative")
+        for name, rate in (("Error rate", self.error_rate), ("Throttle rate", self.throttle_rate)):
+            if not 0 <= rate <= 1:
+                raise CommandError(f"{name} must be between 0 and 1. Received: '{rate}'")
+        if self.error_rate + self.throttle_rate > 1:
+            raise CommandError("Error rate and throttle rate must not add up to more than 1")
+        if self.keys <= 0:
+            raise CommandError(f"Number of keys must be positive. Received: '{self.keys}'")
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        mode = f"{self.rps:g} REQUEST(S)/S" if self.rps else f"{self.workers} WORKER(S)"
+        logger.info("LOAD TESTING %s CLIENT AT %s FOR %ss...", self.provider.upper(), mode, f"{self.duration:g}")
+
+        stub_config = StubConfig(latency=self.latency / 1000, jitter=self.jitter / 1000,
+                                 error_rate=self.error_rate, throttle_rate=self.throttle_rate)
+        tickers = ",".join(self.tickers)
+        with tempfile.TemporaryDirectory(prefix="crypto-fetch-loadtest-") as tmp_dir, StubProviderServer(stub_config) as server:
+            client = self._create_client(server, Path(tmp_dir))
+            try:
+                runner = LoadRunner(lambda: client.fetch_multiple_price_data(tickers, self.currency), self.workers, self.rps)
+                result = runner.run(self.duration, self.requests)
+            finally:
+                client.close()
+
+        format_loadtest_output(self.provider, mode.lower(), result)
+
+
+    def _create_client(self, server: StubProviderServer, data_dir: Path) -> BaseAPIClient:
+        """
+        Creates a client for the provider, configured as in the config file (timeout, HTTP backend)
+        but pointed at the stub server, with fake keys and no credit budgets or key rate limits.
+
+        :param server: The running stub server.
+        :param data_dir: The directory the client's caches and usage ledger are kept in.
+        :return: The API client.
+        """
+        config: APIConfig = dataclasses.replace(
+            create_api_config(self.provider, load_api_config_from_file()),
+            base_url=server.get_base_url(self.provider),
+            price_endpoint=PROVIDER_COINGECKO_PRICE_EP if self.provider == PROVIDER_COINGECKO else PROVIDER_COINMARKETCAP_PRICE_EP,
+            api_keys=[_get_fake_key(self.provider, i) for i in range(self.keys)],
+            daily_credit_budget=None,
+            monthly_credit_budget=None,
+            key_rate_limit=None,
+        )
+        caches = (PriceSeriesCache(data_dir / "history"), QuoteCache(data_dir / "quotes.db"), UsageLedger(data_dir / "usage.db"))
+        if self.provider == PROVIDER_COINGECKO:
+            return CoinGeckoAPIClient(config, *caches)
+        return CoinMarketCapAPIClient(config, *caches)
+
+
+def _get_fake_key(provider: str, index: int) -> str:
+    """
+    Gets a fake API key in the provider's key format.
+
+    :param provider: The API provider name.
+    :param index: The key number.
+    :return: The API key.
+    """
+    if provider == PROVIDER_COINGECKO:
+        return f"CG-{index:024d}"
+    return f"00000000-0000-0000-0000-{index:012d}"
@@ -0,0 +1,76 @@
+import csv
+import logging
+from pathlib import Path
+from typing import Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_market_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider
+from crypto_fetch.constants import CF_LOGGER, MARKET_SORT_FIELDS
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+MARKET_CSV_FIELDS = ["rank", "ticker", "name", "price", "1h_change", "24h_change", "7d_change", "24h_volume", "market_cap"]
+
+
+class MarketCommand(Command):
+    """List the top cryptocurrencies by market."""
+
+    def __init__(self, client: BaseAPIClient, limit: int, sort: str, currency: str, provider: str, output: Optional[str] = None):
+        """
+        :param client: The API client to use for fetching market listings.
+        :param limit: The number of listings to fetch.
+        :param sort: The field to sort by (one of MARKET_SORT_FIELDS), descending.
+        :param currency: The fiat currency code.
+        :param provider: The API provider name.
+        :param output: Path of a CSV file to write the listings to instead of the console.
+        """
+        super().__init__(client)
+        self.limit = limit
+        self.sort = sort
+        self.currency = currency
+        self.provider = provider
+        self.output = Path(output) if output else None
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for market command")
+
+        if self.limit <= 0:
+            raise CommandError(f"Limit must be a positive number. Got: {self.limit}")
+        if self.sort not in MARKET_SORT_FIELDS:
+            raise CommandError(f"Unsupported sort field: '{self.sort}'. Supported: {', '.join(MARKET_SORT_FIELDS)}")
+        if self.output is not None and not self.output.parent.exists():
+            raise CommandError(f"Output directory not found: '{self.output.parent}'")
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.info("FETCHING TOP %s MARKET LISTING(S) BY %s...", self.limit, self.sort.upper())
+        pages = self.client.fetch_market_listings(self.currency, self.limit, self.sort)
+
+        written = 0
+        if self.output is None:
+            for page in pages:
+                format_market_output(page, self.currency, show_header=written == 0)
+                written += len(page)
+        else:
+            with open(self.output, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(MARKET_CSV_FIELDS)
+                for page in pages:
+                    writer.writerows(
+                        [entry.rank, entry.ticker, entry.name, *(entry.quote.get(field, 0.0) for field in MARKET_CSV_FIELDS[3:])]
+                        for entry in page
+                    )
+                    f.flush()
+                    written += len(page)
+            logger.info("Wrote %s market listing(s) to: '%s'", written, self.output)
+
+        logger.debug("Streamed %s market listing(s)", written)
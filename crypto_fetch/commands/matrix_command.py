@@ -0,0 +1,56 @@
+import logging
+from typing import List
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_cross_rate_matrix_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider, validate_tickers
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.rates.cross_rates import cross_rate_matrix, prices_from_quotes
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class MatrixCommand(Command):
+    """Display the crypto-to-crypto cross-rate matrix."""
+
+    def __init__(self, client: BaseAPIClient, tickers: str, currency: str, provider: str):
+        """
+        :param client: The API client to use for fetching price data.
+        :param tickers: Comma-separated cryptocurrency ticker symbols.
+        :param currency: The fiat currency code the cross rates are derived from.
+        :param provider: The API provider name.
+        """
+        super().__init__(client)
+        self.tickers = tickers
+        self.ticker_list: List[str] = []
+        self.currency = currency
+        self.provider = provider
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for matrix command")
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        self.ticker_list = list(dict.fromkeys(t.strip().upper() for t in self.tickers.split(",") if t.strip()))
+        if len(self.ticker_list) < 2:
+            raise CommandError(f"At least two tickers are required. Got: {self.tickers}")
+        validate_tickers(self.ticker_list)
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.debug("Executing matrix command for ticker(s): '%s', currency: '%s'", self.ticker_list, self.currency)
+        logger.info("BUILDING CROSS-RATE MATRIX FOR: %s...", ','.join(f'${t}' for t in self.ticker_list))
+
+        data = self.client.fetch_multiple_price_data(",".join(self.ticker_list), self.currency)
+        missing = [t for t in self.ticker_list if not data.get(t, {}).get("price")]
+        if missing:
+            logger.warning("No price data returned for: %s", ', '.join(missing))
+
+        matrix = cross_rate_matrix(prices_from_quotes(data, self.ticker_list))
+        format_cross_rate_matrix_output(self.ticker_list, matrix, self.currency)
@@ -1,14 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+import glob
 import logging
 from pathlib import Path
-
-import yaml  # type: ignore
+from typing import Dict, List, Optional, Union
 
 from crypto_fetch.api.api_client import BaseAPIClient
-from crypto_fetch.api.formatter import format_portfolio_output
+from crypto_fetch.api.formatter import (
+    format_account_breakdown_output,
+    format_portfolio_output,
+    format_portfolio_summary_output,
+)
+from crypto_fetch.api.request_log import RequestLog
 from crypto_fetch.commands.command import Command
 from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider, validate_tickers
-from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.constants import CF_LOGGER, PORTFOLIO_MAX_PARSE_WORKERS
 from crypto_fetch.exceptions import CommandError
+from crypto_fetch.export.arrow_export import export_table, validate_export_path, valuations_to_table
+from crypto_fetch.portfolio.history_store import PortfolioHistoryStore, Valuation
+from crypto_fetch.portfolio.holdings_reader import Holdings, read_holdings
 
 logger = logging.getLogger(CF_LOGGER)
 
@@ -16,93 +25,142 @@ logger = logging.getLogger(CF_LOGGER)
 class PortfolioCommand(Command):
     """Display portfolio holdings with live prices."""
 
-    def __init__(self, client: BaseAPIClient, portfolio_file: str, currency: str, provider: str):
+    def __init__(self, client: BaseAPIClient, portfolio_files: Union[str, List[str]], currency: str, provider: str, by_account: bool = False, record_history: bool = True,
+                 export: Optional[str] = None):
         """
         :param client: The API client to use for fetching price data.
-        :param portfolio_file: Path to the portfolio file (YAML or txt).
+        :param portfolio_files: Path(s) or glob pattern(s) of portfolio files (YAML, CSV, NDJSON or txt).
         :param currency: The fiat currency code to value holdings in.
         :param provider: The API provider name.
+        :param by_account: Whether to also show a per-account breakdown.
+        :param record_history: Whether to record the valuation(s) in the portfolio history store.
+        :param export: Path of a Parquet/Arrow file or Parquet dataset directory to also export the holdings to.
         """
         super().__init__(client)
-        self.portfolio_file: Path = Path(portfolio_file)
+        self.file_patterns: List[str] = [portfolio_files] if isinstance(portfolio_files, str) else list(portfolio_files)
+        self.portfolio_files: List[Path] = []
         self.currency = currency
         self.provider = provider
+        self.by_account = by_account
+        self.record_history = record_history
+        self.export = export
+        self.export_path: Optional[Path] = None
+        self.portfolios: Dict[Path, Holdings] = {}
         self.holdings: dict[str, float] = {}
 
 
     def _validate(self) -> None:
         logger.debug("Validating parsed arguments for portfolio command")
 
-        if not self.portfolio_file.exists():
-            raise CommandError(f"Supplied portfolio file not found: '{self.portfolio_file}'")
+        self.portfolio_files = self._resolve_portfolio_files()
+        self.portfolios = self._load_portfolios()
 
-        self.holdings = self._load_holdings_file()
-        logger.debug(f"Loaded {len(self.holdings)} holding(s) from '{self.portfolio_file}': {self.holdings}")
+        self.holdings = {}
+        for holdings in self.portfolios.values():
+            for ticker, amount in holdings.totals.items():
+                self.holdings[ticker] = self.holdings.get(ticker, 0.0) + amount
+        logger.debug("Loaded %s portfolio file(s) with %s distinct ticker(s)", len(self.portfolios), len(self.holdings))
         validate_tickers(list(self.holdings.keys()))
 
         self.currency = resolve_currency(self.currency)
         self.provider = resolve_provider(self.provider)
 
+        if self.export:
+            self.export_path = validate_export_path(self.export)
+
         logger.debug("Arguments validated successfully")
 
 
     def _execute(self) -> None:
-        logger.debug(f"Fetching prices for {len(self.holdings)} holding(s) using provider '{self.provider}'")
+        logger.debug("Fetching prices for %s holding(s) using provider '%s'", len(self.holdings), self.provider)
         tickers = ",".join(self.holdings.keys())
+        RequestLog().record(self.provider, self.currency, self.holdings.keys())
         price_data = self.client.fetch_multiple_price_data(tickers, self.currency)
 
         missing = [t for t in self.holdings if t not in price_data]
         if missing:
-            logger.warning(f"No price data returned for: {', '.join(missing)}")
+            logger.warning("No price data returned for: %s", ', '.join(missing))
+
+        multiple = len(self.portfolios) > 1
+        valuations: Dict[str, float] = {}
+        for path, holdings in self.portfolios.items():
+            title = f"Portfolio Holdings ({path.name})" if multiple else "Portfolio Holdings"
+            valuations[str(path)] = format_portfolio_output(holdings.totals, price_data, self.currency, title)
+            if self.by_account:
+                format_account_breakdown_output(holdings.by_account, price_data, self.currency)
+
+        if multiple:
+            format_portfolio_summary_output(valuations, len(self.holdings), self.currency)
+
+        if self.record_history or self.export_path is not None:
+            prices = {ticker: data.get("price", 0.0) for ticker, data in price_data.items()}
+            snapshots = [
+                Valuation(str(path.resolve()), self.currency, self.provider, holdings.totals, prices)
+                for path, holdings in self.portfolios.items()
+            ]
+            if self.record_history:
+                self._record_valuations(snapshots)
+            if self.export_path is not None:
+                export_table(valuations_to_table(snapshots), self.export_path)
+
+
+    def _record_valuations(self, valuations: List[Valuation]) -> None:
+        """
+        Records the valuation of every portfolio file in the history store.
+        A failure to record is logged but does not fail the command.
 
-        format_portfolio_output(self.holdings, price_data, self.currency)
+        :param valuations: The valuation of every portfolio file.
+        """
+        try:
+            with PortfolioHistoryStore() as store:
+                store.record(valuations)
+        except CommandError as ex:
+            logger.warning("Portfolio valuation was not recorded: %s", ex)
 
 
-    def _load_holdings_file(self) -> dict[str, float]:
+    def _resolve_portfolio_files(self) -> List[Path]:
         """
-        Parses the supplied portfolio file (YAML/txt) into a map of [ticker -> amount].
-        - YAML format: 'TICKER: amount'
-        - txt format: 'TICKER amount'
+        Expands the supplied paths / glob patterns into a list of unique portfolio files.
 
-        :return: Map of [ticker -> amount].
-        :raises CommandError: If the file is empty / invalid.
+        :return: The portfolio file paths, in the order supplied.
+        :raises CommandError: If a path does not exist or a pattern matches no files.
+        """
+        files: Dict[Path, None] = {}
+        for pattern in self.file_patterns:
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern, recursive=True))
+                if not matches:
+                    raise CommandError(f"No portfolio files match pattern: '{pattern}'")
+                for match in matches:
+                    files[Path(match)] = None
+            else:
+                path = Path(pattern)
+                if not path.exists():
+                    raise CommandError(f"Supplied portfolio file not found: '{path}'")
+                files[path] = None
+        return list(files)
+
+
+    def _load_portfolios(self) -> Dict[Path, Holdings]:
         """
-        logger.debug(f"Reading portfolio file: '{self.portfolio_file}'")
-        with open(self.portfolio_file, "r") as f:
-            content = f.read()
+        Parses all portfolio files concurrently.
 
-        data = yaml.safe_load(content)
-        if not isinstance(data, dict):
-            logger.debug("File is not YAML dict format, attempting plain-text parsing")
-            data = self._parse_txt_holdings(content)
+        :return: Map of [file path -> aggregated holdings], in the order supplied.
+        :raises CommandError: If any file fails to parse.
+        """
+        if len(self.portfolio_files) == 1:
+            path = self.portfolio_files[0]
+            return {path: read_holdings(path, self.by_account)}
 
-        if not data:
-            raise CommandError("Portfolio file is empty")
+        workers = min(PORTFOLIO_MAX_PARSE_WORKERS, len(self.portfolio_files))
+        logger.debug("Parsing %s portfolio file(s) using %s worker(s)", len(self.portfolio_files), workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {path: executor.submit(read_holdings, path, self.by_account) for path in self.portfolio_files}
 
-        holdings = {}
-        for k, v in data.items():
+        portfolios: Dict[Path, Holdings] = {}
+        for path, future in futures.items():
             try:
-                holdings[k.upper()] = float(v)
-            except (ValueError, TypeError):
-                raise CommandError(f"Invalid amount for '{k}': '{v}' is not a number")
-        return holdings
-
-
-    def _parse_txt_holdings(self, content: str) -> dict:
-        """
-        Parses plain-text portfolio format: 'TICKER amount' per line.
-
-        :param content: Content line from portfolio file.
-        :return: a map of ticker to amount.
-        """
-        data = {}
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                logger.debug(f"Skipping line: '{line}'")
-                continue
-            parts = line.split()
-            if len(parts) != 2:
-                raise CommandError(f"Invalid line in portfolio file: '{line}'")
-            data[parts[0]] = parts[1]
-        return data
\ No newline at end of file
+                portfolios[path] = future.result()
+            except CommandError as ex:
+                raise CommandError(f"Failed to read portfolio file '{path}': {ex}") from ex
+        return portfolios
@@ -0,0 +1,75 @@
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from crypto_fetch.api.formatter import format_portfolio_history_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import parse_time_arg, validate_currency
+from crypto_fetch.constants import CF_LOGGER, HISTORY_INTERVALS
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.export.arrow_export import export_table, validate_export_path, valuation_summaries_to_table
+from crypto_fetch.portfolio.history_store import PortfolioHistoryStore
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class PortfolioHistoryCommand(Command):
+    """Query recorded portfolio valuations."""
+
+    def __init__(self, portfolio_files: List[str], since: Optional[str], until: Optional[str], interval: str, currency: Optional[str],
+                 export: Optional[str] = None):
+        """
+        :param portfolio_files: Portfolio files to include (all recorded portfolios if empty).
+        :param since: Start of the time range (absolute date or relative offset).
+        :param until: End of the time range (absolute date or relative offset).
+        :param interval: The aggregation period.
+        :param currency: Only include valuations in this currency.
+        :param export: Path of a Parquet/Arrow file or Parquet dataset directory to also export the summaries to.
+        """
+        super().__init__(client=None)
+        self.portfolio_files = portfolio_files
+        self.portfolios: List[str] = []
+        self.since_raw = since
+        self.until_raw = until
+        self.since: Optional[int] = None
+        self.until: Optional[int] = None
+        self.interval = interval
+        self.currency = currency
+        self.export = export
+        self.export_path: Optional[Path] = None
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for portfolio history command")
+
+        self.portfolios = [str(Path(f).resolve()) for f in self.portfolio_files]
+        self.since = parse_time_arg(self.since_raw)
+        self.until = parse_time_arg(self.until_raw)
+        if self.since is not None and self.until is not None and self.since > self.until:
+            raise CommandError(f"Invalid time range: '{self.since_raw}' is after '{self.until_raw}'")
+
+        if self.interval not in HISTORY_INTERVALS:
+            raise CommandError(f"Unknown history interval: '{self.interval}'")
+
+        if self.currency is not None:
+            self.currency = validate_currency(self.currency)
+
+        if self.export:
+            self.export_path = validate_export_path(self.export)
+
+        logger.debug("Arguments validated successfully")
+
+
+    def _execute(self) -> None:
+        logger.debug("Querying portfolio history: portfolios=%s, since=%s, until=%s, interval='%s'", self.portfolios or 'all', self.since, self.until, self.interval)
+        with PortfolioHistoryStore() as store:
+            summaries = store.query(self.portfolios, self.since, self.until, self.interval, self.currency)
+
+        if not summaries:
+            logger.info("No recorded valuations found for the supplied range")
+            return
+        format_portfolio_history_output(summaries)
+
+        if self.export_path is not None:
+            export_table(valuation_summaries_to_table(summaries), self.export_path)
+
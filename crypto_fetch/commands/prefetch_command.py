@@ -0,0 +1,55 @@
+import logging
+import time
+from typing import Optional
+
+from crypto_fetch.api.prefetcher import Prefetcher
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import parse_duration_arg
+from crypto_fetch.config.config import load_api_config_from_file
+from crypto_fetch.constants import CF_LOGGER, PREFETCH_CHECK_INTERVAL, PREFETCH_DEFAULT_LEAD
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class PrefetchCommand(Command):
+    """Warm the quote cache with the quotes that are usually requested soon."""
+
+    def __init__(self, lead: Optional[str], watch: bool = False):
+        """
+        :param lead: How far ahead to prefetch (e.g. '15m', default: PREFETCH_DEFAULT_LEAD seconds).
+        :param watch: Whether to keep prefetching every PREFETCH_CHECK_INTERVAL seconds until interrupted.
+        """
+        super().__init__(client=None)
+        self.lead_raw = lead
+        self.lead: int = PREFETCH_DEFAULT_LEAD
+        self.watch = watch
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for prefetch command")
+
+        self.lead = parse_duration_arg(self.lead_raw) or PREFETCH_DEFAULT_LEAD
+        if self.watch and self.lead < PREFETCH_CHECK_INTERVAL:
+            raise CommandError(f"Lead must be at least {PREFETCH_CHECK_INTERVAL}s with --watch, or quotes could be missed")
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.info("PREFETCHING QUOTES NEEDED IN THE NEXT %s MINUTE(S)...", self.lead // 60)
+
+        prefetcher = Prefetcher(load_api_config_from_file())
+        try:
+            while True:
+                plan = prefetcher.plan(self.lead)
+                if plan:
+                    fetched = prefetcher.warm(plan)
+                    logger.info("Prefetched %s quote(s) for %s ticker set(s)", fetched, len(plan))
+                else:
+                    logger.info("No quotes expected to be needed")
+                if not self.watch:
+                    break
+                time.sleep(PREFETCH_CHECK_INTERVAL)
+        finally:
+            prefetcher.close()
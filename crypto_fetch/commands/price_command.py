@@ -1,12 +1,16 @@
 import logging
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
 from crypto_fetch.api.api_client import BaseAPIClient
 from crypto_fetch.api.formatter import format_price_output, print_output
+from crypto_fetch.api.request_log import RequestLog
 from crypto_fetch.commands.command import Command
-from crypto_fetch.commands.command_utils import get_timestamp, resolve_currency, resolve_provider, validate_tickers
+from crypto_fetch.commands.command_utils import get_timestamp, resolve_currency, resolve_provider, validate_currency, validate_tickers
 from crypto_fetch.constants import CF_LOGGER
 from crypto_fetch.exceptions import CommandError
+from crypto_fetch.export.arrow_export import export_table, quotes_to_table, validate_export_path
+from crypto_fetch.rates.fx import FXConverter
 
 logger = logging.getLogger(CF_LOGGER)
 
@@ -14,28 +18,45 @@ logger = logging.getLogger(CF_LOGGER)
 class PriceCommand(Command):
     """Fetch cryptocurrency prices"""
 
-    def __init__(self, client: BaseAPIClient, tickers: str, currency: str, provider: str, verbose: bool, show_date: bool = False):
+    def __init__(self, client: BaseAPIClient, tickers: str, currency: str, provider: str, verbose: bool, show_date: bool = False, limit: Optional[int] = None, page: bool = False,
+                 export: Optional[str] = None):
         """
         :param client: The API client to use for fetching price data.
         :param tickers: Comma-separated cryptocurrency ticker symbols.
-        :param currency: The fiat currency code to fetch prices in.
+        :param currency: The fiat currency code(s) to fetch prices in (comma-separated).
         :param provider: The API provider name.
         :param verbose: Whether to show detailed output.
         :param show_date: Whether to display the current timestamp in the output.
+        :param limit: The maximum number of tickers shown in verbose mode (None or 0 for all).
+        :param page: Whether verbose output should be shown through the console pager.
+        :param export: Path of a Parquet/Arrow file or Parquet dataset directory to also export the quotes to.
         """
         super().__init__(client)
         self.tickers = tickers
         self.ticker_list: List[str] = []
         self.currency = currency
+        self.currencies: List[str] = []
         self.provider = provider
         self.verbose = verbose
         self.show_date = show_date
+        self.limit = limit or None
+        self.page = page
+        self.export = export
+        self.export_path: Optional[Path] = None
 
 
     def _validate(self) -> None:
         logger.debug("Validating parsed arguments for price command")
 
-        self.currency = resolve_currency(self.currency)
+        if self.currency and "," in self.currency:
+            self.currencies = [validate_currency(c.strip()) for c in self.currency.split(",") if c.strip()]
+            self.currencies = list(dict.fromkeys(self.currencies))
+            if not self.currencies:
+                raise CommandError(f"No valid currencies provided. Got: {self.currency}")
+            self.currency = self.currencies[0]
+        else:
+            self.currency = resolve_currency(self.currency)
+            self.currencies = [self.currency]
         self.provider = resolve_provider(self.provider)
 
         self.ticker_list = [t.strip().upper() for t in self.tickers.split(",") if t.strip()]
@@ -43,16 +64,34 @@ class PriceCommand(Command):
             raise CommandError(f"No valid tickers provided. Got: {self.tickers}")
         validate_tickers(self.ticker_list)
 
+        if self.limit is not None and self.limit < 0:
+            raise CommandError(f"Verbose limit must not be negative. Got: {self.limit}")
+
+        if self.export:
+            self.export_path = validate_export_path(self.export)
+
         logger.debug("Validated arguments successfully")
         
     
     def _execute(self) -> None:
-        logger.debug(f"Executing price command for ticker(s): '{self.ticker_list}', currency: '{self.currency}'")
-        logger.info(f"FETCHING PRICE DATA FOR TICKER(S): {','.join(f'${t}' for t in self.ticker_list)}...")
+        logger.debug("Executing price command for ticker(s): '%s', currency: '%s'", self.ticker_list, self.currency)
+        logger.info("FETCHING PRICE DATA FOR TICKER(S): %s...", ','.join(f'${t}' for t in self.ticker_list))
 
         if self.show_date:
-            logger.info(f"Timestamp: {get_timestamp()}")
-        data = self.client.fetch_multiple_price_data(",".join(self.ticker_list), self.currency)
-        result = format_price_output(data, self.currency, self.client.config.base_url, self.verbose)
-        if result:
-            print_output(result)
\ No newline at end of file
+            logger.info("Timestamp: %s", get_timestamp())
+        tickers = ",".join(self.ticker_list)
+        if len(self.currencies) == 1:
+            RequestLog().record(self.provider, self.currency, self.ticker_list)
+            data_by_currency = {self.currency: self.client.fetch_multiple_price_data(tickers, self.currency)}
+        else:
+            fx_converter = FXConverter(self.client)
+            RequestLog().record(self.provider, fx_converter.base_currency, self.ticker_list)
+            data_by_currency = fx_converter.fetch_multiple_price_data(tickers, self.currencies)
+
+        for currency, data in data_by_currency.items():
+            result = format_price_output(data, currency, self.client.config.base_url, self.verbose, self.limit, self.page)
+            if result:
+                print_output(result)
+
+        if self.export_path is not None:
+            export_table(quotes_to_table(data_by_currency, self.provider), self.export_path)
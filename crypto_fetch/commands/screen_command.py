@@ -0,0 +1,77 @@
+import logging
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.api.formatter import format_market_output, print_output
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import resolve_currency, resolve_provider
+from crypto_fetch.constants import CF_LOGGER, SCREEN_FIELDS
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.screener.batch import QuoteBatch, top_k
+from crypto_fetch.screener.expression import ScreenExpression
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class ScreenCommand(Command):
+    """Filter the market listings with an expression."""
+
+    def __init__(self, client: BaseAPIClient, expression: str, currency: str, provider: str, sort: str = "market_cap", ascending: bool = False, top: int = 25, universe: int = 5000):
+        """
+        :param client: The API client to use for fetching market listings.
+        :param expression: The filter expression, e.g. 'market_cap > 1e9 and 24h_change < -5'.
+        :param currency: The fiat currency code.
+        :param provider: The API provider name.
+        :param sort: The field to rank matches by.
+        :param ascending: Whether the smallest values rank first.
+        :param top: The number of matches to show.
+        :param universe: The number of listings (by market cap) to screen.
+        """
+        super().__init__(client)
+        self.expression = expression
+        self.compiled: ScreenExpression = None  # type: ignore
+        self.currency = currency
+        self.provider = provider
+        self.sort = sort
+        self.ascending = ascending
+        self.top = top
+        self.universe = universe
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for screen command")
+
+        self.compiled = ScreenExpression(self.expression)
+        if self.sort not in SCREEN_FIELDS:
+            raise CommandError(f"Unsupported sort field: '{self.sort}'. Supported: {', '.join(SCREEN_FIELDS)}")
+        if self.top <= 0:
+            raise CommandError(f"Top must be a positive number. Got: {self.top}")
+        if self.universe <= 0:
+            raise CommandError(f"Universe must be a positive number. Got: {self.universe}")
+
+        self.currency = resolve_currency(self.currency)
+        self.provider = resolve_provider(self.provider)
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.info("SCREENING TOP %s LISTING(S) FOR: %s...", self.universe, self.compiled.text)
+
+        # Only the current page and the best `top` matches so far are held at once
+        best = QuoteBatch.from_entries([])
+        screened = matched = 0
+        for page in self.client.fetch_market_listings(self.currency, self.universe, "market_cap"):
+            batch = QuoteBatch.from_entries(page)
+            matches = batch.select(self.compiled.evaluate(batch.columns, len(batch)))
+            screened += len(batch)
+            matched += len(matches)
+            if len(matches):
+                best = top_k(best.concat(matches), self.sort, self.top, self.ascending)
+
+        logger.debug("Screened %s listing(s), %s matched", screened, matched)
+        if not len(best):
+            print_output(f"❌ No listings matched: {self.compiled.text}")
+            return
+
+        format_market_output(best.entries, self.currency, show_header=True)
+        print_output(f"[dim]{matched} of {screened} listing(s) matched, showing {len(best)} by {self.sort}[/dim]")
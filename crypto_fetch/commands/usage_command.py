@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from crypto_fetch.api.client_factory import create_api_config
+from crypto_fetch.api.formatter import format_usage_output
+from crypto_fetch.api.usage_ledger import UsageLedger, UsageTotals
+from crypto_fetch.commands.command import Command
+from crypto_fetch.commands.command_utils import validate_provider
+from crypto_fetch.config.config import load_api_config_from_file
+from crypto_fetch.constants import CF_LOGGER, PROVIDERS_SUPPORTED
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class UsageCommand(Command):
+    """Report API calls and credits spent against the configured credit budgets."""
+
+    def __init__(self, provider: Optional[str], days: int):
+        """
+        :param provider: Only report this provider (all providers if None).
+        :param days: The number of days of daily usage to show.
+        """
+        super().__init__(client=None)
+        self.provider = provider
+        self.providers: List[str] = []
+        self.days = days
+
+
+    def _validate(self) -> None:
+        logger.debug("Validating parsed arguments for usage command")
+
+        self.providers = [validate_provider(self.provider)] if self.provider else list(PROVIDERS_SUPPORTED)
+        if self.days <= 0:
+            raise CommandError(f"Number of days must be positive. Received: '{self.days}'")
+
+        logger.debug("Validated arguments successfully")
+
+
+    def _execute(self) -> None:
+        logger.debug("Reading API usage for provider(s): %s", self.providers)
+
+        config = load_api_config_from_file()
+        ledger = UsageLedger()
+        totals: Dict[str, UsageTotals] = {}
+        budgets: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        for provider in self.providers:
+            api_config = create_api_config(provider, config)
+            totals[provider] = ledger.get_totals(provider)
+            budgets[provider] = (api_config.daily_credit_budget, api_config.monthly_credit_budget)
+
+        since = (datetime.now(timezone.utc) - timedelta(days=self.days - 1)).strftime("%Y-%m-%d")
+        daily = ledger.get_daily_usage(since, self.provider and self.providers[0])
+        format_usage_output(totals, budgets, daily)
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml  # type: ignore
 
@@ -9,19 +9,39 @@ from crypto_fetch.constants import (
     CF_LOGGER,
     CONFIG_DEFAULTS_API_TIMEOUT,
     CONFIG_DEFAULTS_CURRENCY,
+    CONFIG_DEFAULTS_FX_BASE_CURRENCY,
+    CONFIG_DEFAULTS_FX_RATES_TTL,
+    CONFIG_DEFAULTS_HTTP_BACKEND,
     CONFIG_HEADER_API_KEYS,
     CONFIG_HEADER_DEFAULTS,
     CONFIG_KEY_DEFAULTS_API_PROVIDER,
     CONFIG_KEY_DEFAULTS_API_TIMEOUT,
     CONFIG_KEY_DEFAULTS_CURRENCY,
+    CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY,
+    CONFIG_KEY_DEFAULTS_FX_RATES_TTL,
+    CONFIG_KEY_DEFAULTS_HTTP_BACKEND,
+    CONFIG_KEY_DEFAULTS_MAX_STALE,
+    CONFIG_KEY_DEFAULTS_PREFETCH_PORTFOLIOS,
     CONFIG_KEY_PROVIDER_BASE_URL,
+    CONFIG_KEY_PROVIDER_FX_EP,
+    CONFIG_KEY_PROVIDER_HISTORY_EP,
+    CONFIG_KEY_PROVIDER_LISTINGS_EP,
+    CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT,
     CONFIG_KEY_PROVIDER_NAME,
     CONFIG_KEY_PROVIDER_PRICE_EP,
     PROVIDER_COINMARKETCAP,
     PROVIDER_COINMARKETCAP_BASE_URL,
+    PROVIDER_COINMARKETCAP_FX_EP,
+    PROVIDER_COINMARKETCAP_HISTORY_EP,
+    PROVIDER_COINMARKETCAP_LISTINGS_EP,
+    PROVIDER_COINMARKETCAP_KEY_RATE_LIMIT,
     PROVIDER_COINMARKETCAP_PRICE_EP,
     PROVIDER_COINGECKO,
     PROVIDER_COINGECKO_BASE_URL,
+    PROVIDER_COINGECKO_FX_EP,
+    PROVIDER_COINGECKO_HISTORY_EP,
+    PROVIDER_COINGECKO_LISTINGS_EP,
+    PROVIDER_COINGECKO_KEY_RATE_LIMIT,
     PROVIDER_COINGECKO_PRICE_EP,
 )
 
@@ -35,17 +55,29 @@ DEFAULT_API_CONFIG: Dict[str, Any] = {
     CONFIG_HEADER_DEFAULTS: {
         CONFIG_KEY_DEFAULTS_CURRENCY: CONFIG_DEFAULTS_CURRENCY,
         CONFIG_KEY_DEFAULTS_API_PROVIDER: PROVIDER_COINMARKETCAP,
-        CONFIG_KEY_DEFAULTS_API_TIMEOUT: CONFIG_DEFAULTS_API_TIMEOUT
+        CONFIG_KEY_DEFAULTS_API_TIMEOUT: CONFIG_DEFAULTS_API_TIMEOUT,
+        CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY: CONFIG_DEFAULTS_FX_BASE_CURRENCY,
+        CONFIG_KEY_DEFAULTS_FX_RATES_TTL: CONFIG_DEFAULTS_FX_RATES_TTL,
+        CONFIG_KEY_DEFAULTS_HTTP_BACKEND: CONFIG_DEFAULTS_HTTP_BACKEND,
+        CONFIG_KEY_DEFAULTS_PREFETCH_PORTFOLIOS: []
     },
     PROVIDER_COINMARKETCAP: {
         CONFIG_KEY_PROVIDER_NAME: PROVIDER_COINMARKETCAP,
         CONFIG_KEY_PROVIDER_BASE_URL: PROVIDER_COINMARKETCAP_BASE_URL,
-        CONFIG_KEY_PROVIDER_PRICE_EP: PROVIDER_COINMARKETCAP_PRICE_EP
+        CONFIG_KEY_PROVIDER_PRICE_EP: PROVIDER_COINMARKETCAP_PRICE_EP,
+        CONFIG_KEY_PROVIDER_HISTORY_EP: PROVIDER_COINMARKETCAP_HISTORY_EP,
+        CONFIG_KEY_PROVIDER_FX_EP: PROVIDER_COINMARKETCAP_FX_EP,
+        CONFIG_KEY_PROVIDER_LISTINGS_EP: PROVIDER_COINMARKETCAP_LISTINGS_EP,
+        CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT: PROVIDER_COINMARKETCAP_KEY_RATE_LIMIT
     },
     PROVIDER_COINGECKO: {
         CONFIG_KEY_PROVIDER_NAME: PROVIDER_COINGECKO,
         CONFIG_KEY_PROVIDER_BASE_URL: PROVIDER_COINGECKO_BASE_URL,
-        CONFIG_KEY_PROVIDER_PRICE_EP: PROVIDER_COINGECKO_PRICE_EP
+        CONFIG_KEY_PROVIDER_PRICE_EP: PROVIDER_COINGECKO_PRICE_EP,
+        CONFIG_KEY_PROVIDER_HISTORY_EP: PROVIDER_COINGECKO_HISTORY_EP,
+        CONFIG_KEY_PROVIDER_FX_EP: PROVIDER_COINGECKO_FX_EP,
+        CONFIG_KEY_PROVIDER_LISTINGS_EP: PROVIDER_COINGECKO_LISTINGS_EP,
+        CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT: PROVIDER_COINGECKO_KEY_RATE_LIMIT
     }
 }
 
@@ -60,12 +92,12 @@ def init_api_config_file() -> None:
     """
     CONFIG_DIRECTORY_PATH.mkdir(parents=True, exist_ok=True)
     if CONFIG_FILE_PATH.exists():
-        logger.info(f"Config file already exists at: '{CONFIG_FILE_PATH}'")
+        logger.info("Config file already exists at: '%s'", CONFIG_FILE_PATH)
         return
     
     save_api_config_to_file(DEFAULT_API_CONFIG)
-    logger.info(f"Created config file at: '{CONFIG_FILE_PATH}'")
-    logger.info(f"Edit this file to add you API keys and set defaults")
+    logger.info("Created config file at: '%s'", CONFIG_FILE_PATH)
+    logger.info("Edit this file to add you API keys and set defaults")
 
 
 def save_api_config_to_file(config: Dict[str, Any]) -> None:
@@ -95,32 +127,41 @@ def load_api_config_from_file() -> Dict[str, Any]:
 
                 errors = validate_config(config)
                 if errors:
-                    logger.warning(f"Config has {len(errors)} issue(s). Run 'crypto-fetch config validate' for details")
+                    logger.warning("Config has %s issue(s). Run 'crypto-fetch config validate' for details", len(errors))
 
                 return config
         except yaml.YAMLError as ex:
-            logger.error(f"API config file is corrupted: {ex}. Using defaults.")
+            logger.error("API config file is corrupted: %s. Using defaults.", ex)
         except Exception as ex:
-            logger.error(f"Failed to load API config: {ex}. Using defaults.")
+            logger.error("Failed to load API config: %s. Using defaults.", ex)
     return DEFAULT_API_CONFIG.copy()
 
 
-def get_api_key(provider: str) -> Optional[str]:
+def get_api_keys(provider: str) -> List[str]:
     """
-    Gets the API key from the config file.
+    Gets the API keys from the config file.
     
-    :param provider: The provider to get the API key for.
+    :param provider: The provider to get the API keys for.
 
-    :return: the api key or None.
+    :return: the api keys (empty if there are none).
     """
     config = load_api_config_from_file()
-    api_key = config.get(CONFIG_HEADER_API_KEYS, {}).get(provider, "")
+    api_keys = parse_api_keys(config.get(CONFIG_HEADER_API_KEYS, {}).get(provider))
 
-    if api_key and isinstance(api_key, str):
-        logger.debug(f"Found API key for '{provider}' in config file")
-        return api_key.strip()
-    else:
-        return None
+    if api_keys:
+        logger.debug("Found %s API key(s) for '%s' in config file", len(api_keys), provider)
+    return api_keys
+
+
+def parse_api_keys(value: Any) -> List[str]:
+    """
+    Parses the 'api_keys' entry of a provider, which is either a single key or a list of keys.
+
+    :param value: The config value.
+    :return: The non-empty keys, stripped and without duplicates.
+    """
+    values = value if isinstance(value, list) else [value]
+    return list(dict.fromkeys(v.strip() for v in values if isinstance(v, str) and v.strip()))
 
 
 def get_default_fiat_currency() -> str:
@@ -143,30 +184,53 @@ def get_default_api_timeout() -> int:
     return config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_API_TIMEOUT, CONFIG_DEFAULTS_API_TIMEOUT)
 
 
-def get_default_api_provider() -> str:
+def get_fx_base_currency() -> str:
     """
-    Gets the default API provider from config.
-    
-    :return: provider name.
+    Gets the base currency that quotes are fetched in before FX conversion.
+
+    :return: the FX base currency code.
     """
     config = load_api_config_from_file()
-    return config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_API_PROVIDER, PROVIDER_COINMARKETCAP)
+    return str(config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY, CONFIG_DEFAULTS_FX_BASE_CURRENCY)).upper()
 
 
-def get_api_provider_config(provider: str) -> Dict[str, str]:
+def get_fx_rates_ttl() -> int:
     """
-    Gets the provider configuration from config file.
-    
-    :param provider: The provider name.
+    Gets how long cached FX rates stay fresh.
 
-    :return: Supplied or default provider configuration as a dict.
+    :return: TTL in seconds.
     """
     config = load_api_config_from_file()
-    provider_config = config.get(provider, {})
-    
-    if not provider_config:
-        logger.warning(f"No API config found for provider '{provider}'. Using defaults")
-        return DEFAULT_API_CONFIG.get(provider, {})
+    return config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_FX_RATES_TTL, CONFIG_DEFAULTS_FX_RATES_TTL)
+
+
+def get_default_max_stale() -> Optional[str]:
+    """
+    Gets how old cached quotes may be when served, for commands run without --max-stale.
+
+    :return: The duration (e.g. '10m'), or None if cached quotes should not be served.
+    """
+    config = load_api_config_from_file()
+    max_stale = config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_MAX_STALE)
+    return None if max_stale is None else str(max_stale)
+
+
+def get_prefetch_portfolios() -> List[str]:
+    """
+    Gets the portfolio files whose tickers are kept warm in the quote cache by the prefetch command.
+
+    :return: The paths or glob patterns of the portfolio files.
+    """
+    config = load_api_config_from_file()
+    return list(config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_PREFETCH_PORTFOLIOS) or [])
+
+
+def get_default_api_provider() -> str:
+    """
+    Gets the default API provider from config.
     
-    logger.debug(f"Loaded API config: {provider_config}")
-    return provider_config
\ No newline at end of file
+    :return: provider name.
+    """
+    config = load_api_config_from_file()
+    return config.get(CONFIG_HEADER_DEFAULTS, {}).get(CONFIG_KEY_DEFAULTS_API_PROVIDER, PROVIDER_COINMARKETCAP)
+
@@ -1,10 +1,15 @@
 import logging
+import re
 from typing import Any, Dict, List
 
 from crypto_fetch.constants import (
     CF_LOGGER,
     CONFIG_HEADER_API_KEYS,
     CONFIG_HEADER_DEFAULTS,
+    CONFIG_KEY_PROVIDER_DAILY_CREDIT_BUDGET,
+    CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT,
+    CONFIG_KEY_PROVIDER_MONTHLY_CREDIT_BUDGET,
+    HTTP_BACKENDS,
     PROVIDERS_SUPPORTED,
     REQUIRED_PROVIDER_CONFIG_KEYS,
 )
@@ -19,7 +24,7 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     :param config: The configuration dict to validate.
     :return: List of validation error messages, if any.
     """
-    logger.debug(f"Validating API config file...")
+    logger.debug("Validating API config file...")
     errors: List[str] = []
     
     # Check required top-level keys
@@ -30,6 +35,8 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     
     if CONFIG_HEADER_API_KEYS not in config:
         errors.append("Missing 'api_keys' section")
+    else:
+        _validate_api_keys_section(config[CONFIG_HEADER_API_KEYS], errors)
 
     _validate_providers_section(config, errors)
 
@@ -59,6 +66,14 @@ def _validate_defaults_section(defaults_section: Dict[str, Any], errors: List[st
         elif timeout <= 0 or timeout > 300:
             errors.append(f"Invalid timeout value: {timeout} (must be 1-300)")
     
+    # Validate FX rates TTL
+    fx_ttl = defaults_section.get("fx_rates_ttl")
+    if fx_ttl is not None:
+        if not isinstance(fx_ttl, int):
+            errors.append(f"Invalid fx_rates_ttl type: expected int. Got: {type(fx_ttl).__name__}")
+        elif fx_ttl <= 0:
+            errors.append(f"Invalid fx_rates_ttl value: {fx_ttl} (must be positive)")
+
     # Validate currency
     currency = defaults_section.get("currency")
     if currency and not isinstance(currency, str):
@@ -69,6 +84,39 @@ def _validate_defaults_section(defaults_section: Dict[str, Any], errors: List[st
     if provider and provider not in PROVIDERS_SUPPORTED:
         errors.append(f"Invalid provider: {provider} (must be one of: {', '.join(PROVIDERS_SUPPORTED)})")
 
+    # Validate HTTP backend
+    http_backend = defaults_section.get("http_backend")
+    if http_backend and http_backend not in HTTP_BACKENDS:
+        errors.append(f"Invalid http_backend: {http_backend} (must be one of: {', '.join(HTTP_BACKENDS)})")
+
+    # Validate max stale
+    max_stale = defaults_section.get("max_stale")
+    if max_stale is not None and not re.fullmatch(r"\d+[smhdw]?", str(max_stale).strip().lower()):
+        errors.append(f"Invalid max_stale value: {max_stale} (must be seconds or a duration like '10m')")
+
+    # Validate prefetch portfolios
+    prefetch_portfolios = defaults_section.get("prefetch_portfolios")
+    if prefetch_portfolios is not None and (not isinstance(prefetch_portfolios, list) or not all(isinstance(p, str) for p in prefetch_portfolios)):
+        errors.append("Invalid prefetch_portfolios: expected a list of file paths or glob patterns")
+
+
+def _validate_api_keys_section(api_keys_section: Dict[str, Any], errors: List[str]) -> None:
+    """
+    Validates the api_keys section in the config file. Each provider has a single key or a list of keys.
+
+    :param api_keys_section: The api_keys dict to validate.
+    :param errors: List of validation error messages.
+    """
+    if not isinstance(api_keys_section, dict):
+        errors.append(f"'api_keys' section must be a dictionary, got {type(api_keys_section).__name__}")
+        return
+
+    for provider, keys in api_keys_section.items():
+        if keys is None or isinstance(keys, str):
+            continue
+        if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+            errors.append(f"Invalid api_keys.{provider}: expected a key or a list of keys")
+
 
 def _validate_providers_section(provider_section: Dict[str, Any], errors: List[str]) -> None:
     """
@@ -93,4 +141,13 @@ def _validate_providers_section(provider_section: Dict[str, Any], errors: List[s
                 if key not in provider_config:
                     errors.append(f"Missing '{key}' in {provider} config")
                 elif not isinstance(provider_config[key], str):
-                    errors.append(f"Invalid type for {provider}.{key}: expected str")
\ No newline at end of file
+                    errors.append(f"Invalid type for {provider}.{key}: expected str")
+
+            for key in (CONFIG_KEY_PROVIDER_DAILY_CREDIT_BUDGET, CONFIG_KEY_PROVIDER_MONTHLY_CREDIT_BUDGET):
+                budget = provider_config.get(key)
+                if budget is not None and (not isinstance(budget, int) or budget < 0):
+                    errors.append(f"Invalid {provider}.{key}: {budget} (must be a non-negative int, 0 for no budget)")
+
+            key_rate_limit = provider_config.get(CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT)
+            if key_rate_limit is not None and (not isinstance(key_rate_limit, int) or key_rate_limit < 0):
+                errors.append(f"Invalid {provider}.{CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT}: {key_rate_limit} (must be a non-negative int, 0 for no limit)")
\ No newline at end of file
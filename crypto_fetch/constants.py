@@ -7,13 +7,32 @@ CF_NAME: Final[str] = "crypto-fetch"
 CF_VERSION: Final[str] = "1.0.0"
 CF_LOGGER: Final[str] = "crypto_fetch"
 
+LOG_FORMAT_RICH: Final[str] = "rich"
+LOG_FORMAT_JSON: Final[str] = "json"
+LOG_FORMATS: Final[List[str]] = [LOG_FORMAT_RICH, LOG_FORMAT_JSON]
+
 PROVIDER_COINMARKETCAP: Final[str] = "coinmarketcap"
 PROVIDER_COINMARKETCAP_BASE_URL: Final[str] = "https://pro-api.coinmarketcap.com/v1"
 PROVIDER_COINMARKETCAP_PRICE_EP: Final[str] = "/cryptocurrency/quotes/latest"
+PROVIDER_COINMARKETCAP_HISTORY_EP: Final[str] = "/cryptocurrency/ohlcv/historical"
+PROVIDER_COINMARKETCAP_HISTORY_INTERVAL: Final[str] = "hourly"
+PROVIDER_COINMARKETCAP_FX_EP: Final[str] = "/tools/price-conversion"
+PROVIDER_COINMARKETCAP_LISTINGS_EP: Final[str] = "/cryptocurrency/listings/latest"
+PROVIDER_COINMARKETCAP_LISTINGS_PAGE_SIZE: Final[int] = 500
+PROVIDER_COINMARKETCAP_QUOTES_PER_CREDIT: Final[int] = 100
+PROVIDER_COINMARKETCAP_LISTINGS_PER_CREDIT: Final[int] = 200
+PROVIDER_COINMARKETCAP_KEY_RATE_LIMIT: Final[int] = 30
 
 PROVIDER_COINGECKO: Final[str] = "coingecko"
 PROVIDER_COINGECKO_BASE_URL: Final[str] = "https://api.coingecko.com/api/v3/"
 PROVIDER_COINGECKO_PRICE_EP: Final[str] = "/simple/price"
+PROVIDER_COINGECKO_HISTORY_EP: Final[str] = "/coins/{coin_id}/market_chart/range"
+PROVIDER_COINGECKO_FX_EP: Final[str] = "/exchange_rates"
+PROVIDER_COINGECKO_LISTINGS_EP: Final[str] = "/coins/markets"
+PROVIDER_COINGECKO_LISTINGS_PAGE_SIZE: Final[int] = 250
+# market_chart/range returns hourly points for ranges of up to 90 days (5-minutely under a day, daily beyond)
+PROVIDER_COINGECKO_HOURLY_MAX_RANGE: Final[int] = 90 * 86400
+PROVIDER_COINGECKO_KEY_RATE_LIMIT: Final[int] = 30
 PROVIDERS_SUPPORTED: Final[List[str]] = [PROVIDER_COINMARKETCAP, PROVIDER_COINGECKO]
 
 # =========================================================================================================
@@ -25,6 +44,12 @@ CONFIG_HEADER_API_KEYS: Final[str] = "api_keys"
 CONFIG_KEY_PROVIDER_NAME: Final[str] = "name"
 CONFIG_KEY_PROVIDER_BASE_URL: Final[str] = "base_url"
 CONFIG_KEY_PROVIDER_PRICE_EP: Final[str] = "price_ep"
+CONFIG_KEY_PROVIDER_HISTORY_EP: Final[str] = "history_ep"
+CONFIG_KEY_PROVIDER_FX_EP: Final[str] = "fx_ep"
+CONFIG_KEY_PROVIDER_LISTINGS_EP: Final[str] = "listings_ep"
+CONFIG_KEY_PROVIDER_DAILY_CREDIT_BUDGET: Final[str] = "daily_credit_budget"
+CONFIG_KEY_PROVIDER_MONTHLY_CREDIT_BUDGET: Final[str] = "monthly_credit_budget"
+CONFIG_KEY_PROVIDER_KEY_RATE_LIMIT: Final[str] = "key_rate_limit"
 REQUIRED_PROVIDER_CONFIG_KEYS: Final[List[str]] = [
     CONFIG_KEY_PROVIDER_NAME, 
     CONFIG_KEY_PROVIDER_BASE_URL, 
@@ -33,9 +58,21 @@ REQUIRED_PROVIDER_CONFIG_KEYS: Final[List[str]] = [
 CONFIG_KEY_DEFAULTS_CURRENCY: Final[str] = "currency"
 CONFIG_KEY_DEFAULTS_API_TIMEOUT: Final[str] = "api_timeout"
 CONFIG_KEY_DEFAULTS_API_PROVIDER: Final[str] = "api_provider"
+CONFIG_KEY_DEFAULTS_FX_BASE_CURRENCY: Final[str] = "fx_base_currency"
+CONFIG_KEY_DEFAULTS_FX_RATES_TTL: Final[str] = "fx_rates_ttl"
+CONFIG_KEY_DEFAULTS_HTTP_BACKEND: Final[str] = "http_backend"
+CONFIG_KEY_DEFAULTS_MAX_STALE: Final[str] = "max_stale"
+CONFIG_KEY_DEFAULTS_PREFETCH_PORTFOLIOS: Final[str] = "prefetch_portfolios"
 
 CONFIG_DEFAULTS_CURRENCY: Final[str] = "EUR"
 CONFIG_DEFAULTS_API_TIMEOUT: Final[int] = 10
+CONFIG_DEFAULTS_FX_BASE_CURRENCY: Final[str] = "USD"
+CONFIG_DEFAULTS_FX_RATES_TTL: Final[int] = 3600
+
+HTTP_BACKEND_REQUESTS: Final[str] = "requests"
+HTTP_BACKEND_HTTP2: Final[str] = "http2"
+HTTP_BACKENDS: Final[List[str]] = [HTTP_BACKEND_REQUESTS, HTTP_BACKEND_HTTP2]
+CONFIG_DEFAULTS_HTTP_BACKEND: Final[str] = HTTP_BACKEND_REQUESTS
 
 # =========================================================================================================
 # Command Configuration
@@ -47,6 +84,123 @@ CMD_CONFIG: Final[str] = "config"
 CMD_CONFIG_INIT: Final[str] = "init"
 CMD_CONFIG_VALIDATE: Final[str] = "validate"
 CMD_CONFIG_RECREATE: Final[str] = "recreate"
+CMD_PORTFOLIO_HISTORY: Final[str] = "portfolio-history"
+CMD_HISTORY: Final[str] = "history"
+CMD_ANALYTICS: Final[str] = "analytics"
+CMD_ALERTS: Final[str] = "alerts"
+CMD_MATRIX: Final[str] = "matrix"
+CMD_MARKET: Final[str] = "market"
+CMD_SCREEN: Final[str] = "screen"
+CMD_CONSENSUS: Final[str] = "consensus"
+CMD_BATCH: Final[str] = "batch"
+CMD_BATCH_STDIN: Final[str] = "-"
+CMD_USAGE: Final[str] = "usage"
+CMD_PREFETCH: Final[str] = "prefetch"
+CMD_LOADTEST: Final[str] = "loadtest"
+
+PORTFOLIO_MAX_PARSE_WORKERS: Final[int] = 8
+
+VERBOSE_DEFAULT_LIMIT: Final[int] = 100
+
+MARKET_DEFAULT_LIMIT: Final[int] = 100
+MARKET_MAX_PAGE_WORKERS: Final[int] = 4
+MARKET_SORT_FIELDS: Final[List[str]] = ["market_cap", "24h_volume", "price", "1h_change", "24h_change", "7d_change"]
+
+BATCH_MAX_WORKERS: Final[int] = 8
+
+USAGE_DEFAULT_DAYS: Final[int] = 30
+# Fraction of a credit budget above which polling is slowed down to make the rest last the period
+USAGE_BUDGET_SOFT_LIMIT: Final[float] = 0.8
+# Usage is buffered in memory and written to the ledger (and the ledger's totals re-read) at most this often, in seconds
+USAGE_FLUSH_INTERVAL: Final[int] = 5
+
+# Responses to price and FX requests are kept (in memory and in the quote cache) with their ETag/Last-Modified
+# validators for revalidation. At most this many are kept per provider, the least recently used are dropped
+RESPONSE_CACHE_MAX_ENTRIES: Final[int] = 256
+
+# API key pool: requests per key are limited per KEY_POOL_RATE_WINDOW seconds. Keys rejected as unauthorized or
+# out of credits (401/402) are quarantined for KEY_POOL_AUTH_QUARANTINE seconds, rate limited keys (429) for
+# the Retry-After period or KEY_POOL_RATE_LIMIT_QUARANTINE seconds
+KEY_POOL_RATE_WINDOW: Final[int] = 60
+KEY_POOL_AUTH_QUARANTINE: Final[int] = 3600
+KEY_POOL_RATE_LIMIT_QUARANTINE: Final[int] = 60
+KEY_POOL_AUTH_STATUS_CODES: Final[Set[int]] = {401, 402}
+KEY_POOL_RATE_LIMIT_STATUS_CODE: Final[int] = 429
+
+LOADTEST_DEFAULT_TICKERS: Final[str] = "BTC,ETH,SOL,XRP,ADA"
+LOADTEST_DEFAULT_WORKERS: Final[int] = 8
+LOADTEST_DEFAULT_DURATION: Final[int] = 10
+LOADTEST_DEFAULT_LATENCY_MS: Final[int] = 50
+LOADTEST_STUB_HOST: Final[str] = "127.0.0.1"
+LOADTEST_STUB_RETRY_AFTER: Final[int] = 1
+
+# Requests are learned per slot of the (local) day, from the last PREFETCH_HISTORY_DAYS days. A ticker set is
+# prefetched for a slot once it has been requested in that slot on at least PREFETCH_MIN_DAYS different days
+PREFETCH_SLOT_MINUTES: Final[int] = 15
+PREFETCH_HISTORY_DAYS: Final[int] = 28
+PREFETCH_MIN_DAYS: Final[int] = 2
+PREFETCH_DEFAULT_LEAD: Final[int] = 900
+PREFETCH_CHECK_INTERVAL: Final[int] = 300
+# Cached quotes younger than this are not fetched again when warming the cache
+PREFETCH_REFRESH_AGE: Final[int] = 120
+
+# Adaptive refresh: per-ticker intervals are kept within these multiples of the requested interval
+REFRESH_MIN_INTERVAL_FACTOR: Final[float] = 0.25
+REFRESH_MAX_INTERVAL_FACTOR: Final[float] = 8.0
+# Price move (% per hour) at which a ticker nobody is watching closely is polled at the requested interval
+REFRESH_VOLATILITY_REFERENCE: Final[float] = 1.0
+REFRESH_ACCESS_HALF_LIFE: Final[int] = 3600
+# Tickers due within this fraction of their interval are refreshed early with tickers already due
+REFRESH_COALESCE_FRACTION: Final[float] = 0.25
+# Tickers per request (CoinMarketCap charges one credit per 100 quotes)
+REFRESH_CHUNK_SIZE: Final[int] = 100
+REFRESH_BUDGET_WINDOW: Final[int] = 60
+REFRESH_DEFAULT_REQUEST_BUDGET: Final[int] = 30
+
+# Export paths with these suffixes are written as a single file; any other path is a partitioned dataset directory
+EXPORT_PARQUET_SUFFIXES: Final[List[str]] = [".parquet", ".pq"]
+EXPORT_ARROW_SUFFIXES: Final[List[str]] = [".arrow", ".feather", ".ipc"]
+EXPORT_PARTITION_COLUMN: Final[str] = "date"
+
+# Cached price history series are stored with one point per bucket of this many seconds
+HISTORY_RESOLUTION: Final[int] = 3600
+
+HISTORY_INTERVAL_RAW: Final[str] = "raw"
+HISTORY_INTERVAL_HOUR: Final[str] = "hour"
+HISTORY_INTERVAL_DAY: Final[str] = "day"
+HISTORY_INTERVAL_WEEK: Final[str] = "week"
+HISTORY_INTERVAL_MONTH: Final[str] = "month"
+HISTORY_INTERVALS: Final[List[str]] = [
+    HISTORY_INTERVAL_RAW,
+    HISTORY_INTERVAL_HOUR,
+    HISTORY_INTERVAL_DAY,
+    HISTORY_INTERVAL_WEEK,
+    HISTORY_INTERVAL_MONTH
+]
+
+ANALYTICS_INTERVAL_SECONDS: Final[Dict[str, int]] = {
+    HISTORY_INTERVAL_HOUR: 3600,
+    HISTORY_INTERVAL_DAY: 86400,
+}
+ANALYTICS_DEFAULT_INTERVAL: Final[int] = 3600
+ANALYTICS_DEFAULT_WINDOW: Final[int] = 24
+ANALYTICS_MAX_CORRELATION_COLUMNS: Final[int] = 12
+
+FX_CONVERTED_FIELDS: Final[List[str]] = ["price", "market_cap", "24h_volume"]
+
+ALERT_FIELDS: Final[List[str]] = ["price", "1h_change", "24h_change", "7d_change", "market_cap", "24h_volume"]
+ALERT_OPERATORS: Final[List[str]] = ["<", "<=", ">", ">="]
+ALERT_SINK_STDOUT: Final[str] = "stdout"
+ALERT_SINK_FILE: Final[str] = "file"
+ALERT_SINK_WEBHOOK: Final[str] = "webhook"
+
+SCREEN_FIELDS: Final[List[str]] = ["price", "1h_change", "24h_change", "7d_change", "market_cap", "24h_volume"]
+SCREEN_DEFAULT_UNIVERSE: Final[int] = 5000
+SCREEN_DEFAULT_TOP: Final[int] = 25
+
+CONSENSUS_OUTLIER_THRESHOLD: Final[float] = 1.0
+# With fewer prices the median lies between them, so every price deviates equally and none can be singled out
+CONSENSUS_MIN_OUTLIER_PRICES: Final[int] = 3
 
 # =========================================================================================================
 # Currency Configuration (Map of all supported fiat currencies [code -> symbol])
@@ -8,6 +8,11 @@ class APIError(CryptoFetchError):
     pass
 
 
+class BudgetExceededError(APIError):
+    """Exception for API requests that would exceed the provider's credit budget."""
+    pass
+
+
 class CommandError(CryptoFetchError):
     """Exception for Command related errors."""
     pass
@@ -0,0 +1,274 @@
+import logging
+from pathlib import Path
+import time
+from typing import Any, Dict, Optional, Sequence
+import uuid
+
+from crypto_fetch.constants import CF_LOGGER, EXPORT_ARROW_SUFFIXES, EXPORT_PARQUET_SUFFIXES, EXPORT_PARTITION_COLUMN
+from crypto_fetch.exceptions import CommandError
+from crypto_fetch.history.price_series import PricePoint
+from crypto_fetch.portfolio.history_store import Valuation, ValuationSummary
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.dataset as ds  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pa = None
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+def require_pyarrow() -> None:
+    """
+    Ensures pyarrow is available.
+
+    :raises CommandError: If pyarrow is not installed.
+    """
+    if pa is None:
+        raise CommandError("Exporting requires pyarrow. Install with: pip install 'crypto-fetch[export]'")
+
+
+def validate_export_path(path: str) -> Path:
+    """
+    Validates an export path. Paths ending in a Parquet or Arrow suffix are written as a single file
+    (replacing it); any other path is a Parquet dataset directory that each export appends to.
+
+    :param path: The export path.
+    :return: The path.
+    :raises CommandError: If pyarrow is not installed, or the directory of an export file does not exist.
+    """
+    require_pyarrow()
+    export_path = Path(path).expanduser()
+    if _is_file_export(export_path) and not export_path.parent.exists():
+        raise CommandError(f"Export directory not found: '{export_path.parent}'")
+    if not _is_file_export(export_path) and export_path.is_file():
+        raise CommandError(f"Export dataset path is a file: '{export_path}'")
+    return export_path
+
+
+def quotes_to_table(data_by_currency: Dict[str, Dict[str, Dict[str, float]]], provider: str,
+                    timestamp: Optional[int] = None) -> "pa.Table":
+    """
+    Builds a table of quotes, one row per ticker per currency.
+
+    :param data_by_currency: Map of currency -> (ticker -> price data) from the API.
+    :param provider: The API provider name.
+    :param timestamp: When the quotes were fetched (defaults to now).
+    :return: The table.
+    """
+    timestamp = timestamp or int(time.time())
+    rows = [(ticker, currency, quote) for currency, data in data_by_currency.items() for ticker, quote in data.items()]
+    columns = {
+        "ticker": [ticker for ticker, _, _ in rows],
+        "currency": [currency for _, currency, _ in rows],
+        "provider": [provider] * len(rows),
+        "price": [quote.get("price") for _, _, quote in rows],
+        "change_1h": [quote.get("1h_change") for _, _, quote in rows],
+        "change_24h": [quote.get("24h_change") for _, _, quote in rows],
+        "change_7d": [quote.get("7d_change") for _, _, quote in rows],
+        "volume_24h": [quote.get("24h_volume") for _, _, quote in rows],
+        "market_cap": [quote.get("market_cap") for _, _, quote in rows],
+        "timestamp": [timestamp] * len(rows),
+    }
+    return columns_to_table(columns, _quote_schema())
+
+
+def valuations_to_table(valuations: Sequence[Valuation], timestamp: Optional[int] = None) -> "pa.Table":
+    """
+    Builds a table of portfolio holdings, one row per ticker per portfolio.
+
+    :param valuations: The portfolio valuations.
+    :param timestamp: When the prices were fetched, for valuations without a timestamp (defaults to now).
+    :return: The table.
+    """
+    timestamp = timestamp or int(time.time())
+    rows = [(valuation, ticker, amount) for valuation in valuations for ticker, amount in valuation.holdings.items()]
+    columns = {
+        "portfolio": [valuation.portfolio for valuation, _, _ in rows],
+        "ticker": [ticker for _, ticker, _ in rows],
+        "currency": [valuation.currency for valuation, _, _ in rows],
+        "provider": [valuation.provider for valuation, _, _ in rows],
+        "amount": [amount for _, _, amount in rows],
+        "price": [valuation.prices.get(ticker) for valuation, ticker, _ in rows],
+        "value": [amount * valuation.prices.get(ticker, 0.0) for valuation, ticker, amount in rows],
+        "timestamp": [valuation.timestamp or timestamp for valuation, _, _ in rows],
+    }
+    return columns_to_table(columns, _valuation_schema())
+
+
+def price_history_to_table(ticker: str, currency_code: str, points: Sequence[PricePoint]) -> "pa.Table":
+    """
+    Builds a table of price history, one row per point.
+
+    :param ticker: The cryptocurrency ticker symbol.
+    :param currency_code: The fiat currency code of the prices.
+    :param points: The price points.
+    :return: The table.
+    """
+    fields = PricePoint._fields
+    if np is not None:
+        # Transpose into one contiguous NumPy column per field, which Arrow then wraps without a second copy
+        records = np.array(points, dtype=float).reshape(len(points), len(fields))
+        values = {field: np.ascontiguousarray(records[:, i]) for i, field in enumerate(fields)}
+        values["timestamp"] = values["timestamp"].astype("int64")
+    else:
+        values = {field: list(column) for field, column in zip(fields, zip(*points))} if points else {field: [] for field in fields}
+
+    columns: Dict[str, Any] = {
+        "ticker": [ticker] * len(points),
+        "currency": [currency_code] * len(points),
+    }
+    columns.update(values)
+    return columns_to_table(columns, _price_history_schema())
+
+
+def valuation_summaries_to_table(summaries: Sequence[ValuationSummary], timestamp: Optional[int] = None) -> "pa.Table":
+    """
+    Builds a table of aggregated portfolio history, one row per portfolio per period.
+
+    :param summaries: The valuation summaries.
+    :param timestamp: When the summaries were exported (defaults to now).
+    :return: The table.
+    """
+    timestamp = timestamp or int(time.time())
+    columns = {
+        "portfolio": [s.portfolio for s in summaries],
+        "period": [s.period for s in summaries],
+        "currency": [s.currency for s in summaries],
+        "samples": [s.samples for s in summaries],
+        "min_value": [s.min_value for s in summaries],
+        "avg_value": [s.avg_value for s in summaries],
+        "max_value": [s.max_value for s in summaries],
+        "last_value": [s.last_value for s in summaries],
+        "timestamp": [timestamp] * len(summaries),
+    }
+    return columns_to_table(columns, _valuation_summary_schema())
+
+
+def columns_to_table(columns: Dict[str, Any], schema: "pa.Schema") -> "pa.Table":
+    """
+    Builds a table from column-oriented data. Columns that are already NumPy arrays of the schema's
+    type are wrapped without copying; lists are converted once.
+
+    :param columns: Map of column name -> values, with a column for every field of the schema.
+    :param schema: The schema of the table.
+    :return: The table.
+    """
+    require_pyarrow()
+    arrays = [pa.array(columns[field.name], type=field.type) for field in schema]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def export_table(table: "pa.Table", path: Path) -> None:
+    """
+    Writes a table to a Parquet file, an Arrow IPC file, or appends it to a Parquet dataset
+    directory partitioned by (UTC) date, depending on the path.
+
+    :param table: The table to write.
+    :param path: The export path (see validate_export_path).
+    :raises CommandError: If the table cannot be written.
+    """
+    require_pyarrow()
+    suffix = path.suffix.lower()
+    try:
+        if suffix in EXPORT_PARQUET_SUFFIXES:
+            pq.write_table(table, path)
+        elif suffix in EXPORT_ARROW_SUFFIXES:
+            # Uncompressed IPC files can be memory-mapped and read back without copying
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            _append_to_dataset(table, path)
+    except (pa.ArrowException, OSError) as ex:
+        raise CommandError(f"Failed to export to '{path}': {ex}") from ex
+    logger.info("Exported %s row(s) to: '%s'", table.num_rows, path)
+
+
+def _append_to_dataset(table: "pa.Table", path: Path) -> None:
+    """
+    Appends a table to a hive-partitioned Parquet dataset. Each export writes new, uniquely named
+    files, so existing files (and concurrent exports) are never overwritten.
+
+    :param table: The table to write.
+    :param path: The dataset directory.
+    """
+    dates = table.column("timestamp").cast(pa.date32())
+    table = table.append_column(EXPORT_PARTITION_COLUMN, dates)
+    ds.write_dataset(
+        table,
+        path,
+        format="parquet",
+        partitioning=[EXPORT_PARTITION_COLUMN],
+        partitioning_flavor="hive",
+        basename_template=f"part-{int(time.time())}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+
+def _is_file_export(path: Path) -> bool:
+    return path.suffix.lower() in EXPORT_PARQUET_SUFFIXES + EXPORT_ARROW_SUFFIXES
+
+
+def _timestamp_type() -> "pa.DataType":
+    return pa.timestamp("s", tz="UTC")
+
+
+def _quote_schema() -> "pa.Schema":
+    return pa.schema([
+        ("ticker", pa.string()),
+        ("currency", pa.string()),
+        ("provider", pa.string()),
+        ("price", pa.float64()),
+        ("change_1h", pa.float64()),
+        ("change_24h", pa.float64()),
+        ("change_7d", pa.float64()),
+        ("volume_24h", pa.float64()),
+        ("market_cap", pa.float64()),
+        ("timestamp", _timestamp_type()),
+    ])
+
+
+def _valuation_schema() -> "pa.Schema":
+    return pa.schema([
+        ("portfolio", pa.string()),
+        ("ticker", pa.string()),
+        ("currency", pa.string()),
+        ("provider", pa.string()),
+        ("amount", pa.float64()),
+        ("price", pa.float64()),
+        ("value", pa.float64()),
+        ("timestamp", _timestamp_type()),
+    ])
+
+
+def _price_history_schema() -> "pa.Schema":
+    return pa.schema([
+        ("ticker", pa.string()),
+        ("currency", pa.string()),
+        ("timestamp", _timestamp_type()),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ])
+
+
+def _valuation_summary_schema() -> "pa.Schema":
+    return pa.schema([
+        ("portfolio", pa.string()),
+        ("period", pa.string()),
+        ("currency", pa.string()),
+        ("samples", pa.int64()),
+        ("min_value", pa.float64()),
+        ("avg_value", pa.float64()),
+        ("max_value", pa.float64()),
+        ("last_value", pa.float64()),
+        ("timestamp", _timestamp_type()),
+    ])
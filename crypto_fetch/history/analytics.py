@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+import logging
+from typing import Any, Dict, List, Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.constants import ANALYTICS_DEFAULT_INTERVAL, CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+SECONDS_PER_YEAR: int = 365 * 24 * 3600
+
+
+@dataclass
+class PriceMatrix:
+    """Close prices for many tickers aligned on a shared time grid (rows = time, columns = tickers)."""
+
+    tickers: List[str]
+    timestamps: Any
+    closes: Any
+    interval: int
+
+
+@dataclass
+class AnalyticsResult:
+    """Per-ticker and portfolio metrics computed over a price matrix."""
+
+    tickers: List[str]
+    total_return: Any
+    volatility: Any
+    rolling_volatility: Any
+    max_drawdown: Any
+    correlation: Any
+    weights: Optional[Any] = None
+    portfolio_return: Optional[float] = None
+    portfolio_volatility: Optional[float] = None
+    portfolio_max_drawdown: Optional[float] = None
+
+
+def require_numpy() -> None:
+    """
+    Ensures NumPy is available.
+
+    :raises CommandError: If NumPy is not installed.
+    """
+    if np is None:
+        raise CommandError("Analytics require NumPy. Install with: pip install 'crypto-fetch[analytics]'")
+
+
+def load_price_matrix(client: BaseAPIClient, tickers: List[str], currency_code: str, start: int, end: int,
+                      interval: int = ANALYTICS_DEFAULT_INTERVAL) -> PriceMatrix:
+    """
+    Loads the cached price history for several tickers (filling any gaps from the API) and aligns the
+    closes on a shared grid of `interval` seconds. Missing samples are forward-filled from the last
+    known close; rows before every ticker has a price are dropped.
+
+    :param client: The API client whose history cache is used.
+    :param tickers: The uppercase tickers.
+    :param currency_code: The fiat currency code.
+    :param start: Inclusive start as a unix timestamp.
+    :param end: Inclusive end as a unix timestamp.
+    :param interval: The grid spacing in seconds.
+    :return: The aligned price matrix.
+    :raises CommandError: If there is not enough history to align.
+    """
+    require_numpy()
+    currency_code = currency_code.upper()
+    grid = np.arange(start - start % interval, end + 1, interval, dtype=np.int64)
+    closes = np.full((len(grid), len(tickers)), np.nan)
+
+    for col, ticker in enumerate(tickers):
+        client.fetch_price_history(ticker, currency_code, start, end)
+        series = client.history_cache.get_array((client.config.name, ticker, currency_code), start, end)
+        if len(series) == 0:
+            raise CommandError(f"No price history available for '{ticker}'")
+
+        # Index of the last sample at or before each grid point
+        idx = np.searchsorted(series["timestamp"], grid, side="right") - 1
+        valid = idx >= 0
+        closes[valid, col] = series["close"][idx[valid]]
+
+    first_complete = np.argmax(~np.isnan(closes).any(axis=1))
+    closes = closes[first_complete:]
+    grid = grid[first_complete:]
+    if len(grid) < 2 or np.isnan(closes).any():
+        raise CommandError("Not enough overlapping price history to compute analytics")
+
+    logger.debug("Aligned %s ticker(s) on %s sample(s) of %ss", len(tickers), len(grid), interval)
+    return PriceMatrix(tickers, grid, closes, interval)
+
+
+def log_returns(closes: Any) -> Any:
+    """
+    Computes per-period log returns for every column.
+
+    :param closes: T x N matrix of close prices.
+    :return: (T-1) x N matrix of log returns.
+    """
+    return np.diff(np.log(closes), axis=0)
+
+
+def rolling_volatility(returns: Any, window: int) -> Any:
+    """
+    Computes the rolling standard deviation of returns for every column using cumulative sums,
+    so the cost is independent of the window size.
+
+    :param returns: T x N matrix of returns.
+    :param window: The number of periods in each window.
+    :return: (T-window+1) x N matrix of rolling standard deviations (empty if T < window).
+    """
+    if window < 2 or len(returns) < window:
+        return np.empty((0, returns.shape[1]))
+
+    zeros = np.zeros((1, returns.shape[1]))
+    csum = np.concatenate([zeros, np.cumsum(returns, axis=0)])
+    csum_sq = np.concatenate([zeros, np.cumsum(returns * returns, axis=0)])
+    sums = csum[window:] - csum[:-window]
+    sums_sq = csum_sq[window:] - csum_sq[:-window]
+    variance = (sums_sq - sums * sums / window) / (window - 1)
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def drawdowns(closes: Any) -> Any:
+    """
+    Computes the drawdown from the running peak for every column.
+
+    :param closes: T x N matrix of close prices (or a 1-D value series).
+    :return: Matrix of drawdowns (<= 0) with the same shape as closes.
+    """
+    return closes / np.maximum.accumulate(closes, axis=0) - 1.0
+
+
+def compute_analytics(matrix: PriceMatrix, window: int, weights: Optional[Dict[str, float]] = None) -> AnalyticsResult:
+    """
+    Computes returns, volatility, drawdown and correlation for every ticker in one vectorized pass.
+
+    :param matrix: The aligned price matrix.
+    :param window: The rolling volatility window (in periods).
+    :param weights: Optional map of ticker -> holding amount used to weight a portfolio series.
+    :return: The computed metrics. Volatilities are annualized.
+    """
+    require_numpy()
+    closes = matrix.closes
+    annualize = np.sqrt(SECONDS_PER_YEAR / matrix.interval)
+
+    returns = log_returns(closes)
+    result = AnalyticsResult(
+        tickers=matrix.tickers,
+        total_return=closes[-1] / closes[0] - 1.0,
+        volatility=returns.std(axis=0, ddof=1) * annualize if len(returns) > 1 else np.zeros(len(matrix.tickers)),
+        rolling_volatility=rolling_volatility(returns, window) * annualize,
+        max_drawdown=drawdowns(closes).min(axis=0),
+        correlation=np.corrcoef(returns, rowvar=False).reshape(len(matrix.tickers), len(matrix.tickers)),
+    )
+
+    if weights:
+        amounts = np.array([weights.get(t, 0.0) for t in matrix.tickers])
+        values = closes @ amounts
+        value_returns = log_returns(values)
+        result.weights = closes[-1] * amounts / values[-1]
+        result.portfolio_return = float(values[-1] / values[0] - 1.0)
+        result.portfolio_volatility = float(value_returns.std(ddof=1) * annualize) if len(value_returns) > 1 else 0.0
+        result.portfolio_max_drawdown = float(drawdowns(values).min())
+
+    return result
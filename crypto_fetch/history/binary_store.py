@@ -0,0 +1,245 @@
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Any, Iterable, List, Optional, Tuple
+
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.history.price_series import PricePoint
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+SERIES_FILE_MAGIC: bytes = b"CFSERIES"
+SERIES_FILE_VERSION: int = 1
+
+# Header: magic, version, record size, committed record count
+HEADER_STRUCT = struct.Struct("<8sIIq")
+# Record: timestamp, open, high, low, close, volume
+RECORD_STRUCT = struct.Struct("<qddddd")
+_TIMESTAMP_STRUCT = struct.Struct("<q")
+_COUNT_OFFSET: int = 16
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([
+        ("timestamp", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ])
+
+
+class PriceSeriesFile:
+    """
+    A price series stored as fixed-width binary records sorted by timestamp, read through mmap.
+
+    Appends are crash-safe: records are written and fsync'd past the committed end of the file
+    before the committed record count in the header is updated, so a partially written append is
+    never visible. Out-of-order merges rewrite the file to a temp file which atomically replaces it.
+    The file is only created by the first write, so reading a series that was never stored leaves
+    nothing on disk.
+    """
+
+    def __init__(self, path: Path):
+        """
+        :param path: Path to the series file.
+        """
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        self._count: int = 0
+        self._open()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """The timestamp of the last record, or None if the series is empty."""
+        return self._timestamp_at(self._count - 1) if self._count else None
+
+    def find(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Binary searches for the records within [start, end].
+
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: The [lo, hi) record index range.
+        """
+        return self._bisect(start, right=False), self._bisect(end, right=True)
+
+    def view(self, start: int, end: int) -> memoryview:
+        """
+        Gets a zero-copy view of the raw records within [start, end].
+
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: A read-only memoryview over the packed records.
+        """
+        lo, hi = self.find(start, end)
+        if self._mmap is None or lo >= hi:
+            return memoryview(b"")
+        offset = HEADER_STRUCT.size + lo * RECORD_STRUCT.size
+        return memoryview(self._mmap)[offset:offset + (hi - lo) * RECORD_STRUCT.size].toreadonly()
+
+    def points(self, start: int, end: int) -> List[PricePoint]:
+        """
+        Gets the records within [start, end] as price points.
+
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: The price points, sorted by timestamp.
+        """
+        return [PricePoint(*record) for record in RECORD_STRUCT.iter_unpack(self.view(start, end))]
+
+    def array(self, start: int, end: int) -> Any:
+        """
+        Gets the records within [start, end] as a zero-copy NumPy structured array.
+
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: A read-only structured array with the fields of PricePoint.
+        :raises ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for array views. Install with: pip install numpy")
+        return np.frombuffer(self.view(start, end), dtype=RECORD_DTYPE)
+
+    def append(self, points: Iterable[PricePoint]) -> None:
+        """
+        Appends points that are all newer than the last record.
+
+        :param points: The points to append, sorted by timestamp.
+        :raises ValueError: If a point is not newer than the last record.
+        """
+        points = list(points)
+        if not points:
+            return
+
+        last = self.last_timestamp
+        if last is not None and points[0].timestamp <= last:
+            raise ValueError(f"Cannot append point at {points[0].timestamp}: series ends at {last}")
+
+        data = b"".join(RECORD_STRUCT.pack(*p) for p in points)
+        if not self.path.exists():
+            self._rewrite(data, len(points))
+            return
+
+        with open(self.path, "r+b") as f:
+            f.seek(HEADER_STRUCT.size + self._count * RECORD_STRUCT.size)
+            f.write(data)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+
+            self._count += len(points)
+            f.seek(_COUNT_OFFSET)
+            f.write(struct.pack("<q", self._count))
+            f.flush()
+            os.fsync(f.fileno())
+        self._remap()
+
+    def merge(self, points: Iterable[PricePoint]) -> None:
+        """
+        Merges points into the series, replacing any records with the same timestamp.
+        Appends in place when possible, otherwise rewrites the file.
+
+        :param points: The points to merge.
+        """
+        points = sorted(points)
+        if not points:
+            return
+
+        last = self.last_timestamp
+        if last is None or points[0].timestamp > last:
+            self.append(_dedupe(points))
+            return
+
+        by_timestamp = {p.timestamp: p for p in self.points(points[0].timestamp, points[-1].timestamp)}
+        by_timestamp.update((p.timestamp, p) for p in points)
+        lo, hi = self.find(points[0].timestamp, points[-1].timestamp)
+        head = self._raw_records(0, lo)
+        tail = self._raw_records(hi, self._count)
+        middle = b"".join(RECORD_STRUCT.pack(*p) for p in sorted(by_timestamp.values()))
+        self._rewrite(head + middle + tail, lo + len(by_timestamp) + (self._count - hi))
+
+    def _open(self) -> None:
+        if not self.path.exists():
+            self._count = 0
+            return
+
+        with open(self.path, "rb") as f:
+            header = f.read(HEADER_STRUCT.size)
+        if len(header) < HEADER_STRUCT.size:
+            raise ValueError(f"Series file '{self.path}' is truncated")
+
+        magic, version, record_size, count = HEADER_STRUCT.unpack(header)
+        if magic != SERIES_FILE_MAGIC or version != SERIES_FILE_VERSION or record_size != RECORD_STRUCT.size:
+            raise ValueError(f"Series file '{self.path}' has an unsupported format")
+
+        # Anything past the committed count is an interrupted append and is ignored
+        max_count = (self.path.stat().st_size - HEADER_STRUCT.size) // RECORD_STRUCT.size
+        self._count = min(count, max_count)
+        self._remap()
+
+    def _remap(self) -> None:
+        self._mmap = None
+        if self._count == 0:
+            return
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _rewrite(self, records: bytes, count: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER_STRUCT.pack(SERIES_FILE_MAGIC, SERIES_FILE_VERSION, RECORD_STRUCT.size, count))
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+        self._mmap = None
+        os.replace(tmp_path, self.path)
+        self._count = count
+        self._remap()
+
+    def _raw_records(self, lo: int, hi: int) -> bytes:
+        if self._mmap is None or lo >= hi:
+            return b""
+        offset = HEADER_STRUCT.size + lo * RECORD_STRUCT.size
+        return self._mmap[offset:offset + (hi - lo) * RECORD_STRUCT.size]
+
+    def _timestamp_at(self, index: int) -> int:
+        return _TIMESTAMP_STRUCT.unpack_from(self._mmap, HEADER_STRUCT.size + index * RECORD_STRUCT.size)[0]  # type: ignore
+
+    def _bisect(self, timestamp: int, right: bool) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_ts = self._timestamp_at(mid)
+            if mid_ts < timestamp or (right and mid_ts == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def _dedupe(points: List[PricePoint]) -> List[PricePoint]:
+    """
+    Removes points with duplicate timestamps, keeping the last one.
+
+    :param points: Points sorted by timestamp.
+    :return: The points with unique timestamps.
+    """
+    unique: List[PricePoint] = []
+    for point in points:
+        if unique and unique[-1].timestamp == point.timestamp:
+            unique[-1] = point
+        else:
+            unique.append(point)
+    return unique
@@ -0,0 +1,77 @@
+from typing import List, NamedTuple, Tuple
+
+TimeRange = Tuple[int, int]
+
+
+class PricePoint(NamedTuple):
+    """A single OHLCV sample. Timestamps are unix seconds (UTC)."""
+
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def merge_ranges(ranges: List[TimeRange]) -> List[TimeRange]:
+    """
+    Merges overlapping / adjacent time ranges.
+
+    :param ranges: The (inclusive) time ranges to merge.
+    :return: The merged ranges, sorted by start time.
+    """
+    merged: List[TimeRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(start: int, end: int, covered: List[TimeRange]) -> List[TimeRange]:
+    """
+    Gets the parts of [start, end] that are not covered by any of the supplied ranges.
+
+    :param start: Inclusive start of the requested range.
+    :param end: Inclusive end of the requested range.
+    :param covered: Merged, sorted ranges that are already covered.
+    :return: The uncovered gaps, sorted by start time.
+    """
+    gaps: List[TimeRange] = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - 1))
+        cursor = max(cursor, covered_end + 1)
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def resample(points: List[PricePoint], resolution: int) -> List[PricePoint]:
+    """
+    Buckets points into fixed intervals, one point per bucket timestamped at the bucket start.
+    The open is the first open in the bucket, the close the last close, and high/low the extremes.
+    The volume is the last volume, as provider volumes are already per candle or rolling 24h totals.
+
+    :param points: The points to resample.
+    :param resolution: The bucket size in seconds.
+    :return: The resampled points, sorted by timestamp.
+    """
+    buckets: List[PricePoint] = []
+    for point in sorted(points):
+        bucket = point.timestamp // resolution * resolution
+        if buckets and buckets[-1].timestamp == bucket:
+            last = buckets[-1]
+            buckets[-1] = PricePoint(bucket, last.open, max(last.high, point.high), min(last.low, point.low), point.close, point.volume)
+        else:
+            buckets.append(point._replace(timestamp=bucket))
+    return buckets
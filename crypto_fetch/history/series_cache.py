@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.history.binary_store import PriceSeriesFile
+from crypto_fetch.history.price_series import PricePoint, TimeRange, merge_ranges, subtract_ranges
+
+logger = logging.getLogger(CF_LOGGER)
+
+PRICE_HISTORY_CACHE_PATH: Path = CONFIG_DIRECTORY_PATH / "history"
+
+SeriesKey = Tuple[str, str, str]
+
+
+class PriceSeriesCache:
+    """
+    Local time-series cache of price history, one series per (provider, ticker, currency).
+    Points are kept in memory-mapped binary series files. Alongside the points, each series
+    records which time ranges have already been fetched so that later queries only need to
+    fetch the gaps.
+    """
+
+    def __init__(self, cache_dir: Path = PRICE_HISTORY_CACHE_PATH):
+        """
+        :param cache_dir: The directory the series files are stored in.
+        """
+        self.cache_dir = cache_dir
+        self._files: Dict[SeriesKey, PriceSeriesFile] = {}
+        self._ranges: Dict[SeriesKey, List[TimeRange]] = {}
+
+    def missing_ranges(self, key: SeriesKey, start: int, end: int) -> List[TimeRange]:
+        """
+        Gets the parts of [start, end] that have not been fetched yet.
+
+        :param key: The (provider, ticker, currency) series key.
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: The missing time ranges.
+        """
+        self._load(key)
+        return subtract_ranges(start, end, self._ranges[key])
+
+    def get(self, key: SeriesKey, start: int, end: int) -> List[PricePoint]:
+        """
+        Gets the cached points within [start, end].
+
+        :param key: The (provider, ticker, currency) series key.
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: The cached points, sorted by timestamp.
+        """
+        return self._load(key).points(start, end)
+
+    def get_array(self, key: SeriesKey, start: int, end: int) -> Any:
+        """
+        Gets the cached points within [start, end] as a zero-copy NumPy structured array.
+
+        :param key: The (provider, ticker, currency) series key.
+        :param start: Inclusive start as a unix timestamp.
+        :param end: Inclusive end as a unix timestamp.
+        :return: A read-only structured array with the fields of PricePoint.
+        :raises ImportError: If NumPy is not installed.
+        """
+        return self._load(key).array(start, end)
+
+    def merge(self, key: SeriesKey, points: List[PricePoint], start: int, end: int) -> None:
+        """
+        Merges newly fetched points into a series and marks [start, end] as fetched.
+        Points are expected at HISTORY_RESOLUTION (see resample()).
+
+        :param key: The (provider, ticker, currency) series key.
+        :param points: The fetched points.
+        :param start: Inclusive start of the fetched range.
+        :param end: Inclusive end of the fetched range (nothing is marked fetched if before start).
+        """
+        self._load(key).merge(points)
+        if start <= end:
+            self._ranges[key] = merge_ranges(self._ranges[key] + [(start, end)])
+            self._save_ranges(key)
+        logger.debug("Merged %s point(s) into history cache for %s", len(points), key)
+
+    def _path(self, key: SeriesKey, suffix: str) -> Path:
+        provider, ticker, currency = key
+        return self.cache_dir / f"{provider}_{ticker.upper()}_{currency.upper()}{suffix}"
+
+    def _load(self, key: SeriesKey) -> PriceSeriesFile:
+        if key in self._files:
+            return self._files[key]
+
+        series_path = self._path(key, ".bin")
+        ranges: List[TimeRange] = []
+        try:
+            series_file = PriceSeriesFile(series_path)
+            ranges_path = self._path(key, ".ranges.json")
+            if ranges_path.exists():
+                with open(ranges_path, "r", encoding="utf-8") as f:
+                    ranges = [tuple(r) for r in json.load(f)]  # type: ignore
+        except (OSError, ValueError, TypeError) as ex:
+            logger.warning("History cache for %s is unreadable (%s). Discarding it", key, ex)
+            series_path.unlink(missing_ok=True)
+            series_file = PriceSeriesFile(series_path)
+            ranges = []
+
+        self._files[key] = series_file
+        self._ranges[key] = ranges
+        return series_file
+
+    def _save_ranges(self, key: SeriesKey) -> None:
+        path = self._path(key, ".ranges.json")
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._ranges[key], f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,129 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import math
+import threading
+import time
+from typing import Callable, List, Optional
+
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.exceptions import CryptoFetchError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+@dataclass
+class LoadTestResult:
+    """Latencies (in seconds) of the successful requests made by a load test, and the errors of the failed ones."""
+
+    duration: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.failed
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        return len(self.latencies) / self.duration if self.duration > 0 else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Gets a latency percentile (nearest rank) of the successful requests. Failed requests are left
+        out, as a request rejected without being sent would otherwise pull the percentiles down.
+
+        :param percent: The percentile, from 0 to 100.
+        :return: The latency in seconds (0 if no request succeeded).
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+class LoadRunner:
+    """
+    Calls a request function repeatedly from several threads and records the latency and outcome of
+    each call. Runs either closed-loop (each of `workers` threads makes its next request as soon as the
+    last one completes) or, with a target rate, open-loop: requests are started on a fixed schedule and
+    their latency is measured from when they were due, so time spent waiting for a free worker counts
+    and a saturated client is not hidden by the load generator slowing down.
+    """
+
+    def __init__(self, request: Callable[[], object], workers: int, rps: Optional[float] = None):
+        """
+        :param request: Makes one request; a CryptoFetchError counts as a failed request.
+        :param workers: The number of threads making requests.
+        :param rps: The target number of requests started per second (None to run closed-loop).
+        """
+        self.request = request
+        self.workers = workers
+        self.rps = rps
+        self._result = LoadTestResult()
+        self._lock = threading.Lock()
+
+    def run(self, duration: float, max_requests: Optional[int] = None) -> LoadTestResult:
+        """
+        Runs the load test.
+
+        :param duration: How long to start requests for, in seconds.
+        :param max_requests: Stop after starting this many requests (None for no limit).
+        :return: The result. The duration includes waiting for requests started before the deadline.
+        """
+        self._result = LoadTestResult()
+        start = time.perf_counter()
+        deadline = start + duration
+        started = iter(range(max_requests)) if max_requests is not None else None
+
+        def take_slot() -> bool:
+            with self._lock:
+                return started is None or next(started, None) is not None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="loadtest") as executor:
+            if self.rps is None:
+                def worker() -> None:
+                    while time.perf_counter() < deadline and take_slot():
+                        self._timed_request(time.perf_counter())
+
+                for _ in range(self.workers):
+                    executor.submit(worker)
+            else:
+                interval = 1 / self.rps
+                due = start
+                while due < deadline and take_slot():
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    executor.submit(self._timed_request, due)
+                    due += interval
+
+        self._result.duration = time.perf_counter() - start
+        logger.debug("Load test made %s request(s) in %.2fs", self._result.requests, self._result.duration)
+        return self._result
+
+    def _timed_request(self, due: float) -> None:
+        """
+        Makes one request and records its latency, measured from when it was due.
+
+        :param due: When the request was due (a time.perf_counter() value).
+        """
+        error: Optional[str] = None
+        try:
+            self.request()
+        except CryptoFetchError as ex:
+            # Messages that include a countdown are grouped together
+            error = str(ex).split(". Retry in")[0]
+        latency = time.perf_counter() - due
+
+        with self._lock:
+            if error is None:
+                self._result.latencies.append(latency)
+            else:
+                self._result.errors[error] += 1
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import zlib
+
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    LOADTEST_STUB_HOST,
+    LOADTEST_STUB_RETRY_AFTER,
+    PROVIDER_COINGECKO,
+    PROVIDER_COINGECKO_PRICE_EP,
+    PROVIDER_COINMARKETCAP,
+    PROVIDER_COINMARKETCAP_PRICE_EP,
+)
+
+logger = logging.getLogger(CF_LOGGER)
+
+_BASE_PATHS: Dict[str, str] = {
+    PROVIDER_COINMARKETCAP: "/coinmarketcap/v1",
+    PROVIDER_COINGECKO: "/coingecko/api/v3",
+}
+
+
+@dataclass
+class StubConfig:
+    """Faults injected by the stub provider server."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+
+
+class StubProviderServer:
+    """
+    Local HTTP server imitating the CoinMarketCap quotes/latest and CoinGecko simple/price endpoints,
+    so the API clients can be exercised without network access or API keys. Every request is delayed
+    by `latency` seconds (plus up to `jitter`), and fails with a 500 with probability `error_rate`
+    or is throttled with a 429 (and a Retry-After header) with probability `throttle_rate`.
+    Prices are derived from the ticker, so they are stable across requests.
+    """
+
+    def __init__(self, config: StubConfig, host: str = LOADTEST_STUB_HOST, port: int = 0):
+        """
+        :param config: The faults to inject.
+        :param host: The host to listen on.
+        :param port: The port to listen on (0 for any free port).
+        """
+        self.config = config
+        self._server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stub_config = config  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "StubProviderServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-provider", daemon=True)
+        self._thread.start()
+        logger.debug("Stub provider server listening on %s:%s", *self._server.server_address[:2])
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def get_base_url(self, provider: str) -> str:
+        """
+        Gets the base URL to configure a provider's client with.
+
+        :param provider: The API provider name.
+        :return: The base URL.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{_BASE_PATHS[provider]}"
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm the body would wait for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        config: StubConfig = self.server.stub_config  # type: ignore[attr-defined]
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        delay = config.latency + random.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        roll = random.random()
+        if roll < config.throttle_rate:
+            self._send_json(429, _get_error_body(1008, "Stub rate limit exceeded (429)"), {"Retry-After": str(LOADTEST_STUB_RETRY_AFTER)})
+        elif roll < config.throttle_rate + config.error_rate:
+            self._send_json(500, _get_error_body(500, "Stub server error (500)"))
+        elif url.path == _BASE_PATHS[PROVIDER_COINMARKETCAP] + PROVIDER_COINMARKETCAP_PRICE_EP:
+            self._send_json(200, _get_cmc_quotes(params))
+        elif url.path == _BASE_PATHS[PROVIDER_COINGECKO] + PROVIDER_COINGECKO_PRICE_EP:
+            self._send_json(200, _get_cg_prices(params))
+        else:
+            self._send_json(404, _get_error_body(404, f"Stub has no endpoint '{url.path}'"))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests are not logged: at load test rates they would drown the output
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def _get_error_body(error_code: int, error_message: str) -> Dict[str, Any]:
+    return {"status": {"error_code": error_code, "error_message": error_message}}
+
+
+def _get_quote(symbol: str) -> Tuple[float, float, float]:
+    """
+    Gets a stable price, 24h change and market cap for a symbol.
+
+    :param symbol: The ticker symbol or coin id.
+    :return: The price, 24h change and market cap.
+    """
+    seed = zlib.crc32(symbol.upper().encode("utf-8"))
+    price = 0.5 + seed % 100000 / 10
+    return price, (seed % 2000 - 1000) / 100, price * (seed % 1000 + 1) * 1e6
+
+
+def _get_cmc_quotes(params: Dict[str, str]) -> Dict[str, Any]:
+    currencies = params.get("convert", "USD").split(",")
+    data: Dict[str, Any] = {}
+    for symbol in filter(None, params.get("symbol", "").split(",")):
+        price, change_24h, market_cap = _get_quote(symbol)
+        data[symbol] = {"symbol": symbol, "quote": {currency: {
+            "price": price,
+            "percent_change_1h": change_24h / 10,
+            "percent_change_24h": change_24h,
+            "percent_change_7d": change_24h * 2,
+            "market_cap": market_cap,
+            "volume_24h": market_cap / 20,
+        } for currency in currencies}}
+    return {"status": {"error_code": 0, "credit_count": 1}, "data": data}
+
+
+def _get_cg_prices(params: Dict[str, str]) -> Dict[str, Any]:
+    currencies = [currency.lower() for currency in params.get("vs_currencies", "usd").split(",")]
+    data: Dict[str, Any] = {}
+    for coin_id in filter(None, params.get("ids", "").split(",")):
+        price, change_24h, market_cap = _get_quote(coin_id)
+        data[coin_id] = {}
+        for currency in currencies:
+            data[coin_id].update({
+                currency: price,
+                f"{currency}_24h_change": change_24h,
+                f"{currency}_market_cap": market_cap,
+                f"{currency}_24h_vol": market_cap / 20,
+            })
+    return data
@@ -1,10 +1,17 @@
+import atexit
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
+from typing import Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.text import Text
+from rich.markup import escape
 
-from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.api.formatter import get_console
+from crypto_fetch.constants import CF_LOGGER, LOG_FORMAT_JSON, LOG_FORMAT_RICH
 
 LEVEL_STYLES = {
     logging.DEBUG:   "cyan",
@@ -12,8 +19,8 @@ LEVEL_STYLES = {
     logging.ERROR:   "red",
 }
 
-_stdout_console = Console(stderr=False)
 _stderr_console = Console(stderr=True)
+_listener: Optional[QueueListener] = None
 
 
 class RichLevelFormatter(logging.Formatter):
@@ -24,6 +31,7 @@ class RichLevelFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """
         Formats a log record, applying level-based color to the level name for non-INFO records.
+        The result is Rich markup built directly as a str rather than through a Text object.
 
         :param record: The log record to format.
         :return: The formatted log message string.
@@ -32,23 +40,49 @@ class RichLevelFormatter(logging.Formatter):
             return record.getMessage()
 
         plain = self._plain.format(record)
-        style = LEVEL_STYLES.get(record.levelno, "")
-        text = Text(plain)
+        style = LEVEL_STYLES.get(record.levelno)
         level_tag = f"[{record.levelname}]"
         start = plain.index(level_tag)
-        text.stylize(style, start, start + len(level_tag))
-        return text.markup
+        end = start + len(level_tag)
+        if not style:
+            return escape(plain)
+        return f"{escape(plain[:start])}[{style}]{escape(level_tag)}[/{style}]{escape(plain[end:])}"
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects, without Rich."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a log record as JSON.
+
+        :param record: The log record to format.
+        :return: The JSON string.
+        """
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
 
 
 class _RichHandler(RichHandler):
 
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emits a log record to stdout or stderr depending on the log level.
+        Emits a log record to stdout or stderr depending on the log level. Records below ERROR go to
+        the current thread's output console so they stay with the output of the command that logged them.
 
         :param record: The log record to emit.
         """
-        console = _stderr_console if record.levelno >= logging.ERROR else _stdout_console
+        console = _stderr_console if record.levelno >= logging.ERROR else get_console()
         try:
             msg = self.format(record)
             console.print(msg, markup=True, highlight=False)
@@ -56,19 +90,36 @@ class _RichHandler(RichHandler):
             self.handleError(record)
 
 
-def setup_logger(debug: bool = False) -> None:
+def setup_logger(debug: bool = False, log_format: str = LOG_FORMAT_RICH) -> None:
     """
     Sets up the application logger.
 
+    Rich logs are emitted synchronously: INFO and WARNING records are part of the command output,
+    so they must stay in order with (and be captured alongside) what the command prints.
+    JSON logs are written to stderr by a QueueListener thread, so formatting and I/O happen off
+    the thread that logged the record.
+
     :param debug: Whether debug logging should be enabled.
+    :param log_format: The log format, 'rich' or 'json'.
     """
+    global _listener
+
     logger = logging.getLogger(CF_LOGGER)
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
     if logger.handlers:
         return
 
-    handler = _RichHandler(show_time=False, show_level=False, show_path=False)
-    handler.setFormatter(RichLevelFormatter())
-    logger.addHandler(handler)
-    logger.debug(f"{CF_LOGGER} logger initialized")
+    if log_format == LOG_FORMAT_JSON:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(JSONFormatter())
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, stream_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+    else:
+        handler = _RichHandler(show_time=False, show_level=False, show_path=False)
+        handler.setFormatter(RichLevelFormatter())
+        logger.addHandler(handler)
+    logger.debug("%s logger initialized", CF_LOGGER)
@@ -0,0 +1,230 @@
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH
+from crypto_fetch.constants import (
+    CF_LOGGER,
+    HISTORY_INTERVAL_DAY,
+    HISTORY_INTERVAL_HOUR,
+    HISTORY_INTERVAL_MONTH,
+    HISTORY_INTERVAL_RAW,
+    HISTORY_INTERVAL_WEEK,
+)
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+PORTFOLIO_HISTORY_DB_PATH: Path = CONFIG_DIRECTORY_PATH / "portfolio_history.db"
+
+_INTERVAL_FORMATS: Dict[str, str] = {
+    HISTORY_INTERVAL_RAW: "%Y-%m-%d %H:%M:%S",
+    HISTORY_INTERVAL_HOUR: "%Y-%m-%d %H:00",
+    HISTORY_INTERVAL_DAY: "%Y-%m-%d",
+    HISTORY_INTERVAL_WEEK: "%Y-W%W",
+    HISTORY_INTERVAL_MONTH: "%Y-%m",
+}
+
+# Both tables are clustered on (portfolio, ts) so range scans for a portfolio read contiguous pages.
+# seq numbers the valuations of a portfolio taken in the same second, so none of them is overwritten.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS valuations (
+    portfolio   TEXT    NOT NULL,
+    ts          INTEGER NOT NULL,
+    currency    TEXT    NOT NULL,
+    provider    TEXT    NOT NULL,
+    assets      INTEGER NOT NULL,
+    seq         INTEGER NOT NULL,
+    total_value REAL    NOT NULL,
+    PRIMARY KEY (portfolio, ts, currency, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS valuation_holdings (
+    portfolio TEXT    NOT NULL,
+    ts        INTEGER NOT NULL,
+    currency  TEXT    NOT NULL,
+    seq       INTEGER NOT NULL,
+    ticker    TEXT    NOT NULL,
+    amount    REAL    NOT NULL,
+    price     REAL    NOT NULL,
+    value     REAL    NOT NULL,
+    PRIMARY KEY (portfolio, ts, currency, seq, ticker)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_valuations_ts ON valuations (ts);
+"""
+
+
+@dataclass
+class Valuation:
+    """A single portfolio valuation snapshot."""
+
+    portfolio: str
+    currency: str
+    provider: str
+    holdings: Dict[str, float]
+    prices: Dict[str, float]
+    timestamp: Optional[int] = None
+
+    @property
+    def total_value(self) -> float:
+        """The total value of the holdings at the snapshot prices."""
+        return sum(amount * self.prices.get(ticker, 0.0) for ticker, amount in self.holdings.items())
+
+
+@dataclass
+class ValuationSummary:
+    """Aggregated valuations for a portfolio over a single period."""
+
+    portfolio: str
+    period: str
+    currency: str
+    samples: int
+    min_value: float
+    avg_value: float
+    max_value: float
+    last_value: float
+
+
+class PortfolioHistoryStore:
+    """Append-only SQLite (WAL mode) store of portfolio valuations."""
+
+    def __init__(self, db_path: Path = PORTFOLIO_HISTORY_DB_PATH):
+        """
+        :param db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "PortfolioHistoryStore":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Opens the database, creating it and its schema if needed.
+
+        :raises CommandError: If the database cannot be opened.
+        """
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            logger.debug("Opened portfolio history store: '%s'", self.db_path)
+        except sqlite3.Error as ex:
+            raise CommandError(f"Failed to open portfolio history store '{self.db_path}': {ex}") from ex
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def record(self, valuations: Iterable[Valuation]) -> int:
+        """
+        Appends valuations to the store in a single transaction. Valuations of a portfolio taken in
+        the same second (and currency) are all kept, numbered by seq.
+
+        :param valuations: The valuations to record.
+        :return: The number of valuations recorded.
+        :raises CommandError: If the write fails.
+        """
+        now = int(time.time())
+        valuation_rows: List[Tuple] = []
+        holding_rows: List[Tuple] = []
+        try:
+            with self._connection:
+                # Taken before reading the next seq numbers, so concurrent writers cannot pick the same ones
+                self._connection.execute("BEGIN IMMEDIATE")
+                next_seq: Dict[Tuple[str, int, str], int] = {}
+                for valuation in valuations:
+                    ts = valuation.timestamp if valuation.timestamp is not None else now
+                    key = (valuation.portfolio, ts, valuation.currency)
+                    if key not in next_seq:
+                        next_seq[key] = self._connection.execute(
+                            "SELECT COALESCE(MAX(seq) + 1, 0) FROM valuations WHERE portfolio = ? AND ts = ? AND currency = ?", key
+                        ).fetchone()[0]
+                    seq = next_seq[key]
+                    next_seq[key] += 1
+
+                    valuation_rows.append((*key, valuation.provider, len(valuation.holdings), seq, valuation.total_value))
+                    for ticker, amount in valuation.holdings.items():
+                        price = valuation.prices.get(ticker, 0.0)
+                        holding_rows.append((*key, seq, ticker, amount, price, amount * price))
+
+                self._connection.executemany("INSERT INTO valuations VALUES (?, ?, ?, ?, ?, ?, ?)", valuation_rows)
+                self._connection.executemany("INSERT INTO valuation_holdings VALUES (?, ?, ?, ?, ?, ?, ?, ?)", holding_rows)
+        except sqlite3.Error as ex:
+            raise CommandError(f"Failed to record portfolio valuation(s): {ex}") from ex
+
+        logger.debug("Recorded %s valuation(s) and %s holding row(s)", len(valuation_rows), len(holding_rows))
+        return len(valuation_rows)
+
+    def query(self, portfolios: Optional[List[str]] = None, since: Optional[int] = None, until: Optional[int] = None,
+              interval: str = HISTORY_INTERVAL_DAY, currency: Optional[str] = None) -> List[ValuationSummary]:
+        """
+        Aggregates recorded valuations per portfolio and period within a time range.
+
+        :param portfolios: The portfolios to include (all if None).
+        :param since: Inclusive lower bound as a unix timestamp.
+        :param until: Inclusive upper bound as a unix timestamp.
+        :param interval: The aggregation period (raw, hour, day, week, month).
+        :param currency: Only include valuations in this currency.
+        :return: The aggregated valuations ordered by portfolio and period.
+        :raises CommandError: If the interval is unknown or the query fails.
+        """
+        period_format = _INTERVAL_FORMATS.get(interval)
+        if period_format is None:
+            raise CommandError(f"Unknown history interval: '{interval}'")
+
+        clauses: List[str] = []
+        params: List = []
+        if portfolios:
+            clauses.append(f"portfolio IN ({', '.join('?' for _ in portfolios)})")
+            params.extend(portfolios)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(until)
+        if currency:
+            clauses.append("currency = ?")
+            params.append(currency)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        sql = f"""
+            SELECT portfolio, period, currency, COUNT(*), MIN(total_value), AVG(total_value), MAX(total_value),
+                   MAX(last_value)
+            FROM (
+                SELECT portfolio, ts, currency, total_value, period,
+                       FIRST_VALUE(total_value) OVER (PARTITION BY portfolio, currency, period ORDER BY ts DESC, seq DESC) AS last_value
+                FROM (
+                    SELECT portfolio, ts, currency, seq, total_value,
+                           strftime('{period_format}', ts, 'unixepoch', 'localtime') AS period
+                    FROM valuations {where}
+                )
+            )
+            GROUP BY portfolio, currency, period
+            ORDER BY portfolio, currency, MIN(ts)
+        """
+        try:
+            rows = self._connection.execute(sql, params).fetchall()
+        except sqlite3.Error as ex:
+            raise CommandError(f"Failed to query portfolio history: {ex}") from ex
+
+        return [ValuationSummary(*row) for row in rows]
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.open()
+        return self._conn  # type: ignore
@@ -0,0 +1,246 @@
+import csv
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import yaml  # type: ignore
+
+from crypto_fetch.constants import CF_LOGGER
+from crypto_fetch.exceptions import CommandError
+
+logger = logging.getLogger(CF_LOGGER)
+
+HoldingRow = Tuple[str, float, Optional[str]]
+
+_CSV_SUFFIXES = {".csv"}
+_NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+_YAML_SUFFIXES = {".yaml", ".yml"}
+
+_TICKER_COLUMNS = ("ticker", "symbol", "asset")
+_AMOUNT_COLUMNS = ("amount", "quantity", "holding")
+_ACCOUNT_COLUMNS = ("account", "account_id")
+
+
+@dataclass
+class Holdings:
+    """Aggregated holdings read from a portfolio file."""
+
+    totals: Dict[str, float] = field(default_factory=dict)
+    by_account: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    rows: int = 0
+
+    def add(self, ticker: str, amount: float, account: Optional[str] = None, track_accounts: bool = False) -> None:
+        """
+        Adds a single holding row to the running totals.
+
+        :param ticker: The uppercase ticker.
+        :param amount: The amount held.
+        :param account: The account the row belongs to, if any.
+        :param track_accounts: Whether per-account totals should be kept.
+        """
+        self.totals[ticker] = self.totals.get(ticker, 0.0) + amount
+        if track_accounts:
+            account_totals = self.by_account.setdefault(account or "-", {})
+            account_totals[ticker] = account_totals.get(ticker, 0.0) + amount
+        self.rows += 1
+
+
+def read_holdings(path: Path, by_account: bool = False) -> Holdings:
+    """
+    Reads a portfolio file in a single pass, summing amounts per ticker (and per account if requested).
+    - csv: 'ticker,amount[,account]' (header optional)
+    - ndjson/jsonl: '{"ticker": ..., "amount": ..., "account": ...}' per line
+    - yaml/yml: 'TICKER: amount'
+    - anything else: 'TICKER amount [account]' per line ('TICKER: amount' is also accepted)
+
+    Files are not rejected for having the wrong suffix: a yaml/yml file that is not a valid mapping
+    is re-read in the txt format, and any other file that is not valid txt is re-read as YAML.
+
+    Only the aggregated totals are kept in memory, so file size does not affect memory usage.
+
+    :param path: Path to the portfolio file.
+    :param by_account: Whether per-account totals should be kept.
+    :return: The aggregated holdings.
+    :raises CommandError: If the file is empty or contains an invalid row.
+    """
+    suffix = path.suffix.lower()
+    logger.debug("Reading portfolio file: '%s' (format: '%s')", path, suffix or 'txt')
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if suffix in _CSV_SUFFIXES:
+            holdings = _aggregate(_iter_csv_rows(f), by_account)
+        elif suffix in _NDJSON_SUFFIXES:
+            holdings = _aggregate(_iter_ndjson_rows(f), by_account)
+        else:
+            is_yaml = suffix in _YAML_SUFFIXES
+            try:
+                holdings = _aggregate(_iter_yaml_rows(f) if is_yaml else _iter_txt_rows(f), by_account)
+            except CommandError as ex:
+                logger.debug("Portfolio file is not in the %s format (%s). Retrying as %s", "YAML" if is_yaml else "txt", ex, "txt" if is_yaml else "YAML")
+                f.seek(0)
+                try:
+                    holdings = _aggregate(_iter_txt_rows(f) if is_yaml else _iter_yaml_rows(f), by_account)
+                except CommandError:
+                    raise ex
+
+    if not holdings.totals:
+        raise CommandError("Portfolio file is empty")
+
+    logger.debug("Aggregated %s row(s) into %s distinct ticker(s)", holdings.rows, len(holdings.totals))
+    return holdings
+
+
+def _aggregate(rows: Iterable[HoldingRow], by_account: bool) -> Holdings:
+    """
+    Sums holding rows per ticker (and per account if requested).
+
+    :param rows: The (ticker, amount, account) rows.
+    :param by_account: Whether per-account totals should be kept.
+    :return: The aggregated holdings.
+    """
+    holdings = Holdings()
+    for ticker, amount, account in rows:
+        holdings.add(ticker, amount, account, by_account)
+    return holdings
+
+
+def _parse_amount(ticker: str, value: object) -> float:
+    """
+    Converts a raw amount value to a float.
+
+    :param ticker: The ticker the amount belongs to (used in error messages).
+    :param value: The raw amount.
+    :return: The amount as a float.
+    :raises CommandError: If the amount is not a number.
+    """
+    try:
+        return float(value)  # type: ignore
+    except (ValueError, TypeError):
+        raise CommandError(f"Invalid amount for '{ticker}': '{value}' is not a number")
+
+
+def _iter_yaml_rows(lines: Iterable[str]) -> Iterator[HoldingRow]:
+    """
+    Yields rows from a YAML mapping of 'TICKER: amount'.
+
+    :param lines: The open portfolio file.
+    :return: Iterator of (ticker, amount, account) rows.
+    :raises CommandError: If the file is not a YAML mapping.
+    """
+    try:
+        data = yaml.safe_load(lines)  # type: ignore
+    except yaml.YAMLError as ex:
+        raise CommandError(f"Portfolio file has YAML syntax errors: {ex}")
+
+    if data is None:
+        return
+    if not isinstance(data, dict):
+        raise CommandError("YAML portfolio file must be a mapping of 'TICKER: amount'")
+
+    for k, v in data.items():
+        ticker = str(k).strip().upper()
+        yield ticker, _parse_amount(ticker, v), None
+
+
+def _iter_csv_rows(lines: Iterable[str]) -> Iterator[HoldingRow]:
+    """
+    Yields rows from a CSV file. A header row naming the ticker/amount/account columns is optional.
+
+    :param lines: The open portfolio file.
+    :return: Iterator of (ticker, amount, account) rows.
+    :raises CommandError: If a row is malformed.
+    """
+    reader = csv.reader(lines)
+    ticker_idx, amount_idx, account_idx = 0, 1, 2
+    header_checked = False
+
+    for row in reader:
+        if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+            continue
+
+        if not header_checked:
+            header_checked = True
+            header = [c.strip().lower() for c in row]
+            if any(c in _TICKER_COLUMNS or c in _AMOUNT_COLUMNS for c in header):
+                ticker_idx = _find_column(header, _TICKER_COLUMNS, "ticker")
+                amount_idx = _find_column(header, _AMOUNT_COLUMNS, "amount")
+                account_idx = next((header.index(c) for c in _ACCOUNT_COLUMNS if c in header), -1)
+                continue
+
+        if len(row) <= max(ticker_idx, amount_idx):
+            raise CommandError(f"Invalid line {reader.line_num} in portfolio file: '{','.join(row)}'")
+
+        ticker = row[ticker_idx].strip().upper()
+        account = row[account_idx].strip() if 0 <= account_idx < len(row) else None
+        yield ticker, _parse_amount(ticker, row[amount_idx].strip()), account or None
+
+
+def _find_column(header: List[str], names: Tuple[str, ...], label: str) -> int:
+    """
+    Finds the index of the first matching column name in a CSV header.
+
+    :param header: The lowercased header row.
+    :param names: Accepted names for the column.
+    :param label: The column label (used in error messages).
+    :return: The column index.
+    :raises CommandError: If no matching column exists.
+    """
+    for name in names:
+        if name in header:
+            return header.index(name)
+    raise CommandError(f"Portfolio CSV header is missing a '{label}' column")
+
+
+def _iter_ndjson_rows(lines: Iterable[str]) -> Iterator[HoldingRow]:
+    """
+    Yields rows from a newline-delimited JSON file, one holding object per line.
+
+    :param lines: The open portfolio file.
+    :return: Iterator of (ticker, amount, account) rows.
+    :raises CommandError: If a line is not a valid holding object.
+    """
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as ex:
+            raise CommandError(f"Invalid JSON on line {line_num} of portfolio file: {ex}")
+
+        if not isinstance(record, dict):
+            raise CommandError(f"Invalid record on line {line_num} of portfolio file: expected an object")
+
+        ticker = next((record[c] for c in _TICKER_COLUMNS if c in record), None)
+        amount = next((record[c] for c in _AMOUNT_COLUMNS if c in record), None)
+        if ticker is None or amount is None:
+            raise CommandError(f"Record on line {line_num} of portfolio file is missing 'ticker' or 'amount'")
+
+        account = next((record[c] for c in _ACCOUNT_COLUMNS if c in record), None)
+        ticker = str(ticker).strip().upper()
+        yield ticker, _parse_amount(ticker, amount), str(account) if account is not None else None
+
+
+def _iter_txt_rows(lines: Iterable[str]) -> Iterator[HoldingRow]:
+    """
+    Yields rows from the plain-text format: 'TICKER amount [account]' per line.
+    Lines in the simple YAML form 'TICKER: amount' are accepted too.
+
+    :param lines: The open portfolio file.
+    :return: Iterator of (ticker, amount, account) rows.
+    :raises CommandError: If a line is malformed.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or line == "---":
+            continue
+
+        parts = line.split()
+        if len(parts) not in (2, 3):
+            raise CommandError(f"Invalid line in portfolio file: '{line}'")
+
+        ticker = parts[0].rstrip(":").upper()
+        account = parts[2] if len(parts) == 3 else None
+        yield ticker, _parse_amount(ticker, parts[1]), account
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import statistics
+from typing import Dict, List
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.constants import CF_LOGGER, CG_COIN_ID_MAP, CONSENSUS_MIN_OUTLIER_PRICES, PROVIDER_COINGECKO
+from crypto_fetch.exceptions import APIError
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+@dataclass
+class ConsensusQuote:
+    """The consensus price of a ticker across providers."""
+
+    ticker: str
+    prices: Dict[str, float]
+    median: float
+    mean: float
+    divergence: float
+    outliers: List[str] = field(default_factory=list)
+
+
+def fetch_consensus(clients: Dict[str, BaseAPIClient], tickers: List[str], currency_code: str,
+                    outlier_threshold: float) -> Dict[str, ConsensusQuote]:
+    """
+    Fetches quotes from every provider concurrently (so the latency is that of the slowest provider
+    rather than the sum) and combines them per ticker. Tickers are aligned on the uppercase symbol
+    each client returns; CoinGecko is only asked for tickers it has a coin id for. A provider that
+    fails is logged and left out.
+
+    :param clients: Map of provider name -> API client.
+    :param tickers: The uppercase tickers.
+    :param currency_code: The fiat currency code.
+    :param outlier_threshold: Percentage deviation from the median above which a provider's price is an outlier.
+    :return: Map of ticker -> consensus quote, for tickers priced by at least one provider.
+    :raises APIError: If every provider fails.
+    """
+    def fetch(client: BaseAPIClient) -> Dict[str, Dict[str, float]]:
+        requested = [t for t in tickers if t in CG_COIN_ID_MAP] if client.config.name == PROVIDER_COINGECKO else tickers
+        return client.fetch_multiple_price_data(",".join(requested), currency_code) if requested else {}
+
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        futures = {provider: executor.submit(fetch, client) for provider, client in clients.items()}
+
+    quotes: Dict[str, Dict[str, Dict[str, float]]] = {}
+    errors: List[str] = []
+    for provider, future in futures.items():
+        try:
+            quotes[provider] = future.result()
+        except APIError as ex:
+            logger.warning("Excluding %s from consensus: %s", provider, ex)
+            errors.append(f"{provider}: {ex}")
+    if not quotes:
+        raise APIError(f"All providers failed. {'; '.join(errors)}")
+
+    result: Dict[str, ConsensusQuote] = {}
+    for ticker in tickers:
+        prices = {p: data[ticker]["price"] for p, data in quotes.items() if data.get(ticker, {}).get("price", 0) > 0}
+        if prices:
+            result[ticker] = combine_prices(ticker, prices, outlier_threshold)
+    return result
+
+
+def combine_prices(ticker: str, prices: Dict[str, float], outlier_threshold: float) -> ConsensusQuote:
+    """
+    Combines the prices of a ticker from several providers. Outliers are only flagged when at least
+    CONSENSUS_MIN_OUTLIER_PRICES prices are available; otherwise only the divergence is reported.
+
+    :param ticker: The ticker.
+    :param prices: Map of provider name -> price (all > 0).
+    :param outlier_threshold: Percentage deviation from the median above which a provider's price is an outlier.
+    :return: The consensus quote. The divergence is the largest deviation from the median, in percent.
+    """
+    median = statistics.median(prices.values())
+    deviations = {provider: abs(price - median) / median * 100 for provider, price in prices.items()}
+    outliers = [provider for provider, deviation in deviations.items() if deviation > outlier_threshold] \
+        if len(prices) >= CONSENSUS_MIN_OUTLIER_PRICES else []
+    return ConsensusQuote(
+        ticker=ticker,
+        prices=prices,
+        median=median,
+        mean=statistics.fmean(prices.values()),
+        divergence=max(deviations.values()),
+        outliers=outliers,
+    )
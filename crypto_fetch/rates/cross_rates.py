@@ -0,0 +1,44 @@
+from typing import Any, Dict, List
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+
+def cross_rate(from_price: float, to_price: float) -> float:
+    """
+    Gets how many units of one cryptocurrency one unit of another is worth.
+
+    :param from_price: The fiat price of the source cryptocurrency.
+    :param to_price: The fiat price of the target cryptocurrency.
+    :return: The cross rate (0 if the target price is 0).
+    """
+    return from_price / to_price if to_price else 0.0
+
+
+def cross_rate_matrix(prices: List[float]) -> List[List[float]]:
+    """
+    Builds the N x N cross-rate matrix from a price vector in one outer division:
+    matrix[i][j] is how many units of asset j one unit of asset i is worth.
+
+    :param prices: The fiat prices of the assets (all in the same currency).
+    :return: The cross-rate matrix (cells for zero-priced assets are 0).
+    """
+    if np is not None:
+        vector = np.asarray(prices, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix: Any = np.divide.outer(vector, vector)
+        return np.where(np.isfinite(matrix), matrix, 0.0).tolist()
+    return [[cross_rate(p_from, p_to) for p_to in prices] for p_from in prices]
+
+
+def prices_from_quotes(data: Dict[str, Dict[str, float]], tickers: List[str]) -> List[float]:
+    """
+    Extracts the price vector for the given tickers from parsed quotes.
+
+    :param data: Map of ticker -> parsed quote fields.
+    :param tickers: The tickers, in matrix order.
+    :return: The prices (0 for tickers without a quote).
+    """
+    return [data.get(t, {}).get("price", 0.0) for t in tickers]
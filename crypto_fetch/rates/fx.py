@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Dict, List, Optional
+
+from crypto_fetch.api.api_client import BaseAPIClient
+from crypto_fetch.config.config import CONFIG_DIRECTORY_PATH, get_fx_base_currency, get_fx_rates_ttl
+from crypto_fetch.constants import CF_LOGGER, FX_CONVERTED_FIELDS
+from crypto_fetch.exceptions import APIError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+FX_RATES_CACHE_PATH: Path = CONFIG_DIRECTORY_PATH / "fx_rates.json"
+
+
+@dataclass
+class FXRateTable:
+    """Exchange rates from a base currency, as fetched from a provider."""
+
+    base: str
+    rates: Dict[str, float]
+    fetched_at: float
+
+    def is_fresh(self, ttl: int) -> bool:
+        """
+        Checks whether the rates are younger than the TTL.
+
+        :param ttl: The TTL in seconds.
+        :return: True if the rates are still fresh.
+        """
+        return time.time() - self.fetched_at < ttl
+
+    def covers(self, currency_codes: List[str]) -> bool:
+        """
+        Checks whether the table has a rate for every currency.
+
+        :param currency_codes: The currency codes.
+        :return: True if every currency has a rate.
+        """
+        return all(c == self.base or c in self.rates for c in currency_codes)
+
+
+class FXRateCache:
+    """On-disk cache of FX rate tables, one per (provider, base currency)."""
+
+    def __init__(self, path: Path = FX_RATES_CACHE_PATH):
+        """
+        :param path: Path to the cache file.
+        """
+        self.path = path
+
+    def get(self, provider: str, base: str) -> Optional[FXRateTable]:
+        """
+        Gets the cached rate table for a provider and base currency.
+
+        :param provider: The provider name.
+        :param base: The base currency code.
+        :return: The cached table, or None if there is none.
+        """
+        entry = self._load().get(f"{provider}:{base}")
+        if not entry:
+            return None
+        return FXRateTable(base, {k: float(v) for k, v in entry.get("rates", {}).items()}, float(entry.get("fetched_at", 0)))
+
+    def put(self, provider: str, table: FXRateTable) -> None:
+        """
+        Stores a rate table.
+
+        :param provider: The provider name.
+        :param table: The rate table.
+        """
+        data = self._load()
+        data[f"{provider}:{table.base}"] = {"rates": table.rates, "fetched_at": table.fetched_at}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as ex:
+            logger.warning("FX rates cache '%s' is unreadable (%s). Ignoring it", self.path, ex)
+            return {}
+
+
+class FXConverter:
+    """
+    Fetches crypto quotes once in a base currency and derives every other fiat locally from a
+    cached FX rate table, so an N-currency report costs at most two API calls.
+    """
+
+    def __init__(self, client: BaseAPIClient, base_currency: Optional[str] = None, ttl: Optional[int] = None,
+                 cache: Optional[FXRateCache] = None):
+        """
+        :param client: The API client used for quotes and FX rates.
+        :param base_currency: The currency quotes are fetched in (defaults to config).
+        :param ttl: How long FX rates stay fresh, in seconds (defaults to config).
+        :param cache: The FX rate cache (defaults to the on-disk cache).
+        """
+        self.client = client
+        self.base_currency = (base_currency or get_fx_base_currency()).upper()
+        self.ttl = ttl if ttl is not None else get_fx_rates_ttl()
+        self.cache = cache or FXRateCache()
+
+    def get_rates(self, currency_codes: List[str]) -> Dict[str, float]:
+        """
+        Gets rates from the base currency, refreshing the cached table if it is stale or incomplete.
+
+        :param currency_codes: The uppercase currency codes.
+        :return: Map of currency code -> rate from the base currency.
+        :raises APIError: If the rates cannot be fetched.
+        """
+        provider = self.client.config.name
+        table = self.cache.get(provider, self.base_currency)
+        if table is None or not table.is_fresh(self.ttl) or not table.covers(currency_codes):
+            wanted = sorted((set(currency_codes) | (set(table.rates) if table else set())) - {self.base_currency})
+            logger.debug("FX rates for '%s' are stale or incomplete. Fetching: %s", self.base_currency, wanted)
+            rates = self.client.fetch_fx_rates(self.base_currency, wanted) if wanted else {}
+            table = FXRateTable(self.base_currency, rates, time.time())
+            self.cache.put(provider, table)
+        else:
+            logger.debug("Using cached FX rates for '%s'", self.base_currency)
+
+        missing = [c for c in currency_codes if not table.covers([c])]
+        if missing:
+            raise APIError(f"No FX rate available from '{self.base_currency}' to: {', '.join(missing)}")
+
+        return {c: 1.0 if c == self.base_currency else table.rates[c] for c in currency_codes}
+
+    def fetch_multiple_price_data(self, tickers: str, currency_codes: List[str]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Fetches quotes for several tickers in several fiat currencies.
+
+        :param tickers: The list of cryptocurrency tickers as a str.
+        :param currency_codes: The uppercase fiat currency codes.
+        :return: Map of currency code -> (ticker -> parsed quote fields).
+        :raises APIError: If the quotes or rates cannot be fetched.
+        """
+        base_data = self.client.fetch_multiple_price_data(tickers, self.base_currency)
+        rates = self.get_rates(currency_codes)
+        return convert_quotes(base_data, rates)
+
+
+def convert_quotes(base_data: Dict[str, Dict[str, float]], rates: Dict[str, float]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Converts base-currency quotes into several currencies in a single outer product of the
+    (tickers x money fields) matrix with the rate vector. Percentage changes are carried over
+    from the base quotes unchanged.
+
+    :param base_data: Map of ticker -> parsed quote fields in the base currency.
+    :param rates: Map of currency code -> rate from the base currency.
+    :return: Map of currency code -> (ticker -> parsed quote fields).
+    """
+    tickers = list(base_data)
+    currencies = list(rates)
+    values = [[base_data[t].get(f, 0.0) for f in FX_CONVERTED_FIELDS] for t in tickers]
+
+    if np is not None:
+        converted = np.multiply.outer(np.array([rates[c] for c in currencies]), np.array(values).reshape(len(tickers), len(FX_CONVERTED_FIELDS))).tolist()
+    else:
+        converted = [[[v * rates[c] for v in row] for row in values] for c in currencies]
+
+    result: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for ci, currency in enumerate(currencies):
+        result[currency] = {}
+        for ti, ticker in enumerate(tickers):
+            quote = dict(base_data[ticker])
+            quote.update(zip(FX_CONVERTED_FIELDS, converted[ci][ti]))
+            result[currency][ticker] = quote
+    return result
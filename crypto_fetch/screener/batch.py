@@ -0,0 +1,100 @@
+import heapq
+import logging
+from typing import Any, Dict, List, Sequence
+
+from crypto_fetch.api.api_client import MarketEntry
+from crypto_fetch.constants import CF_LOGGER, SCREEN_FIELDS
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+
+class QuoteBatch:
+    """
+    A column-oriented batch of quotes: one column of values per field, with the entries kept
+    alongside so matching rows can be mapped back. Columns are NumPy float arrays when available.
+    """
+
+    def __init__(self, entries: List[MarketEntry], columns: Dict[str, Any]):
+        """
+        :param entries: The quotes, one per row.
+        :param columns: Map of field -> column of values for those rows.
+        """
+        self.entries = entries
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[MarketEntry], fields: Sequence[str] = SCREEN_FIELDS) -> "QuoteBatch":
+        """
+        Transposes row-oriented quotes into columns.
+
+        :param entries: The quotes, one per row.
+        :param fields: The fields to build columns for.
+        :return: The batch.
+        """
+        entries = list(entries)
+        columns: Dict[str, Any] = {}
+        for field in fields:
+            values = (entry.quote.get(field, 0.0) for entry in entries)
+            columns[field] = np.fromiter(values, dtype=float, count=len(entries)) if np is not None else list(values)
+        return cls(entries, columns)
+
+    def select(self, mask: Any) -> "QuoteBatch":
+        """
+        Gets the rows for which the mask is true.
+
+        :param mask: A column of booleans, one per row.
+        :return: A new batch with the selected rows.
+        """
+        if np is not None:
+            indices = np.flatnonzero(mask)
+            return QuoteBatch([self.entries[i] for i in indices], {f: column[indices] for f, column in self.columns.items()})
+
+        indices = [i for i, keep in enumerate(mask) if keep]
+        return QuoteBatch([self.entries[i] for i in indices], {f: [column[i] for i in indices] for f, column in self.columns.items()})
+
+    def concat(self, other: "QuoteBatch") -> "QuoteBatch":
+        """
+        Appends the rows of another batch with the same columns.
+
+        :param other: The batch to append.
+        :return: A new batch with the rows of both.
+        """
+        if np is not None:
+            columns = {f: np.concatenate([column, other.columns[f]]) for f, column in self.columns.items()}
+        else:
+            columns = {f: column + other.columns[f] for f, column in self.columns.items()}
+        return QuoteBatch(self.entries + other.entries, columns)
+
+
+def top_k(batch: QuoteBatch, field: str, k: int, ascending: bool = False) -> QuoteBatch:
+    """
+    Selects the k best rows of a batch by a field using partial selection (argpartition, or a
+    heap without NumPy), so only the selected rows are fully sorted.
+
+    :param batch: The batch to select from.
+    :param field: The field to rank by.
+    :param k: The number of rows to select.
+    :param ascending: Whether the smallest values rank first.
+    :return: A batch of the selected rows, best first.
+    """
+    n = len(batch)
+    k = max(0, min(k, n))
+    column = batch.columns[field]
+
+    if np is not None:
+        keys = column if ascending else -column
+        indices = np.argpartition(keys, k - 1)[:k] if 0 < k < n else np.arange(k)
+        indices = indices[np.argsort(keys[indices], kind="stable")]
+        return QuoteBatch([batch.entries[i] for i in indices], {f: c[indices] for f, c in batch.columns.items()})
+
+    select = heapq.nsmallest if ascending else heapq.nlargest
+    indices = select(k, range(n), key=column.__getitem__)
+    return QuoteBatch([batch.entries[i] for i in indices], {f: [c[i] for i in indices] for f, c in batch.columns.items()})
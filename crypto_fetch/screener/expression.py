@@ -0,0 +1,282 @@
+import logging
+import math
+import operator
+import re
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from crypto_fetch.constants import CF_LOGGER, SCREEN_FIELDS
+from crypto_fetch.exceptions import CommandError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+logger = logging.getLogger(CF_LOGGER)
+
+# A number must not run into an identifier, so '24h_change' is a field and '5k' / '1e9' are numbers
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>[0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?(?P<suffix>[kKmMbBtT%]?))(?![A-Za-z0-9_])
+      | (?P<name>[A-Za-z0-9_]+)
+      | (?P<op><=|>=|==|!=|<|>|\+|-|\*|/|\(|\))
+    )""", re.VERBOSE)
+_SUFFIX_MULTIPLIERS = {"": 1.0, "%": 1.0, "k": 1e3, "m": 1e6, "b": 1e9, "t": 1e12}
+_COMPARISONS: Dict[str, Callable] = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+}
+_ARITHMETIC: Dict[str, Callable] = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+_NUM = "number"
+_BOOL = "boolean"
+
+# A compiled node takes the columns and returns a column (or a scalar for constant sub-expressions)
+Node = Callable[[Dict[str, Any]], Any]
+
+
+class ScreenExpression:
+    """
+    A screening expression such as 'market_cap > 1e9 and 24h_change < -5', parsed and type-checked
+    once into a tree of closures. Evaluating it applies each operator to whole columns at a time
+    (NumPy arrays when available, plain lists otherwise) rather than looking fields up row by row.
+    """
+
+    def __init__(self, text: str):
+        """
+        :param text: The expression text.
+        :raises CommandError: If the expression is invalid.
+        """
+        self.text = text.strip()
+        self.fields: Set[str] = set()
+        self._tokens = _tokenize(self.text)
+        self._pos = 0
+
+        node, kind = self._parse_or()
+        if self._pos < len(self._tokens):
+            raise CommandError(f"Unexpected '{self._tokens[self._pos][1]}' in screen expression: '{self.text}'")
+        if kind != _BOOL:
+            raise CommandError(f"Screen expression must be a condition (e.g. 'price > 1'). Got: '{self.text}'")
+
+        self._predicate: Node = node
+        logger.debug("Compiled screen expression '%s' over field(s): %s", self.text, sorted(self.fields))
+
+    def evaluate(self, columns: Dict[str, Any], size: int) -> Any:
+        """
+        Evaluates the expression over a batch of columns.
+
+        :param columns: Map of field -> column of values (all columns the same length).
+        :param size: The number of rows in the batch.
+        :return: A column of booleans, one per row.
+        """
+        if np is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = self._predicate(columns)
+            return np.broadcast_to(np.asarray(result, dtype=bool), (size,))
+
+        result = self._predicate(columns)
+        return result if isinstance(result, list) else [bool(result)] * size
+
+    def _parse_or(self) -> Tuple[Node, str]:
+        left, kind = self._parse_and()
+        while self._accept("name", "or"):
+            right, right_kind = self._parse_and()
+            kind = _require(kind, right_kind, _BOOL, "or", self.text)
+            left = _binary(operator.or_, left, right)
+        return left, kind
+
+    def _parse_and(self) -> Tuple[Node, str]:
+        left, kind = self._parse_not()
+        while self._accept("name", "and"):
+            right, right_kind = self._parse_not()
+            kind = _require(kind, right_kind, _BOOL, "and", self.text)
+            left = _binary(operator.and_, left, right)
+        return left, kind
+
+    def _parse_not(self) -> Tuple[Node, str]:
+        if self._accept("name", "not"):
+            operand, kind = self._parse_not()
+            _require(kind, _BOOL, _BOOL, "not", self.text)
+            return _negate(operand), _BOOL
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> Tuple[Node, str]:
+        left, kind = self._parse_sum()
+        comparisons: List[Node] = []
+        # Chained comparisons ('1 < price < 10') expand to pairwise comparisons joined by 'and'
+        while self._peek("op") in _COMPARISONS:
+            op = self._tokens[self._pos][1]
+            self._pos += 1
+            right, right_kind = self._parse_sum()
+            _require(kind, right_kind, _NUM, op, self.text)
+            comparisons.append(_binary(_COMPARISONS[op], left, right))
+            left, kind = right, right_kind
+
+        if not comparisons:
+            return left, kind
+        node = comparisons[0]
+        for comparison in comparisons[1:]:
+            node = _binary(operator.and_, node, comparison)
+        return node, _BOOL
+
+    def _parse_sum(self) -> Tuple[Node, str]:
+        left, kind = self._parse_product()
+        while self._peek("op") in ("+", "-"):
+            op = self._tokens[self._pos][1]
+            self._pos += 1
+            right, right_kind = self._parse_product()
+            kind = _require(kind, right_kind, _NUM, op, self.text)
+            left = _binary(_ARITHMETIC[op], left, right)
+        return left, kind
+
+    def _parse_product(self) -> Tuple[Node, str]:
+        left, kind = self._parse_unary()
+        while self._peek("op") in ("*", "/"):
+            op = self._tokens[self._pos][1]
+            self._pos += 1
+            right, right_kind = self._parse_unary()
+            kind = _require(kind, right_kind, _NUM, op, self.text)
+            left = _binary(_divide if op == "/" else _ARITHMETIC[op], left, right)
+        return left, kind
+
+    def _parse_unary(self) -> Tuple[Node, str]:
+        if self._accept("op", "-"):
+            operand, kind = self._parse_unary()
+            _require(kind, _NUM, _NUM, "-", self.text)
+            return _binary(operator.mul, _constant(-1.0), operand), _NUM
+        return self._parse_atom()
+
+    def _parse_atom(self) -> Tuple[Node, str]:
+        if self._pos >= len(self._tokens):
+            raise CommandError(f"Unexpected end of screen expression: '{self.text}'")
+
+        kind, value = self._tokens[self._pos]
+        self._pos += 1
+        if kind == "number":
+            return _constant(value), _NUM
+        if kind == "op" and value == "(":
+            node, node_kind = self._parse_or()
+            if not self._accept("op", ")"):
+                raise CommandError(f"Missing ')' in screen expression: '{self.text}'")
+            return node, node_kind
+        if kind == "name":
+            field = value.lower()
+            if field not in SCREEN_FIELDS:
+                raise CommandError(f"Unknown field '{value}' in screen expression. Must be one of: {', '.join(SCREEN_FIELDS)}")
+            self.fields.add(field)
+            return (lambda columns: columns[field]), _NUM
+        raise CommandError(f"Unexpected '{value}' in screen expression: '{self.text}'")
+
+    def _peek(self, kind: str) -> Any:
+        if self._pos < len(self._tokens) and self._tokens[self._pos][0] == kind:
+            return self._tokens[self._pos][1]
+        return None
+
+    def _accept(self, kind: str, value: str) -> bool:
+        token = self._peek(kind)
+        if isinstance(token, str) and token.lower() == value:
+            self._pos += 1
+            return True
+        return False
+
+
+def _tokenize(text: str) -> List[Tuple[str, Any]]:
+    """
+    Splits an expression into (kind, value) tokens. Numbers are converted to floats with any
+    k/m/b/t suffix applied.
+
+    :param text: The expression text.
+    :return: The tokens.
+    :raises CommandError: If the expression contains an invalid character.
+    """
+    tokens: List[Tuple[str, Any]] = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_PATTERN.match(text, pos)
+        if not match:
+            raise CommandError(f"Invalid character '{text[pos:].strip()[:1]}' in screen expression: '{text}'")
+        if match.group("number"):
+            number = match.group("number")
+            suffix = match.group("suffix")
+            value = float(number[:len(number) - len(suffix)]) * _SUFFIX_MULTIPLIERS[suffix.lower()]
+            tokens.append(("number", value))
+        elif match.group("name"):
+            tokens.append(("name", match.group("name")))
+        else:
+            tokens.append(("op", match.group("op")))
+        pos = match.end()
+
+    if not tokens:
+        raise CommandError("Screen expression is empty")
+    return tokens
+
+
+def _require(left_kind: str, right_kind: str, expected: str, op: str, text: str) -> str:
+    """
+    Checks that both operands of an operator have the expected type.
+
+    :param left_kind: The type of the left operand.
+    :param right_kind: The type of the right operand.
+    :param expected: The type the operator expects.
+    :param op: The operator (for the error message).
+    :param text: The expression text (for the error message).
+    :return: The expected type.
+    :raises CommandError: If either operand has the wrong type.
+    """
+    if left_kind != expected or right_kind != expected:
+        raise CommandError(f"Operator '{op}' expects {expected} operands in screen expression: '{text}'")
+    return expected
+
+
+def _constant(value: float) -> Node:
+    """Builds a node for a numeric literal."""
+    return lambda columns: value
+
+
+def _binary(func: Callable, left: Node, right: Node) -> Node:
+    """
+    Builds a node applying a binary operator to two sub-expressions. NumPy applies the operator to
+    whole arrays; without NumPy the operator is mapped over the lists (scalars are broadcast).
+    """
+    if np is not None:
+        return lambda columns: func(left(columns), right(columns))
+
+    def apply(columns: Dict[str, Any]) -> Any:
+        a, b = left(columns), right(columns)
+        if isinstance(a, list) and isinstance(b, list):
+            return list(map(func, a, b))
+        if isinstance(a, list):
+            return [func(x, b) for x in a]
+        if isinstance(b, list):
+            return [func(a, y) for y in b]
+        return func(a, b)
+    return apply
+
+
+def _negate(operand: Node) -> Node:
+    """Builds a node for a logical 'not'."""
+    if np is not None:
+        return lambda columns: np.logical_not(operand(columns))
+
+    def apply(columns: Dict[str, Any]) -> Any:
+        value = operand(columns)
+        return [not v for v in value] if isinstance(value, list) else not value
+    return apply
+
+
+def _divide(a: Any, b: Any) -> Any:
+    """
+    Divides two columns, or a column and a scalar, with NumPy. Two scalars (a constant sub-expression
+    such as '1/0', or values mapped over lists without NumPy) are divided with _safe_divide, as plain
+    float division raises on a zero divisor.
+    """
+    if np is not None and not (isinstance(a, float) and isinstance(b, float)):
+        return operator.truediv(a, b)
+    return _safe_divide(a, b)
+
+
+def _safe_divide(a: float, b: float) -> float:
+    # Matches NumPy semantics: x/0 is +/-inf, 0/0 is nan (so any comparison with it is false)
+    if b:
+        return a / b
+    return math.copysign(math.inf, a) if a else math.nan
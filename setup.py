@@ -11,6 +11,12 @@ setup(
        'pyyaml>=6.0.3',
        'rich>=13.0.0'
     ],
+    extras_require={
+        'analytics': ['numpy>=1.24'],
+        'http2': ['httpx[http2]>=0.27'],
+        'brotli': ['brotli>=1.1'],
+        'export': ['pyarrow>=14'],
+    },
     entry_points={
         "console_scripts": [
             "crypto-fetch=crypto_fetch.command_parser:main",
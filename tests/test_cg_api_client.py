@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from crypto_fetch.api.api_client import APIConfig
+from crypto_fetch.api.cg_api_client import CoinGeckoAPIClient
+from crypto_fetch.api.quote_cache import QuoteCache
+from crypto_fetch.api.usage_ledger import UsageLedger
+from crypto_fetch.constants import CONFIG_DEFAULTS_API_TIMEOUT, PROVIDER_COINGECKO, PROVIDER_COINGECKO_PRICE_EP
+from crypto_fetch.history.series_cache import PriceSeriesCache
+from crypto_fetch.loadtest.stub_server import StubConfig, StubProviderServer
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[CoinGeckoAPIClient]:
+    with StubProviderServer(StubConfig()) as server:
+        config = APIConfig(
+            name=PROVIDER_COINGECKO,
+            base_url=server.get_base_url(PROVIDER_COINGECKO),
+            price_endpoint=PROVIDER_COINGECKO_PRICE_EP,
+            api_keys=[f"CG-{0:024d}"],
+            timeout=CONFIG_DEFAULTS_API_TIMEOUT,
+        )
+        client = CoinGeckoAPIClient(config, PriceSeriesCache(tmp_path / "history"), QuoteCache(tmp_path / "quotes.db"),
+                                    UsageLedger(tmp_path / "usage.db"))
+        yield client
+        client.close()
+
+
+def test_concurrent_calls_get_their_own_tickers(client: CoinGeckoAPIClient) -> None:
+    ticker_sets = ["BTC,ETH", "XRP,SOL,ADA", "DOGE"]
+
+    def fetch(tickers: str) -> List[str]:
+        mismatches = []
+        for _ in range(50):
+            data = client.fetch_multiple_price_data(tickers, "EUR")
+            if set(data) != set(tickers.split(",")) or any(quote["price"] <= 0 for quote in data.values()):
+                mismatches.append(f"{tickers} -> {data}")
+        return mismatches
+
+    with ThreadPoolExecutor(max_workers=len(ticker_sets)) as executor:
+        mismatches = [m for result in executor.map(fetch, ticker_sets) for m in result]
+
+    assert mismatches == []